@@ -0,0 +1,231 @@
+#!/usr/bin/env python
+"""
+Page Object Benchmarks
+----------------------
+Times public page-object operations against the local stand-in site and
+compares them with a committed baseline.
+
+Usage:
+    python -m benchmarks.run_benchmarks [options]
+
+Options:
+    --iterations N      Runs per operation (default: 20)
+    --threshold F       Allowed p50/p95 slowdown vs. baseline, e.g. 0.25 = 25% (default: 0.25)
+    --only NAME         Run only operations whose name contains NAME (repeatable)
+    --baseline PATH     Baseline JSON (default: benchmarks/baseline.json)
+    --update-baseline   Write the results as the new baseline instead of comparing
+    --output PATH       Where to write this run's results (default: reports/benchmarks.json)
+    --headed            Show the browser window
+"""
+
+import argparse
+import json
+import math
+import os
+import sys
+import time
+
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+
+from local_site import LocalSite
+from pages.BasePage import BasePage
+from pages.LoginPage import LoginPage
+from pages.ProfilePage import ProfilePage
+from test_data.login_data import LoginData
+from test_data.profile_data import ProfileData
+from test_data.urls import SiteUrls
+from utils.command_metrics import CommandRecorder
+from utils.driver_factory import create_driver
+
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), "baseline.json")
+IMAGE_PATH = os.path.join(os.path.dirname(__file__), "..", ProfileData.IMAGE_PATH)
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='Benchmark page-object operations')
+    parser.add_argument('--iterations', type=int, default=20, help='Runs per operation')
+    parser.add_argument('--threshold', type=float, default=0.25, help='Allowed slowdown vs. baseline (0.25 = 25%%)')
+    parser.add_argument('--only', action='append', default=[], help='Run only operations whose name contains this')
+    parser.add_argument('--baseline', default=BASELINE_PATH, help='Baseline JSON file')
+    parser.add_argument('--update-baseline', action='store_true', help='Write results as the new baseline')
+    parser.add_argument('--output', default='reports/benchmarks.json', help='Results JSON file')
+    parser.add_argument('--headed', action='store_true', help='Show the browser window')
+    return parser.parse_args()
+
+def percentile(samples, pct):
+    """Nearest-rank percentile of a list of samples"""
+    ordered = sorted(samples)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+class Benchmark:
+    """Runs operations against one browser and local site and collects timings"""
+
+    def __init__(self, driver, urls, recorder):
+        self.driver = driver
+        self.urls = urls
+        self.recorder = recorder
+        self.logged_in = False
+
+    def login(self):
+        """Make sure the browser holds a logged-in session"""
+        if self.logged_in:
+            return
+        self.driver.get(self.urls.login)
+        LoginPage(self.driver).login(
+            LoginData.VALID_CREDENTIALS["email"],
+            LoginData.VALID_CREDENTIALS["password"]
+        )
+        WebDriverWait(self.driver, 10).until(EC.url_to_be(self.urls.pathfinder))
+        self.logged_in = True
+
+    def open_profile(self):
+        self.login()
+        self.driver.get(self.urls.profile)
+        page = ProfilePage(self.driver, save_api=self.urls.profile_save_api)
+        assert page.is_profile_page_loaded(), "Profile page failed to load"
+        return page
+
+    def open_login(self):
+        self.driver.delete_all_cookies()
+        self.logged_in = False
+        self.driver.get(self.urls.login)
+        return LoginPage(self.driver)
+
+    def measure(self, name, prepare, operation, iterations):
+        """
+        Time ``operation(prepared)`` after ``prepare()`` for each iteration
+        :return: dict with p50/p95/p99 seconds and median WebDriver command count
+        """
+        durations = []
+        commands = []
+        for _ in range(iterations):
+            prepared = prepare()
+            self.recorder.start_test(name)
+            start = time.perf_counter()
+            result = operation(prepared)
+            durations.append(time.perf_counter() - start)
+            commands.append(self.recorder.summary()["total"]["count"])
+            if result is False:
+                raise AssertionError(f"{name} reported failure")
+        return {
+            "iterations": iterations,
+            "p50": round(percentile(durations, 50), 4),
+            "p95": round(percentile(durations, 95), 4),
+            "p99": round(percentile(durations, 99), 4),
+            "commands": percentile(commands, 50),
+        }
+
+def operations(bench):
+    """Name -> (prepare, operation) for every benchmarked page-object method"""
+    credentials = LoginData.VALID_CREDENTIALS
+
+    def login(page):
+        page.login(credentials["email"], credentials["password"])
+        WebDriverWait(bench.driver, 10).until(EC.url_to_be(bench.urls.pathfinder))
+        bench.logged_in = True
+
+    return {
+        "LoginPage.login": (bench.open_login, login),
+        "LoginPage.is_login_page_displayed": (bench.open_login, lambda page: page.is_login_page_displayed()),
+        "ProfilePage.change_username": (
+            bench.open_profile, lambda page: page.change_username("Bench", "Mark")),
+        "ProfilePage.upload_profile_image": (
+            bench.open_profile, lambda page: page.upload_profile_image(IMAGE_PATH)),
+        "ProfilePage.change_profile_url": (
+            bench.open_profile, lambda page: page.change_profile_url(ProfileData.NEW_URL)),
+        "BasePage.find_element": (
+            bench.open_profile, lambda page: page.find_element(ProfilePage.FIRST_NAME_INPUT)),
+        "BasePage.click_element": (
+            bench.open_profile, lambda page: page.click_element(ProfilePage.SAVE_ACCOUNT_BTN)),
+        "BasePage.input_text": (
+            bench.open_profile, lambda page: page.input_text(ProfilePage.FIRST_NAME_INPUT, "Benchmark")),
+        "BasePage.get_attribute": (
+            bench.open_profile, lambda page: page.get_attribute(ProfilePage.URL_INPUT, "value")),
+        "BasePage.is_element_visible": (
+            bench.open_profile, lambda page: page.is_element_visible(ProfilePage.FIRST_NAME_INPUT)),
+        "BasePage.read_elements": (
+            bench.open_profile, lambda page: page.read_elements({
+                "first_name": ProfilePage.FIRST_NAME_INPUT,
+                "last_name": ProfilePage.LAST_NAME_INPUT,
+                "url": ProfilePage.URL_INPUT,
+            })),
+        "BasePage.refresh_and_wait_element": (
+            bench.open_profile, lambda page: page.refresh_and_wait_element(ProfilePage.FIRST_NAME_INPUT)),
+    }
+
+def compare(results, baseline, threshold):
+    """
+    Compare results with the baseline
+    :return: list of regression messages
+    """
+    regressions = []
+    for name, result in results.items():
+        reference = baseline.get(name)
+        if reference is None:
+            regressions.append(f"{name}: no baseline entry (record one with --update-baseline)")
+            continue
+        for stat in ("p50", "p95"):
+            limit = reference[stat] * (1 + threshold)
+            if result[stat] > limit:
+                regressions.append(
+                    f"{name}: {stat} {result[stat] * 1000:.1f}ms > {limit * 1000:.1f}ms "
+                    f"(baseline {reference[stat] * 1000:.1f}ms)"
+                )
+        if result["commands"] > reference["commands"]:
+            regressions.append(
+                f"{name}: {result['commands']} WebDriver commands (baseline {reference['commands']})"
+            )
+    return regressions
+
+def main():
+    args = parse_args()
+    os.makedirs(os.path.dirname(args.output) or ".", exist_ok=True)
+
+    results = {}
+    with LocalSite(seed=0) as site:
+        urls = SiteUrls(site.base_url)
+        # The lean profile has a fixed viewport, so layout is identical between runs
+        driver = create_driver(profile="lean", headless=not args.headed,
+                               capture_network=bool(urls.profile_save_api))
+        try:
+            recorder = CommandRecorder()
+            recorder.attach(driver)
+            bench = Benchmark(driver, urls, recorder)
+            for name, (prepare, operation) in operations(bench).items():
+                if args.only and not any(part in name for part in args.only):
+                    continue
+                results[name] = bench.measure(name, prepare, operation, args.iterations)
+                r = results[name]
+                print(f"{name:40} p50 {r['p50'] * 1000:8.1f}ms  p95 {r['p95'] * 1000:8.1f}ms  "
+                      f"p99 {r['p99'] * 1000:8.1f}ms  commands {r['commands']}")
+        finally:
+            driver.quit()
+
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump({"static_waits": BasePage.STATIC_WAITS, "operations": results}, f, indent=2)
+    print(f"\nResults written to: {os.path.abspath(args.output)}")
+
+    with open(args.baseline, encoding="utf-8") as f:
+        baseline = json.load(f)
+
+    if args.update_baseline:
+        baseline["operations"].update(results)
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(baseline, f, indent=2)
+            f.write("\n")
+        print(f"Baseline updated: {os.path.abspath(args.baseline)}")
+        return 0
+
+    print("\nComparing with baseline:")
+    regressions = compare(results, baseline["operations"], args.threshold)
+    if regressions:
+        print("\nRegressions detected:")
+        for message in regressions:
+            print(f"  - {message}")
+        return 1
+    print("No regressions")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,11 +1,113 @@
 import os
+import html
 import pytest
 from pytest_html import extras
 from datetime import datetime
+from functools import partial
+from pages.BasePage import BasePage
+from utils.driver_pool import DriverPool
+from utils import driver_factory
+from utils.browser_daemon import DaemonClient
+from utils.network_capture import NetworkCapture
+from utils.auth_state import AuthStateCache
+from utils.profile_api import ProfileApi
+from utils import command_metrics
+from utils import step_logger
+from utils.duration_store import DurationStore, lpt_schedule, strip_xdist_group
+from utils.screenshot_writer import ScreenshotWriter
+from utils.stream_report import THUMBNAIL_WIDTH, StreamingReport
+from test_data.urls import SiteUrls
+from test_data.account_pool import AccountLeaseManager
 
 # Create directory for screenshots if it doesn't exist
 os.makedirs("reports/screenshots", exist_ok=True)
 
+# Per-test WebDriver command summaries collected when --command-metrics is used
+COMMAND_METRICS_JSON = "reports/command_metrics.json"
+COMMAND_METRICS_OPENMETRICS = "reports/command_metrics.prom"
+command_summaries = {}
+
+# Duration and outcome of every test in this run, saved for scheduling later runs
+test_durations = {}
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--static-waits", action="store_true", default=False,
+        help="Use the fixed sleeps in page objects instead of waiting for the page to settle"
+    )
+    parser.addoption(
+        "--polling-waits", action="store_true", default=False,
+        help="Poll expected conditions with WebDriverWait instead of evaluating them in the page"
+    )
+    parser.addoption(
+        "--fast-input", action="store_true", default=False,
+        help="Set input values with one script call instead of typing them key by key"
+    )
+    parser.addoption(
+        "--cache-elements", action="store_true", default=False,
+        help="Reuse element handles in page objects until the DOM changes"
+    )
+    parser.addoption(
+        "--browser-profile", choices=driver_factory.PROFILES, default="full",
+        help="full: headed, maximized Chrome; lean: headless, fixed viewport, ads/analytics/fonts blocked"
+    )
+    parser.addoption(
+        "--block-images", action="store_true", default=False,
+        help="Block image requests, except in tests marked needs_images"
+    )
+    parser.addoption(
+        "--browser-contexts", action="store_true", default=False,
+        help="Give each test a fresh browser context in the worker's Chrome instead of resetting the browser"
+    )
+    parser.addoption(
+        "--browser-daemon", default=None, metavar="ADDRESS",
+        help="Lease warm browsers from a running browser daemon (python -m utils.browser_daemon)"
+    )
+    parser.addoption(
+        "--no-driver-reuse", action="store_true", default=False,
+        help="Start a new browser for every test instead of reusing pooled drivers"
+    )
+    parser.addoption(
+        "--no-auth-cache", action="store_true", default=False,
+        help="Always log in through the UI instead of reusing a cached session"
+    )
+    parser.addoption(
+        "--auth-cache-ttl", type=int, default=1800,
+        help="Seconds a cached login session is reused (default: 1800)"
+    )
+    parser.addoption(
+        "--base-url", default=None,
+        help="Run against another host, e.g. a local stand-in at http://127.0.0.1:8000"
+    )
+    parser.addoption(
+        "--profile-save-api", default=None, metavar="REGEX",
+        help="URL pattern of the request that saves profile changes; saves are verified from its response"
+    )
+    parser.addoption(
+        "--local-site", action="store_true", default=False,
+        help="Start the local W3Schools stand-in site and run against it"
+    )
+    parser.addoption(
+        "--lpt-schedule", action="store_true", default=False,
+        help="With pytest-xdist and --dist loadgroup, assign tests to workers longest first using recorded durations"
+    )
+    parser.addoption(
+        "--stream-report", default=None, metavar="PATH",
+        help="Write an HTML report incrementally as tests finish, with screenshots as external assets"
+    )
+    parser.addoption(
+        "--screenshot-max-width", type=int, default=None,
+        help="Downscale failure screenshots wider than this many pixels before saving (needs Pillow)"
+    )
+    parser.addoption(
+        "--verbose-steps", action="store_true", default=False,
+        help="Stream page-object step logs live instead of only attaching them to failed tests"
+    )
+    parser.addoption(
+        "--command-metrics", action="store_true", default=False,
+        help="Record timing for every WebDriver command and report it per test"
+    )
+
 def pytest_configure(config):
     # Add markers
     config.addinivalue_line(
@@ -19,10 +121,159 @@ def pytest_configure(config):
     config.addinivalue_line(
         "markers", "flaky: mark test as flaky, will be retried on failure"
     )
+    config.addinivalue_line(
+        "markers", "needs_images: test checks images, never block them"
+    )
+    
+    # Page-object steps are buffered and only written out for failed tests,
+    # unless live logging is requested with --verbose-steps
+    if config.getoption("--verbose-steps"):
+        step_logger.set_passthrough(True)
+        config.option.log_cli = True
+        config.option.log_cli_level = "INFO"
+    
+    # Page interaction timing
+    BasePage.STATIC_WAITS = config.getoption("--static-waits")
+    BasePage.CACHE_ELEMENTS = config.getoption("--cache-elements")
+    BasePage.IN_PAGE_WAITS = not config.getoption("--polling-waits")
+    BasePage.FAST_INPUT = config.getoption("--fast-input")
+    
+    # Failure screenshots are written in the background and drained at session end
+    config.screenshot_writer = ScreenshotWriter(max_width=config.getoption("--screenshot-max-width"))
+    
+    # Streaming HTML report (written by the controller only under xdist)
+    stream_report_path = config.getoption("--stream-report")
+    if stream_report_path and not hasattr(config, "workerinput"):
+        os.makedirs(os.path.dirname(os.path.abspath(stream_report_path)), exist_ok=True)
+        config.pluginmanager.register(
+            StreamingReport(stream_report_path, title="W3Schools Automation Test Report"), "stream_report"
+        )
+    
+    # WebDriver command instrumentation
+    config.command_recorder = None
+    if config.getoption("--command-metrics"):
+        config.command_recorder = command_metrics.CommandRecorder()
+
+@pytest.fixture(scope="session")
+def site_urls(request):
+    """URLs of the site under test (live W3Schools unless --base-url/--local-site is given)"""
+    profile_save_api = request.config.getoption("--profile-save-api")
+    if request.config.getoption("--local-site"):
+        from local_site import LocalSite
+        with LocalSite() as site:
+            yield SiteUrls(site.base_url, profile_save_api)
+    else:
+        yield SiteUrls(request.config.getoption("--base-url"), profile_save_api)
+
+@pytest.fixture(scope="session")
+def driver_pool(request, site_urls):
+    """One pool of warm browsers per session (per worker under xdist)"""
+    daemon_address = request.config.getoption("--browser-daemon")
+    attach_driver = None
+    if daemon_address:
+        # The daemon's browsers outlive the run; quitting hands them back
+        create_driver = partial(
+            DaemonClient(daemon_address).attach,
+            block_images=request.config.getoption("--block-images")
+        )
+    else:
+        create_driver = partial(
+            driver_factory.create_driver,
+            profile=request.config.getoption("--browser-profile"),
+            block_images=request.config.getoption("--block-images"),
+            # The performance log is only read to verify profile saves
+            capture_network=bool(site_urls.profile_save_api)
+        )
+        # With contexts, a second concurrent lease opens a context in the running Chrome
+        attach_driver = driver_factory.attach_driver
+    pool = DriverPool(
+        create_driver,
+        origins=site_urls.origins,
+        reuse=not request.config.getoption("--no-driver-reuse"),
+        on_reset=driver_factory.apply_network_profile,
+        contexts=request.config.getoption("--browser-contexts"),
+        attach_driver=attach_driver
+    )
+    yield pool
+    pool.close()
+
+def lease_driver(request, driver_pool):
+    """
+    Lease a clean driver from the pool, set up for the requesting test or class
+    :return: generator to yield from a fixture; releases the driver afterwards
+    """
+    driver = driver_pool.acquire()
+    if request.config.command_recorder:
+        request.config.command_recorder.attach(driver)
+    if request.config.getoption("--block-images"):
+        driver_factory.set_images_blocked(driver, not request.node.get_closest_marker("needs_images"))
+    # Drop network events left over from the previous test so the log does not grow all session
+    NetworkCapture.for_driver(driver).clear()
+    yield driver
+    driver_pool.release(driver)
+
+@pytest.fixture(scope="function")
+def driver(request, driver_pool):
+    """Lease a clean driver from the pool for a single test"""
+    yield from lease_driver(request, driver_pool)
+
+@pytest.fixture(scope="class")
+def class_driver(request, driver_pool):
+    """Lease a clean driver shared by all tests of a class, e.g. for one page load reused between cases"""
+    yield from lease_driver(request, driver_pool)
+
+@pytest.fixture(scope="session")
+def account():
+    """
+    Credentials leased exclusively to this session (one xdist worker) so
+    tests that mutate the account never run against it concurrently
+    """
+    lease = AccountLeaseManager().acquire()
+    yield lease.credentials
+    lease.release()
+
+@pytest.fixture(scope="session")
+def auth_cache(request):
+    """Cached logged-in browser state, or None when disabled"""
+    if request.config.getoption("--no-auth-cache"):
+        return None
+    return AuthStateCache(ttl=request.config.getoption("--auth-cache-ttl"))
+
+@pytest.fixture(scope="session")
+def profile_api(site_urls):
+    """
+    HTTP client for the profile API; call use_driver_session(driver) once logged in.
+    None when the site under test has no known API (the live site)
+    """
+    if site_urls.profile_api is None:
+        yield None
+        return
+    api = ProfileApi(site_urls.profile_api)
+    yield api
+    api.close()
+
+def schedule_unit(item):
+    """Tests of one class are scheduled together so class-scoped fixtures are set up once"""
+    return item.parent.nodeid if item.cls is not None else item.nodeid
+
+# Must run before xdist's own hook, which turns xdist_group markers into "@group" nodeid suffixes
+@pytest.hookimpl(tryfirst=True)
+def pytest_collection_modifyitems(config, items):
+    # Only xdist workers know the worker count; the controller does not collect
+    workerinput = getattr(config, "workerinput", None)
+    if not config.getoption("--lpt-schedule") or workerinput is None:
+        return
     
-    # Logging configuration
-    config.option.log_cli = True
-    config.option.log_cli_level = "INFO"
+    estimates = DurationStore().estimates([item.nodeid for item in items])
+    units = {}
+    for item in items:
+        unit = schedule_unit(item)
+        units[unit] = units.get(unit, 0.0) + estimates[item.nodeid]
+    bins = lpt_schedule(units, workerinput["workercount"])
+    groups = {unit: index for index, unit_ids in enumerate(bins) for unit in unit_ids}
+    # Collection order is kept so class-scoped fixtures are not torn down between tests
+    for item in items:
+        item.add_marker(pytest.mark.xdist_group(name=f"lpt{groups[schedule_unit(item)]}"))
 
 def pytest_html_report_title(report):
     report.title = "W3Schools Automation Test Report"
@@ -55,20 +306,37 @@ def pytest_html_results_table_row(report, cells):
                 screenshot_cell = "<td>Screenshot available</td>"
                 break
     
-    # If test failed but no screenshot in extras, check for files in the directory
+    # If test failed but no screenshot in extras, use the path recorded at capture time
     if report.failed and not screenshot_name:
-        test_id = getattr(report, "nodeid", "").replace("::", "_").replace("/", "_").replace(".", "_")
-        if test_id:
-            import glob
-            screenshot_files = glob.glob(f"reports/screenshots/*{test_id}*.png")
-            if screenshot_files:
-                newest_file = max(screenshot_files, key=os.path.getctime)
-                filename = os.path.basename(newest_file)
-                screenshot_cell = f"<td>{filename}</td>"
+        screenshot_path = getattr(report, "screenshot_path", None)
+        if screenshot_path:
+            screenshot_cell = f"<td>{os.path.basename(screenshot_path)}</td>"
     
     cells.insert(3, screenshot_cell)
     cells.pop()
 
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_setup(item):
+    step_logger.clear()
+    if item.config.command_recorder:
+        item.config.command_recorder.start_test(item.nodeid)
+
+def pytest_runtest_logreport(report):
+    # Runs on the xdist controller too, so metrics from all workers end up here
+    metrics = getattr(report, "command_metrics", None)
+    if metrics:
+        command_summaries[report.nodeid] = metrics
+    
+    # Sum setup, call and teardown; a rerun starts the test over
+    nodeid = strip_xdist_group(report.nodeid)
+    duration, outcome = test_durations.get(nodeid, (0.0, "passed"))
+    if report.when == "setup":
+        duration, outcome = 0.0, "passed"
+    duration += report.duration
+    if report.failed or (report.skipped and outcome == "passed"):
+        outcome = report.outcome
+    test_durations[nodeid] = (duration, outcome)
+
 @pytest.hookimpl(optionalhook=True)
 def pytest_html_results_summary(prefix, summary, postfix):
     prefix.extend([
@@ -81,6 +349,36 @@ def pytest_html_results_summary(prefix, summary, postfix):
         "<p><b>Note:</b> Screenshots are automatically captured for failed tests and named with test name and timestamp.</p>",
         "<p><b>Screenshot Format:</b> <code>testname_YYYYMMDD_HHMMSS.png</code></p>"
     ])
+    
+    if command_summaries:
+        commands = command_metrics.merge_totals(command_summaries.values(), "commands")
+        locators = command_metrics.merge_totals(command_summaries.values(), "locators")
+        hottest = sorted(locators.items(), key=lambda item: item[1]["total_seconds"], reverse=True)[:10]
+        total = {
+            "count": sum(stats["count"] for stats in commands.values()),
+            "wait_polls": sum(stats["wait_polls"] for stats in commands.values()),
+            "total_seconds": sum(stats["total_seconds"] for stats in commands.values()),
+        }
+        postfix.extend([
+            "<h2>WebDriver Commands</h2>",
+            command_metrics.summary_table_html({"commands": commands, "total": total}),
+            "<h3>Slowest Locators</h3>",
+            "<table><tr><th>Locator</th><th>Commands</th><th>Wait polls</th><th>Total (ms)</th></tr>"
+            + "".join(
+                f"<tr><td><code>{html.escape(name)}</code></td><td>{stats['count']}</td>"
+                f"<td>{stats['wait_polls']}</td><td>{stats['total_seconds'] * 1000:.1f}</td></tr>"
+                for name, stats in hottest
+            )
+            + "</table>",
+            f"<p><b>Command Metrics:</b> {os.path.abspath(COMMAND_METRICS_JSON)}</p>",
+        ])
+
+def screenshot_link(config, path):
+    """Link to a screenshot file, relative to the pytest-html report when there is one"""
+    report_path = config.getoption("htmlpath", None)
+    if report_path:
+        return os.path.relpath(os.path.abspath(path), os.path.dirname(os.path.abspath(report_path))).replace(os.sep, "/")
+    return os.path.abspath(path)
 
 @pytest.hookimpl(hookwrapper=True)
 def pytest_runtest_makereport(item, call):
@@ -125,23 +423,33 @@ def pytest_runtest_makereport(item, call):
                 test_name = item.name
                 # Create a clean filename without special characters
                 clean_test_name = ''.join(c if c.isalnum() else '_' for c in test_name)
-                # Save screenshot to disk
-                screenshot_path = f"reports/screenshots/{clean_test_name}_{timestamp}.png"
+                screenshot_name = f"{clean_test_name}_{timestamp}"
                 
                 try:
-                    print(f"Attempting to save screenshot to: {screenshot_path}")
-                    driver.save_screenshot(screenshot_path)
-                    print(f"Screenshot saved successfully to: {screenshot_path}")
-                    
-                    # Add screenshot to report with meaningful name
+                    # Capture once; the background writer decodes it to disk
                     screenshot = driver.get_screenshot_as_base64()
-                    screenshot_name = f"{clean_test_name}_{timestamp}"
-                    extras_list.append(extras.image(screenshot, screenshot_name))
+                    stream_report = item.config.getoption("--stream-report")
+                    screenshot_path = item.config.screenshot_writer.submit(
+                        screenshot, screenshot_name, thumbnail_width=None if stream_report else THUMBNAIL_WIDTH
+                    )
+                    print(f"Screenshot queued for: {screenshot_path}")
+                    # The report row looks the screenshot up here instead of scanning the directory
+                    report.screenshot_path = screenshot_path
+                    if stream_report:
+                        # The streaming report stores it as an asset and then drops it from the report
+                        extras_list.append(extras.image(screenshot, screenshot_name))
+                    else:
+                        # Reports live until the session ends; only link the files the writer produces
+                        thumbnail_path = item.config.screenshot_writer.thumbnail_path(screenshot_path)
+                        extras_list.append(extras.image(screenshot_link(item.config, thumbnail_path), screenshot_name))
+                        extras_list.append(extras.url(screenshot_link(item.config, screenshot_path), "Screenshot"))
                     
                     # Add additional debug information
                     try:
-                        page_source = driver.page_source
-                        extras_list.append(extras.text(page_source[:5000], "Page Source (truncated)"))
+                        page_source = driver.execute_script(
+                            "return document.documentElement.outerHTML.slice(0, 5000)"
+                        )
+                        extras_list.append(extras.text(page_source, "Page Source (truncated)"))
                     except:
                         print("Could not get page source")
                         
@@ -162,6 +470,22 @@ def pytest_runtest_makereport(item, call):
             extras_list.append(extras.text("Login Test", "Test Category"))
         elif "profile" in item.keywords:
             extras_list.append(extras.text("Profile Test", "Test Category"))
+        
+        # Add WebDriver command counts for setup and call
+        if item.config.command_recorder:
+            report.command_metrics = item.config.command_recorder.summary()
+            extras_list.append(extras.html(command_metrics.summary_table_html(report.command_metrics)))
+    
+    elif report.when == "teardown" and item.config.command_recorder:
+        # Replaces the call summary so teardown commands are counted as well
+        report.command_metrics = item.config.command_recorder.summary()
+    
+    # Write out the buffered page-object steps only when something failed
+    if report.failed:
+        steps = step_logger.dump()
+        if steps:
+            report.sections.append(("Page object steps", steps))
+            extras_list.append(extras.text(steps, "Page Object Steps"))
     
     # Ensure this line is executed at the end of the function to correctly set report.extras
     report.extras = extras_list
@@ -171,6 +495,8 @@ def pytest_sessionfinish(session, exitstatus):
     """
     Report test summary when session finishes
     """
+    session.config.screenshot_writer.drain()
+    
     print("\n" + "=" * 30 + " Test Summary " + "=" * 30)
     print(f"Total test count: {session.testscollected}")
     print(f"Passed tests: {session.testscollected - session.testsfailed}")
@@ -181,5 +507,23 @@ def pytest_sessionfinish(session, exitstatus):
         print(f"\nScreenshots available at: {os.path.abspath('reports/screenshots')}")
         
     print("=" * 73 + "\n")
+    
+    # Only the controller writes durations and metrics when running under xdist
+    if hasattr(session.config, "workerinput"):
+        return
+    
+    if test_durations:
+        try:
+            DurationStore().record(
+                (nodeid, duration, outcome) for nodeid, (duration, outcome) in test_durations.items()
+            )
+        except Exception as e:
+            print(f"Could not save test durations: {e}")
+    
+    if command_summaries:
+        summaries = list(command_summaries.values())
+        command_metrics.write_json(summaries, COMMAND_METRICS_JSON)
+        command_metrics.write_openmetrics(summaries, COMMAND_METRICS_OPENMETRICS)
+        print(f"WebDriver command metrics written to: {os.path.abspath(COMMAND_METRICS_JSON)}")
 
     
\ No newline at end of file
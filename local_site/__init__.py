@@ -0,0 +1,3 @@
+from .server import LocalSite
+
+__all__ = ["LocalSite"]
@@ -0,0 +1,40 @@
+"""
+Run the local W3Schools stand-in site
+-------------------------------------
+Usage:
+    python -m local_site [--port 8000] [--latency 0.05] [--error-rate 0.1] [--upload-limit 3]
+
+Then point the tests at it:
+    python run_tests.py --base-url http://127.0.0.1:8000
+"""
+
+import argparse
+import logging
+
+from local_site import LocalSite
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='Run the local W3Schools stand-in site')
+    parser.add_argument('--host', default='127.0.0.1', help='Interface to listen on')
+    parser.add_argument('--port', type=int, default=8000, help='Port to listen on')
+    parser.add_argument('--latency', type=float, default=0.0, help='Seconds added to every response')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='Fraction of API requests that fail with HTTP 500')
+    parser.add_argument('--upload-limit', type=int, default=None, help='Image uploads allowed per account')
+    parser.add_argument('--seed', type=int, default=None, help='Seed for error injection')
+    return parser.parse_args()
+
+def main():
+    args = parse_args()
+    logging.basicConfig(level=logging.INFO)
+    site = LocalSite(args.host, args.port, latency=args.latency, error_rate=args.error_rate,
+                     upload_limit=args.upload_limit, seed=args.seed)
+    print(f"Serving W3Schools stand-in at {site.base_url} (Ctrl+C to stop)")
+    try:
+        site.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        site.httpd.server_close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,249 @@
+import html
+import json
+import logging
+import os
+import random
+import secrets
+import threading
+import time
+from http.cookies import SimpleCookie
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+from test_data.login_data import LoginData
+
+logger = logging.getLogger(__name__)
+
+TEMPLATE_DIR = os.path.join(os.path.dirname(__file__), "templates")
+SESSION_COOKIE = "w3s_session"
+DEFAULT_AVATAR = (
+    "data:image/svg+xml;utf8,<svg xmlns='http://www.w3.org/2000/svg' width='96' height='96'>"
+    "<rect width='96' height='96' fill='%23cbd5e0'/></svg>"
+)
+
+def render(template, **values):
+    """Fill {{name}} placeholders in a template with HTML-escaped values"""
+    with open(os.path.join(TEMPLATE_DIR, template), encoding="utf-8") as f:
+        content = f.read()
+    for name, value in values.items():
+        content = content.replace("{{" + name + "}}", html.escape(str(value), quote=True))
+    return content
+
+class SiteState:
+    """Accounts, sessions and profiles shared by all request handlers"""
+
+    def __init__(self, accounts, latency=0.0, error_rate=0.0, upload_limit=None, seed=None):
+        self.accounts = dict(accounts)
+        self.latency = latency
+        self.error_rate = error_rate
+        self.upload_limit = upload_limit
+        self.random = random.Random(seed)
+        self.sessions = {}
+        self.profiles = {}
+        self.uploads = {}
+        self.lock = threading.Lock()
+
+    def profile(self, email):
+        return self.profiles.setdefault(email, {
+            "first_name": "", "last_name": "", "url": "", "avatar": DEFAULT_AVATAR
+        })
+
+    def should_fail(self):
+        with self.lock:
+            return self.error_rate > 0 and self.random.random() < self.error_rate
+
+class LocalSiteHandler(BaseHTTPRequestHandler):
+    """Serves the login, pathfinder and profile pages plus their JSON API"""
+
+    server_version = "W3SchoolsStandIn/1.0"
+
+    @property
+    def state(self):
+        return self.server.state
+
+    def log_message(self, format, *args):
+        logger.debug("%s - %s", self.address_string(), format % args)
+
+    # Helpers
+
+    def session_email(self):
+        cookie = SimpleCookie(self.headers.get("Cookie", ""))
+        token = cookie[SESSION_COOKIE].value if SESSION_COOKIE in cookie else None
+        return self.state.sessions.get(token)
+
+    def read_json(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        if not length:
+            return {}
+        try:
+            return json.loads(self.rfile.read(length))
+        except ValueError:
+            return {}
+
+    def send_body(self, status, body, content_type, headers=None):
+        data = body.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        self.send_header("Cache-Control", "no-store")
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def send_html(self, body):
+        self.send_body(200, body, "text/html; charset=utf-8")
+
+    def send_json(self, status, payload, headers=None):
+        self.send_body(status, json.dumps(payload), "application/json", headers)
+
+    def redirect(self, location):
+        self.send_response(302)
+        self.send_header("Location", location)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def injected_failure(self):
+        """Apply the latency and error-rate knobs; True if the request was failed"""
+        if self.state.latency:
+            time.sleep(self.state.latency)
+        if self.path.startswith("/api/") and self.state.should_fail():
+            self.send_json(500, {"error": "Internal server error (injected)"})
+            return True
+        return False
+
+    # Routes
+
+    def do_GET(self):
+        if self.injected_failure():
+            return
+        path = urlsplit(self.path).path
+        email = self.session_email()
+        if path in ("/", "/login"):
+            self.send_html(render("login.html"))
+        elif path.rstrip("/") == "/pathfinder":
+            if email is None:
+                return self.redirect("/login")
+            self.send_html(render("pathfinder.html", email=email))
+        elif path == "/profile":
+            if email is None:
+                return self.redirect("/login")
+            self.send_html(render("profile.html", **self.state.profile(email)))
+        elif path == "/api/profile":
+            if email is None:
+                return self.send_json(401, {"error": "Session expired"})
+            self.send_json(200, self.state.profile(email))
+        else:
+            self.send_json(404, {"error": "Not found"})
+
+    def do_POST(self):
+        if self.injected_failure():
+            return
+        path = urlsplit(self.path).path
+        if path == "/api/login":
+            return self.handle_login()
+        if path == "/api/logout":
+            return self.send_json(200, {}, {"Set-Cookie": f"{SESSION_COOKIE}=; Path=/; Max-Age=0"})
+        email = self.session_email()
+        if email is None:
+            return self.send_json(401, {"error": "Session expired"})
+        if path == "/api/profile/image":
+            return self.handle_upload(email)
+        self.send_json(404, {"error": "Not found"})
+
+    def do_PUT(self):
+        if self.injected_failure():
+            return
+        path = urlsplit(self.path).path
+        email = self.session_email()
+        if email is None:
+            return self.send_json(401, {"error": "Session expired"})
+        if path != "/api/profile":
+            return self.send_json(404, {"error": "Not found"})
+        data = self.read_json()
+        with self.state.lock:
+            profile = self.state.profile(email)
+            for field in ("first_name", "last_name", "url"):
+                if field in data:
+                    profile[field] = str(data[field])
+            result = dict(profile)
+        self.send_json(200, result)
+
+    def handle_login(self):
+        data = self.read_json()
+        email = data.get("email", "")
+        if self.state.accounts.get(email) != data.get("password"):
+            return self.send_json(401, {"error": "Incorrect email or password"})
+        token = secrets.token_hex(16)
+        with self.state.lock:
+            self.state.sessions[token] = email
+        self.send_json(200, {"email": email}, {
+            "Set-Cookie": f"{SESSION_COOKIE}={token}; Path=/; HttpOnly; SameSite=Lax"
+        })
+
+    def handle_upload(self, email):
+        data = self.read_json()
+        image = data.get("image", "")
+        if not image.startswith("data:image/"):
+            return self.send_json(400, {"error": "Unsupported image"})
+        with self.state.lock:
+            count = self.state.uploads.get(email, 0)
+            limited = self.state.upload_limit is not None and count >= self.state.upload_limit
+            if not limited:
+                self.state.uploads[email] = count + 1
+                self.state.profile(email)["avatar"] = image
+        if limited:
+            return self.send_json(429, {"error": "Upload limit exceeded, please try again later"})
+        self.send_json(200, {"avatar": image})
+
+class LocalSite:
+    """
+    Local stand-in for profile.w3schools.com that serves the same DOM the
+    page objects expect, so the suite can run offline and in parallel.
+
+    Usage:
+        with LocalSite(latency=0.05) as site:
+            driver.get(site.base_url + "/login")
+    """
+
+    def __init__(self, host="127.0.0.1", port=0, accounts=None, latency=0.0,
+                 error_rate=0.0, upload_limit=None, seed=None):
+        """
+        :param port: 0 picks a free port
+        :param accounts: dict of email -> password (defaults to LoginData.ACCOUNT_POOL)
+        :param latency: seconds added to every response
+        :param error_rate: fraction (0-1) of API requests that fail with HTTP 500
+        :param upload_limit: image uploads allowed per account before "limit exceeded"
+        :param seed: seed for the error injection so runs are repeatable
+        """
+        if accounts is None:
+            accounts = {account["email"]: account["password"] for account in LoginData.ACCOUNT_POOL}
+        self.state = SiteState(accounts, latency, error_rate, upload_limit, seed)
+        self.httpd = ThreadingHTTPServer((host, port), LocalSiteHandler)
+        self.httpd.daemon_threads = True
+        self.httpd.state = self.state
+        self._thread = None
+
+    @property
+    def base_url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        """Serve requests on a background thread"""
+        self._thread = threading.Thread(target=self.httpd.serve_forever, name="local-site", daemon=True)
+        self._thread.start()
+        logger.info("Local stand-in site running at %s", self.base_url)
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
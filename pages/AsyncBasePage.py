@@ -0,0 +1,334 @@
+from selenium.common.exceptions import TimeoutException, NoSuchElementException, StaleElementReferenceException
+from utils.step_logger import get_step_logger
+from pages.BasePage import SETTLE_SCRIPT, READ_ELEMENTS_SCRIPT
+from pages.locators import LOCATORS
+import asyncio
+import time
+
+class AsyncBasePage:
+    """
+    asyncio counterpart of BasePage for an AsyncSession (utils/async_webdriver.py).
+    Methods have the same names and arguments but are coroutines, so one event
+    loop can drive many browsers while each of them waits for its page.
+    Waits always use settle detection; static waits and the element cache are
+    not available here.
+    """
+
+    SETTLE_TIMEOUT = 5
+    SETTLE_QUIET_FRAMES = 2
+
+    # Exceptions that mean "not yet" while waiting
+    IGNORED_EXCEPTIONS = (NoSuchElementException, StaleElementReferenceException)
+
+    def __init__(self, session, timeout=10, poll_frequency=0.5):
+        self.session = session
+        self.timeout = timeout
+        self.poll_frequency = poll_frequency
+
+        # Step records are buffered per test and only written out on failure
+        self.logger = get_step_logger(type(self).__module__)
+
+    async def wait_until(self, condition, timeout=None, poll_frequency=None, message=""):
+        """
+        Await condition() until it returns something truthy; other coroutines run while polling
+        :param condition: callable returning an awaitable
+        :param timeout: time to wait in seconds (defaults to self.timeout)
+        :param poll_frequency: how often to poll in seconds
+        :return: the truthy value
+        """
+        timeout = self.timeout if timeout is None else timeout
+        poll_frequency = self.poll_frequency if poll_frequency is None else poll_frequency
+        end_time = time.monotonic() + timeout
+        while True:
+            try:
+                value = await condition()
+                if value:
+                    return value
+            except self.IGNORED_EXCEPTIONS:
+                pass
+            if time.monotonic() > end_time:
+                raise TimeoutException(message)
+            await asyncio.sleep(poll_frequency)
+
+    async def wait_for_any(self, conditions, timeout=10):
+        """
+        Wait for whichever of several outcomes happens first; the conditions are polled concurrently
+        :param conditions: dict of name -> callable returning an awaitable, as for wait_until
+        :param timeout: time to wait in seconds
+        :return: (name, value) of the first condition that held, or (None, None) on timeout
+        """
+        waits = {
+            asyncio.ensure_future(self.wait_until(condition, timeout=timeout)): name
+            for name, condition in conditions.items()
+        }
+        pending = set(waits)
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if not task.cancelled() and task.exception() is None:
+                        self.logger.info("Wait ended with: %s", waits[task])
+                        return waits[task], task.result()
+                    if not isinstance(task.exception(), TimeoutException):
+                        raise task.exception()
+            self.logger.warning("None of %s happened within %ss", list(conditions), timeout)
+            return None, None
+        finally:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    async def find_element(self, locator):
+        """
+        Find element with explicit wait
+        :param locator: tuple of locator strategy and value (e.g., (By.ID, "example"))
+        """
+        try:
+            element = await self.wait_until(lambda: self.session.find_element(*locator))
+            self.logger.info("Found element: %s", locator)
+            return element
+        except TimeoutException:
+            self.logger.error("Failed to find element: %s", locator)
+            raise
+
+    async def find_elements(self, locator):
+        """
+        Find all elements matching the locator
+        :param locator: tuple of locator strategy and value
+        """
+        try:
+            elements = await self.wait_until(lambda: self.session.find_elements(*locator))
+            self.logger.info("Found elements: %s", locator)
+            return elements
+        except TimeoutException:
+            self.logger.error("Failed to find elements: %s", locator)
+            raise
+
+    async def _clickable(self, locator):
+        """The element if it is visible and enabled"""
+        element = await self.session.find_element(*locator)
+        if await element.is_displayed() and await element.is_enabled():
+            return element
+        return None
+
+    async def click_element(self, locator):
+        """Find element, scroll to it, wait for it to be clickable, and click it"""
+        try:
+            element = await self.find_element(locator)
+            await self.scroll_to_element(element)
+            clickable_element = await self.wait_until(lambda: self._clickable(locator))
+            await self.wait_for_page_to_settle(clickable_element)
+            await clickable_element.click()
+            self.logger.info("Clicked element: %s", locator)
+        except TimeoutException:
+            self.logger.error("Element not clickable: %s", locator)
+            raise
+        except Exception as e:
+            self.logger.error("Failed to click element %s: %s", locator, e)
+            raise
+
+    async def enhanced_clear(self, element):
+        """Enhanced clear method that uses multiple clearing techniques"""
+        try:
+            await element.clear()
+
+            # If that doesn't work, try sending CTRL+A and DELETE
+            if await element.get_property("value"):
+                # CTRL+A, release CTRL (NULL key), then DELETE in one command
+                await element.send_keys(u'\ue009a\ue000\ue017')
+                self.logger.info("Used enhanced clear method with keyboard shortcuts")
+
+            # As a last resort, try JavaScript
+            if await element.get_property("value"):
+                await self.session.execute_script("arguments[0].value = '';", element)
+                self.logger.info("Used JavaScript to clear field")
+
+            self.logger.info("Input field cleared")
+        except Exception as e:
+            self.logger.error("Failed to clear element: %s", e)
+            raise
+
+    async def input_text(self, locator, text):
+        """Wait for element to be clickable, scroll to it, and input text"""
+        try:
+            element = await self.wait_until(lambda: self._clickable(locator))
+            await self.scroll_to_element(element)
+            await self.enhanced_clear(element)
+            await element.send_keys(text)
+            self.logger.info("Input text '%s' into element: %s", text, locator)
+        except TimeoutException:
+            self.logger.error("Element not clickable for text input: %s", locator)
+            raise
+        except Exception as e:
+            self.logger.error("Failed to input text into element %s: %s", locator, e)
+            raise
+
+    async def get_text(self, locator):
+        """
+        Get text from element
+        :param locator: tuple of locator strategy and value
+        """
+        try:
+            element = await self.find_element(locator)
+            text = await element.text()
+            self.logger.info("Got text '%s' from element: %s", text, locator)
+            return text
+        except TimeoutException:
+            self.logger.error("Failed to get text from element: %s", locator)
+            raise
+
+    async def _visible(self, locator):
+        return await (await self.session.find_element(*locator)).is_displayed()
+
+    async def is_element_visible(self, locator, timeout=10):
+        """
+        Check if element is visible
+        :param locator: tuple of locator strategy and value
+        :param timeout: time to wait for element
+        """
+        try:
+            await self.wait_until(lambda: self._visible(locator), timeout=timeout)
+            self.logger.info("Element is visible: %s", locator)
+            return True
+        except TimeoutException:
+            self.logger.error("Element is not visible: %s", locator)
+            return False
+
+    async def is_element_present(self, locator, timeout=10):
+        """
+        Check if element is present in DOM
+        :param locator: tuple of locator strategy and value
+        :param timeout: time to wait for element
+        """
+        try:
+            await self.wait_until(lambda: self.session.find_element(*locator), timeout=timeout)
+            self.logger.info("Element is present: %s", locator)
+            return True
+        except TimeoutException:
+            self.logger.error("Element is not present: %s", locator)
+            return False
+
+    async def _invisible(self, locator):
+        try:
+            return not await self._visible(locator)
+        except self.IGNORED_EXCEPTIONS:
+            return True
+
+    async def wait_for_element_to_disappear(self, locator, timeout=10):
+        """
+        Wait for element to disappear from DOM
+        :param locator: tuple of locator strategy and value
+        :param timeout: time to wait for element
+        """
+        try:
+            await self.wait_until(lambda: self._invisible(locator), timeout=timeout)
+            self.logger.info("Element disappeared: %s", locator)
+            return True
+        except TimeoutException:
+            self.logger.error("Element did not disappear: %s", locator)
+            return False
+
+    async def get_attribute(self, locator, attribute):
+        """
+        Get attribute value of element
+        :param locator: tuple of locator strategy and value
+        :param attribute: attribute name
+        """
+        try:
+            element = await self.find_element(locator)
+            # Like selenium's get_attribute, prefer the live property (e.g. an input's value)
+            value = await element.get_property(attribute)
+            if value is None:
+                value = await element.get_attribute(attribute)
+            self.logger.info("Got attribute '%s' with value '%s' from element: %s", attribute, value, locator)
+            return value
+        except Exception as e:
+            self.logger.error("Failed to get attribute '%s' from element: %s", attribute, locator)
+            raise
+
+    def locators(self, *names):
+        """
+        Registered locators of this page, for bulk operations such as read_elements
+        :param names: locator names (e.g. "FIRST_NAME_INPUT"); all locators if omitted
+        :return: dict of name -> locator tuple
+        """
+        registered = LOCATORS.for_page(type(self))
+        if not names:
+            return registered
+        return {name: registered[name] for name in names}
+
+    async def read_elements(self, locators, properties=("value", "text", "visible", "enabled"), attributes=()):
+        """
+        Read several elements in a single round trip
+        :param locators: dict of name -> locator tuple
+        :param properties: any of "value", "text", "visible", "enabled"
+        :param attributes: attribute names to read from every element
+        :return: dict of name -> {"found": bool, <property>: ..., "attributes": {...}}
+        """
+        try:
+            result = await self.session.execute_script(
+                READ_ELEMENTS_SCRIPT,
+                {name: list(locator) for name, locator in locators.items()},
+                list(properties),
+                list(attributes)
+            )
+            self.logger.info("Read %s elements: %s", len(locators), list(locators))
+            return result
+        except Exception as e:
+            self.logger.error("Failed to read elements %s: %s", list(locators), e)
+            raise
+
+    async def are_elements_visible(self, locators, timeout=10):
+        """
+        Wait until all elements are visible, checking them together on every poll
+        :param locators: dict of name -> locator tuple
+        :param timeout: time to wait for elements
+        """
+        async def all_visible():
+            entries = await self.read_elements(locators, properties=("visible",))
+            return all(entry.get("visible") for entry in entries.values())
+
+        try:
+            await self.wait_until(all_visible, timeout=timeout)
+            self.logger.info("Elements are visible: %s", list(locators))
+            return True
+        except TimeoutException:
+            self.logger.error("Elements are not visible: %s", list(locators))
+            return False
+
+    async def scroll_to_element(self, element):
+        """Scroll element into middle of the viewport"""
+        try:
+            await self.wait_for_page_to_settle(element, scroll=True)
+            self.logger.info("Scrolled element to middle of viewport")
+        except Exception as e:
+            self.logger.error("Failed to scroll to element: %s", e)
+            raise
+
+    async def refresh_and_wait_element(self, locator):
+        """Refresh page and wait for element to load"""
+        try:
+            await self.session.refresh()
+            element = await self.find_element(locator)
+            self.logger.info("Page refreshed and element found: %s", locator)
+            return element
+        except TimeoutException:
+            self.logger.error("Element not found after refresh: %s", locator)
+            raise
+
+    async def wait_for_page_to_settle(self, element=None, scroll=False, timeout=None):
+        """
+        Wait until scrolling, CSS transitions/animations and layout have finished
+        :param element: optional element whose bounding box must also be stable
+        :param scroll: scroll the element into the middle of the viewport first
+        :param timeout: maximum time to wait in seconds
+        :return: True if the page settled, False if the timeout was reached
+        """
+        timeout = self.SETTLE_TIMEOUT if timeout is None else timeout
+        settled, _ = await self.session.execute_async_script(
+            SETTLE_SCRIPT, element, self.SETTLE_QUIET_FRAMES, int(timeout * 1000), scroll
+        )
+        if not settled:
+            self.logger.warning("Page did not settle within %ss", timeout)
+        return settled
+
@@ -0,0 +1,118 @@
+from pages.AsyncBasePage import AsyncBasePage
+from pages.LoginPage import LoginPage
+from pages.locators import register_locators
+import asyncio
+import base64
+import time
+
+@register_locators
+class AsyncLoginPage(AsyncBasePage):
+    # Locators are shared with the synchronous page
+    USERNAME_INPUT = LoginPage.USERNAME_INPUT
+    PASSWORD_INPUT = LoginPage.PASSWORD_INPUT
+    LOGIN_BUTTON = LoginPage.LOGIN_BUTTON
+    ERROR_MESSAGE = LoginPage.ERROR_MESSAGE
+
+    async def enter_username(self, username):
+        """Enter username in the username field"""
+        await self.input_text(self.USERNAME_INPUT, username)
+        return self
+
+    async def enter_password(self, password):
+        """Enter password in the password field"""
+        await self.input_text(self.PASSWORD_INPUT, password)
+        return self
+
+    async def click_login_button(self):
+        """Click on the login button"""
+        await self.click_element(self.LOGIN_BUTTON)
+        return self
+
+    async def get_error_message(self):
+        """Get error message text if present"""
+        try:
+            error_text = await self.get_text(self.ERROR_MESSAGE)
+            self.logger.warning("Login error detected: %s", error_text)
+            return error_text
+        except Exception:
+            self.logger.info("No error message found")
+            return ""
+
+    async def login(self, username, password, max_attempts=2, wait_between_attempts=1):
+        """
+        Perform login action with verification and retry mechanism
+        :param username: User email/username to login with
+        :param password: User password
+        :param max_attempts: Maximum number of attempts to verify login page is displayed
+        :param wait_between_attempts: Wait time between attempts in seconds
+        """
+        self.logger.info("Attempting to login with username: %s", username)
+
+        # Verify login page is fully loaded before proceeding
+        login_page_loaded = False
+        attempt = 0
+
+        while attempt < max_attempts and not login_page_loaded:
+            attempt += 1
+            self.logger.info("Verifying login page is displayed (attempt %s/%s)", attempt, max_attempts)
+            login_page_loaded = await self.is_login_page_displayed()
+
+            if login_page_loaded:
+                self.logger.info("Login page verified, proceeding with login")
+                break
+            elif attempt < max_attempts:
+                self.logger.warning("Login page not fully loaded, waiting %ss before retry", wait_between_attempts)
+                await asyncio.sleep(wait_between_attempts)
+                # Try refreshing the page if it's not loaded correctly
+                if attempt > 1:
+                    self.logger.info("Refreshing page to attempt reload")
+                    await self.session.refresh()
+
+        if not login_page_loaded:
+            self.logger.error("Failed to verify login page after %s attempts", max_attempts)
+            # Take screenshot for debugging
+            try:
+                timestamp = time.strftime("%Y%m%d-%H%M%S")
+                screenshot_path = f"reports/screenshots/login_page_error_{timestamp}.png"
+                screenshot = await self.session.get_screenshot_as_base64()
+                with open(screenshot_path, "wb") as f:
+                    f.write(base64.b64decode(screenshot))
+                self.logger.info("Error screenshot saved to %s", screenshot_path)
+            except Exception as e:
+                self.logger.error("Failed to save error screenshot: %s", e)
+
+            return self
+
+        # Proceed with login
+        await self.enter_username(username)
+        await self.enter_password(password)
+        await self.click_login_button()
+
+        # Check if we got redirected (success) or if we have an error message
+        current_url = await self.session.current_url()
+        self.logger.info("After login attempt, current URL: %s", current_url)
+
+        if "login" not in current_url.lower():
+            self.logger.info("Login successful - redirected away from login page")
+        else:
+            error = await self.get_error_message()
+            if error:
+                self.logger.warning("Login failed with error: %s", error)
+            else:
+                self.logger.warning("Login failed without specific error message")
+
+        return self
+
+    async def is_login_page_displayed(self):
+        """Check if login page is displayed"""
+        displayed = await self.are_elements_visible({
+            "username": self.USERNAME_INPUT,
+            "password": self.PASSWORD_INPUT
+        })
+
+        if displayed:
+            self.logger.info("Login page is displayed")
+        else:
+            self.logger.warning("Login page elements not fully visible")
+
+        return displayed
@@ -0,0 +1,135 @@
+from pages.AsyncBasePage import AsyncBasePage
+from pages.ProfilePage import ProfilePage
+from pages.locators import register_locators
+import os
+
+@register_locators
+class AsyncProfilePage(AsyncBasePage):
+    # Locators are shared with the synchronous page
+    FIRST_NAME_INPUT = ProfilePage.FIRST_NAME_INPUT
+    LAST_NAME_INPUT = ProfilePage.LAST_NAME_INPUT
+    SAVE_ACCOUNT_BTN = ProfilePage.SAVE_ACCOUNT_BTN
+
+    UPLOAD_IMG_INPUT = ProfilePage.UPLOAD_IMG_INPUT
+    CONFIRM_EDIT_BTN = ProfilePage.CONFIRM_EDIT_BTN
+    UPLOADED_IMG = ProfilePage.UPLOADED_IMG
+    SUCCESS_TOAST = ProfilePage.SUCCESS_TOAST
+    SUCCESS_TOAST_MESSAGE = ProfilePage.SUCCESS_TOAST_MESSAGE
+
+    ERROR_TOAST = ProfilePage.ERROR_TOAST
+    ERROR_TOAST_MESSAGE = ProfilePage.ERROR_TOAST_MESSAGE
+
+    URL_INPUT = ProfilePage.URL_INPUT
+    SAVE_PROFILE_BTN = ProfilePage.SAVE_PROFILE_BTN
+    CONFIRM_YES_BTN = ProfilePage.CONFIRM_YES_BTN
+
+    # The performance log is not read over the async client, so saves are
+    # verified by reloading the page like ProfilePage(deep_verify=True)
+
+    async def change_username(self, first_name, last_name):
+        """Change user's first and last name"""
+        try:
+            await self.input_text(self.FIRST_NAME_INPUT, first_name)
+            await self.input_text(self.LAST_NAME_INPUT, last_name)
+            await self.click_element(self.SAVE_ACCOUNT_BTN)
+
+            await self.refresh_and_wait_element(self.FIRST_NAME_INPUT)
+            fields = await self.read_elements({
+                "first_name": self.FIRST_NAME_INPUT,
+                "last_name": self.LAST_NAME_INPUT
+            }, properties=("value",))
+            current_first_name = fields["first_name"].get("value")
+            current_last_name = fields["last_name"].get("value")
+
+            if current_first_name == first_name and current_last_name == last_name:
+                self.logger.info("Successfully changed username to: %s %s", first_name, last_name)
+                return True
+            else:
+                self.logger.error("Username change failed. Expected: %s %s, Got: %s %s", first_name, last_name, current_first_name, current_last_name)
+                return False
+
+        except Exception as e:
+            self.logger.error("Failed to change username: %s", e)
+            raise
+
+    async def handle_edit_image_popup(self):
+        """Handle the Edit Image popup by clicking Confirm Edit"""
+        try:
+            await self.click_element(self.CONFIRM_EDIT_BTN)
+            self.logger.info("Successfully confirmed image edit")
+            return True
+        except Exception as e:
+            self.logger.error("Failed to handle Edit Image popup: %s", e)
+            raise
+
+    async def upload_profile_image(self, image_path):
+        """Upload profile image and verify it"""
+        try:
+            # Find the hidden file input and send the file path directly
+            file_input = await self.find_element(self.UPLOAD_IMG_INPUT)
+            await file_input.send_keys(os.path.abspath(image_path))
+
+            if not await self.handle_edit_image_popup():
+                return False
+
+            # Whichever toast shows up first decides the outcome
+            outcome, _ = await self.wait_for_any({
+                "success": lambda: self._visible(self.SUCCESS_TOAST),
+                "error": lambda: self._visible(self.ERROR_TOAST)
+            }, timeout=10)
+
+            if outcome == "success":
+                success_message = await self.get_text(self.SUCCESS_TOAST_MESSAGE)
+                self.logger.info("Success toast displayed: %s", success_message)
+                return True
+
+            if outcome == "error":
+                error_message = await self.get_text(self.ERROR_TOAST_MESSAGE)
+                self.logger.error("Error toast displayed: %s", error_message)
+
+                if "limit exceeded" in error_message.lower():
+                    self.logger.error("Upload failed due to limit exceeded")
+            else:
+                self.logger.error("No success or error toast detected - image upload likely failed")
+
+            return False
+
+        except Exception as e:
+            self.logger.error("Failed to upload profile image: %s", e)
+            raise
+
+    async def handle_confirmation_dialog(self):
+        """Handle the confirmation dialog by clicking Yes"""
+        try:
+            await self.click_element(self.CONFIRM_YES_BTN)
+            self.logger.info("Successfully confirmed dialog")
+            return True
+        except Exception as e:
+            self.logger.error("Failed to handle confirmation dialog: %s", e)
+            raise
+
+    async def change_profile_url(self, new_url):
+        """Change public profile URL"""
+        try:
+            await self.input_text(self.URL_INPUT, new_url)
+            await self.click_element(self.SAVE_PROFILE_BTN)
+
+            if not await self.handle_confirmation_dialog():
+                return False
+
+            await self.refresh_and_wait_element(self.URL_INPUT)
+            current_url = await self.get_attribute(self.URL_INPUT, "value")
+            if current_url == new_url:
+                self.logger.info("Successfully changed and verified profile URL to: %s", new_url)
+                return True
+            else:
+                self.logger.error("Profile URL change did not persist after refresh")
+                return False
+
+        except Exception as e:
+            self.logger.error("Failed to change profile URL: %s", e)
+            raise
+
+    async def is_profile_page_loaded(self):
+        """Verify profile page is loaded"""
+        return await self.is_element_visible(self.FIRST_NAME_INPUT)
@@ -1,20 +1,560 @@
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.common.by import By
 from selenium.webdriver.common.action_chains import ActionChains
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import TimeoutException, NoSuchElementException, StaleElementReferenceException, JavascriptException
+from selenium.webdriver.remote.webelement import WebElement
+from utils.step_logger import get_step_logger
+from utils.network_capture import NetworkCapture
+from utils.command_metrics import locator_context
+from pages.locators import LOCATORS
+import inspect
 import time
-import logging
+import uuid
+
+# Helpers shared by the in-page scripts: locator resolution, visibility and a
+# DOM generation counter maintained by a MutationObserver (used by the element cache)
+FIND_ELEMENT_JS = """
+    function findElement(by, value) {
+        switch (by) {
+            case 'id':
+                return document.getElementById(value);
+            case 'name':
+                return document.getElementsByName(value)[0] || null;
+            case 'class name':
+                return document.getElementsByClassName(value)[0] || null;
+            case 'tag name':
+                return document.getElementsByTagName(value)[0] || null;
+            case 'css selector':
+                return document.querySelector(value);
+            case 'xpath':
+                return document.evaluate(value, document, null,
+                    XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+            case 'link text':
+            case 'partial link text':
+                return Array.prototype.find.call(document.getElementsByTagName('a'), function (link) {
+                    const text = link.innerText.trim();
+                    return by === 'link text' ? text === value : text.indexOf(value) !== -1;
+                }) || null;
+            default:
+                throw new Error('Unsupported locator strategy: ' + by);
+        }
+    }
+
+    function isVisible(element) {
+        if (!element.isConnected || element.getClientRects().length === 0) {
+            return false;
+        }
+        const style = window.getComputedStyle(element);
+        return style.visibility !== 'hidden' && style.display !== 'none' && style.opacity !== '0';
+    }
+
+    function domGeneration() {
+        if (!window.__pomDomObserver) {
+            window.__pomDocumentId = Math.random().toString(36).slice(2);
+            window.__pomDomGeneration = 0;
+            window.__pomDomObserver = new MutationObserver(function () {
+                window.__pomDomGeneration++;
+            });
+            window.__pomDomObserver.observe(document, {childList: true, subtree: true});
+        }
+        return window.__pomDocumentId + ':' + window.__pomDomGeneration;
+    }
+"""
+
+# Resolves once scroll position, the element's bounding box and all finite
+# CSS animations/transitions have been unchanged for a few animation frames
+SETTLE_SCRIPT = FIND_ELEMENT_JS + """
+    const element = arguments[0];
+    const quietFrames = arguments[1];
+    const timeoutMs = arguments[2];
+    const done = arguments[arguments.length - 1];
+    const start = performance.now();
+    let last = null;
+    let stable = 0;
+
+    function snapshot() {
+        const rect = element && element.isConnected ? element.getBoundingClientRect() : null;
+        return [window.scrollX, window.scrollY,
+                rect ? rect.x : 0, rect ? rect.y : 0,
+                rect ? rect.width : 0, rect ? rect.height : 0].join(',');
+    }
+
+    function animating() {
+        if (!document.getAnimations) {
+            return false;
+        }
+        return document.getAnimations().some(function (animation) {
+            const timing = animation.effect ? animation.effect.getTiming() : null;
+            return animation.playState === 'running' && timing && timing.iterations !== Infinity;
+        });
+    }
+
+    function next() {
+        // requestAnimationFrame does not fire in hidden tabs
+        if (document.hidden) {
+            setTimeout(tick, 16);
+        } else {
+            requestAnimationFrame(tick);
+        }
+    }
+
+    function tick() {
+        const current = snapshot();
+        if (current === last && document.readyState === 'complete' && !animating()) {
+            stable++;
+        } else {
+            stable = 0;
+        }
+        last = current;
+        if (stable >= quietFrames) {
+            return done([true, domGeneration()]);
+        }
+        if (performance.now() - start > timeoutMs) {
+            return done([false, domGeneration()]);
+        }
+        next();
+    }
+
+    if (arguments.length > 4 && arguments[3]) {
+        const rect = element.getBoundingClientRect();
+        window.scrollTo(0, rect.top + window.pageYOffset - (window.innerHeight / 2));
+    }
+    next();
+"""
+
+# Looks up one element and reports the DOM generation it was found in. A cached
+# element (arguments[2]) is reused only while the DOM generation is still the one
+# it was found in (arguments[3])
+CACHED_FIND_SCRIPT = FIND_ELEMENT_JS + """
+    const cached = arguments[2];
+    const generation = domGeneration();
+    if (cached && cached.isConnected && generation === arguments[3]) {
+        return [cached, generation];
+    }
+    return [findElement(arguments[0], arguments[1]), generation];
+"""
+
+# Reads the requested properties of several named locators in one call
+READ_ELEMENTS_SCRIPT = FIND_ELEMENT_JS + """
+    const locators = arguments[0];
+    const properties = arguments[1];
+    const attributes = arguments[2];
+    const result = {};
+    for (const name in locators) {
+        const element = findElement(locators[name][0], locators[name][1]);
+        const entry = {found: element !== null};
+        if (element !== null) {
+            if (properties.indexOf('value') !== -1) entry.value = element.value === undefined ? null : element.value;
+            if (properties.indexOf('text') !== -1) entry.text = element.innerText;
+            if (properties.indexOf('visible') !== -1) entry.visible = isVisible(element);
+            if (properties.indexOf('enabled') !== -1) entry.enabled = !element.disabled;
+            if (attributes.length) {
+                entry.attributes = {};
+                attributes.forEach(function (attribute) {
+                    entry.attributes[attribute] = element.getAttribute(attribute);
+                });
+            }
+        }
+        result[name] = entry;
+    }
+    return result;
+"""
+
+# Resolves as soon as one of several conditions holds, re-checking on every DOM
+# mutation and animation frame, with {index, value} of the first condition that
+# held or {timedOut: true} after arguments[1] milliseconds. Each condition is
+# [kind, target, expected]; the target is a [by, value] locator or an element.
+# The document is stamped with arguments[2] first, so after a script error the
+# caller can tell a navigation (new document, no stamp) from a real error.
+IN_PAGE_WAIT_SCRIPT = """
+    document.__pomWaitToken = arguments[2];
+""" + FIND_ELEMENT_JS + """
+    const conditions = arguments[0];
+    const timeoutMs = arguments[1];
+    const done = arguments[arguments.length - 1];
+
+    function resolveTarget(target) {
+        return Array.isArray(target) ? findElement(target[0], target[1]) : target;
+    }
+
+    function findAll(by, value) {
+        switch (by) {
+            case 'id':
+                return Array.prototype.slice.call(document.querySelectorAll('[id="' + CSS.escape(value) + '"]'));
+            case 'name':
+                return Array.prototype.slice.call(document.getElementsByName(value));
+            case 'class name':
+                return Array.prototype.slice.call(document.getElementsByClassName(value));
+            case 'tag name':
+                return Array.prototype.slice.call(document.getElementsByTagName(value));
+            case 'css selector':
+                return Array.prototype.slice.call(document.querySelectorAll(value));
+            case 'xpath': {
+                const result = document.evaluate(value, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+                const elements = [];
+                for (let i = 0; i < result.snapshotLength; i++) {
+                    elements.push(result.snapshotItem(i));
+                }
+                return elements;
+            }
+            case 'link text':
+            case 'partial link text':
+                return Array.prototype.filter.call(document.getElementsByTagName('a'), function (link) {
+                    const text = link.innerText.trim();
+                    return by === 'link text' ? text === value : text.indexOf(value) !== -1;
+                });
+        }
+        throw new Error('Unsupported locator strategy: ' + by);
+    }
+
+    function checkOne(kind, target, expected) {
+        const element = kind.indexOf('url') === 0 || kind === 'all_present' ? null : resolveTarget(target);
+        switch (kind) {
+            case 'present':
+                return element ? {value: element} : null;
+            case 'visible':
+                return element && isVisible(element) ? {value: element} : null;
+            case 'invisible':
+                return !element || !isVisible(element) ? {value: true} : null;
+            case 'clickable':
+                return element && isVisible(element) && !element.disabled ? {value: element} : null;
+            case 'text':
+                return element && element.innerText.indexOf(expected) !== -1 ? {value: true} : null;
+            case 'all_present':
+                const elements = findAll(target[0], target[1]);
+                return elements.length ? {value: elements} : null;
+            case 'url_is':
+                return window.location.href === expected ? {value: true} : null;
+            case 'url_contains':
+                return window.location.href.indexOf(expected) !== -1 ? {value: true} : null;
+            case 'url_changes':
+                return window.location.href !== expected ? {value: true} : null;
+        }
+        throw new Error('Unsupported wait condition: ' + kind);
+    }
+
+    function check() {
+        for (let i = 0; i < conditions.length; i++) {
+            const result = checkOne(conditions[i][0], conditions[i][1], conditions[i][2]);
+            if (result) {
+                result.index = i;
+                return result;
+            }
+        }
+        return null;
+    }
+
+    let finished = false;
+    let observer = null;
+    function finish(result) {
+        if (finished) {
+            return;
+        }
+        finished = true;
+        if (observer) {
+            observer.disconnect();
+        }
+        done(result);
+    }
+    function poll() {
+        if (finished) {
+            return;
+        }
+        const result = check();
+        if (result) {
+            finish(result);
+        } else {
+            // Style-only changes (transitions, class toggles in shadow roots) do not mutate the DOM
+            window.requestAnimationFrame(poll);
+        }
+    }
+
+    observer = new MutationObserver(function () {
+        const result = check();
+        if (result) {
+            finish(result);
+        }
+    });
+    observer.observe(document, {childList: true, subtree: true, attributes: true, characterData: true});
+    setTimeout(function () { finish({timedOut: true}); }, timeoutMs);
+    poll();
+"""
+
+# Waits until the field is visible and editable, scrolls it to the middle of
+# the viewport and sets its value through the native setter, so React/Chakra
+# state follows, then fires input/change and reads the value back
+FAST_INPUT_SCRIPT = FIND_ELEMENT_JS + """
+    const by = arguments[0];
+    const value = arguments[1];
+    const text = arguments[2];
+    const deadline = Date.now() + arguments[3];
+    const done = arguments[arguments.length - 1];
+
+    function attempt() {
+        const element = findElement(by, value);
+        if (element && isVisible(element) && !element.disabled && !element.readOnly) {
+            element.scrollIntoView({block: 'center', inline: 'nearest'});
+            element.focus();
+            const prototype = element instanceof HTMLTextAreaElement
+                ? HTMLTextAreaElement.prototype : HTMLInputElement.prototype;
+            Object.getOwnPropertyDescriptor(prototype, 'value').set.call(element, text);
+            element.dispatchEvent(new Event('input', {bubbles: true}));
+            element.dispatchEvent(new Event('change', {bubbles: true}));
+            done({ok: true, value: element.value});
+        } else if (Date.now() > deadline) {
+            done({ok: false, reason: element ? 'not editable' : 'not found'});
+        } else {
+            setTimeout(attempt, 50);
+        }
+    }
+    attempt();
+"""
+
+# Waits until the target ([by, value] locator) is attached, visible, enabled,
+# scrolled into the middle of the viewport, has kept the same bounding box for a
+# few animation frames and is the topmost element at its center. A cached element
+# (arguments[3]) is used instead of the locator while the DOM generation is still
+# the one it was found in (arguments[4]).
+# Resolves with {ok, element, generation} or {ok: false, reason} on timeout.
+ACTIONABILITY_SCRIPT = FIND_ELEMENT_JS + """
+    const target = arguments[0];
+    const quietFrames = arguments[1];
+    const timeoutMs = arguments[2];
+    const cached = arguments[3];
+    const cachedGeneration = arguments[4];
+    const done = arguments[arguments.length - 1];
+    const start = performance.now();
+    let scrolled = null;
+    let last = null;
+    let stable = 0;
+    let reason = 'not found';
+
+    function describe(element) {
+        if (!element) {
+            return 'nothing';
+        }
+        return element.tagName.toLowerCase() + (element.id ? '#' + element.id : '')
+            + (typeof element.className === 'string' && element.className ? '.' + element.className.trim().split(/\\s+/).join('.') : '');
+    }
+
+    function resolve() {
+        if (cached && cached.isConnected && domGeneration() === cachedGeneration) {
+            return cached;
+        }
+        return findElement(target[0], target[1]);
+    }
+
+    function check() {
+        const element = resolve();
+        if (!element || !element.isConnected) {
+            reason = 'not found';
+            return null;
+        }
+        if (!isVisible(element)) {
+            reason = 'not visible';
+            return null;
+        }
+        if (element.disabled) {
+            reason = 'disabled';
+            return null;
+        }
+        if (scrolled !== element) {
+            const top = element.getBoundingClientRect().top;
+            window.scrollTo(0, top + window.pageYOffset - (window.innerHeight / 2));
+            scrolled = element;
+            last = null;
+        }
+        const rect = element.getBoundingClientRect();
+        const current = [window.scrollX, window.scrollY, rect.x, rect.y, rect.width, rect.height].join(',');
+        stable = current === last ? stable + 1 : 0;
+        last = current;
+        if (stable < quietFrames) {
+            reason = 'moving';
+            return null;
+        }
+        const hit = document.elementFromPoint(rect.x + rect.width / 2, rect.y + rect.height / 2);
+        if (!hit || (hit !== element && !element.contains(hit))) {
+            reason = 'covered by ' + describe(hit);
+            return null;
+        }
+        return element;
+    }
+
+    function next() {
+        // requestAnimationFrame does not fire in hidden tabs
+        if (document.hidden) {
+            setTimeout(tick, 16);
+        } else {
+            requestAnimationFrame(tick);
+        }
+    }
+
+    function tick() {
+        const element = check();
+        if (element) {
+            return done({ok: true, element: element, generation: domGeneration()});
+        }
+        if (performance.now() - start > timeoutMs) {
+            return done({ok: false, reason: reason});
+        }
+        next();
+    }
+
+    tick();
+"""
+
+# expected_conditions that IN_PAGE_WAIT_SCRIPT understands:
+# EC function -> (script kind, closure variable holding the target, closure variable holding the expected value)
+IN_PAGE_CONDITIONS = {
+    "presence_of_element_located": ("present", "locator", None),
+    "visibility_of_element_located": ("visible", "locator", None),
+    "visibility_of": ("visible", "element", None),
+    "invisibility_of_element_located": ("invisible", "locator", None),
+    "invisibility_of_element": ("invisible", "element", None),
+    "element_to_be_clickable": ("clickable", "mark", None),
+    "text_to_be_present_in_element": ("text", "locator", "text_"),
+    "presence_of_all_elements_located": ("all_present", "locator", None),
+    "url_to_be": ("url_is", None, "url"),
+    "url_contains": ("url_contains", None, "url"),
+    "url_changes": ("url_changes", None, "url"),
+}
+
+def translate_condition(condition):
+    """
+    Translate an expected_conditions predicate into IN_PAGE_WAIT_SCRIPT arguments
+    by reading the variables its closure captured
+    :return: (kind, target, expected), or None if the condition has to be polled
+    """
+    if getattr(condition, "__module__", None) != EC.__name__ or not hasattr(condition, "__qualname__"):
+        return None
+    factory = condition.__qualname__.split(".<locals>")[0]
+    if factory not in IN_PAGE_CONDITIONS:
+        return None
+    kind, target_name, expected_name = IN_PAGE_CONDITIONS[factory]
+    try:
+        captured = inspect.getclosurevars(condition).nonlocals
+    except (TypeError, ValueError):
+        return None
+    # Argument names differ between selenium versions; give up rather than guess
+    if (target_name and target_name not in captured) or (expected_name and expected_name not in captured):
+        return None
+    target = captured[target_name] if target_name else None
+    if isinstance(target, tuple):
+        target = list(target)
+    elif target is not None and not isinstance(target, WebElement):
+        return None
+    if kind == "all_present" and not isinstance(target, list):
+        return None
+    return kind, target, captured[expected_name] if expected_name else None
+
+def poll_any(driver, methods, timeout, poll_frequency=0.5, message=""):
+    """
+    Poll several conditions with WebDriverWait, the first truthy one wins
+    :return: (index of the condition that held, its value)
+    """
+    def first_match(driver):
+        for index, method in enumerate(methods):
+            try:
+                value = method(driver)
+            except (NoSuchElementException, StaleElementReferenceException):
+                continue
+            if value:
+                return index, value
+        return False
+
+    return WebDriverWait(driver, timeout, poll_frequency).until(first_match, message)
+
+class BrowserWait(WebDriverWait):
+    """
+    WebDriverWait that evaluates supported expected_conditions inside the page
+    with one execute_async_script call. The script resolves the moment the
+    condition holds instead of polling over HTTP. Any other condition, and
+    conditions on elements that went stale, fall back to regular polling.
+    """
+
+    # Longest single script call, kept below chromedriver's default 30 s script timeout
+    MAX_SCRIPT_WAIT = 20
+
+    def until(self, method, message=""):
+        translated = translate_condition(method)
+        if translated is None:
+            return super().until(method, message)
+        _, value = self.until_any([method], message)
+        return value
+
+    def until_any(self, methods, message=""):
+        """
+        Wait until the first of several conditions holds
+        :param methods: list of conditions
+        :return: (index of the condition that held, its value)
+        """
+        translated = [translate_condition(method) for method in methods]
+        if None in translated:
+            return poll_any(self._driver, methods, self._timeout, self._poll, message)
+        end_time = time.monotonic() + self._timeout
+        locators = [target for _, target, _ in translated if isinstance(target, list)]
+        while True:
+            remaining = end_time - time.monotonic()
+            token = uuid.uuid4().hex
+            try:
+                with locator_context(*locators):
+                    result = self._driver.execute_async_script(
+                        IN_PAGE_WAIT_SCRIPT, [list(condition) for condition in translated],
+                        int(max(0, min(remaining, self.MAX_SCRIPT_WAIT)) * 1000), token
+                    )
+            except StaleElementReferenceException:
+                return poll_any(self._driver, methods, max(0, remaining), self._poll, message)
+            except JavascriptException:
+                # Only a navigation is retried, in the new document; a broken
+                # selector or script error in the same document is raised
+                if not self._document_changed(token):
+                    raise
+                result = {"timedOut": True}
+            if not result.get("timedOut"):
+                return result["index"], result["value"]
+            if time.monotonic() >= end_time:
+                raise TimeoutException(message)
+
+    def _document_changed(self, token):
+        """True if the document stamped by IN_PAGE_WAIT_SCRIPT has been replaced"""
+        try:
+            return self._driver.execute_script("return document.__pomWaitToken || null;") != token
+        except JavascriptException:
+            # Still unloading; the next attempt runs in the new document
+            return True
 
 class BasePage:
-    def __init__(self, driver):
+    # Fixed sleeps are only used when this is enabled (e.g. via --static-waits);
+    # otherwise interactions wait for the page to settle and move on
+    STATIC_WAITS = False
+    SETTLE_TIMEOUT = 5  # seconds
+    SETTLE_QUIET_FRAMES = 2
+    # Reuse element handles until the DOM changes (e.g. via --cache-elements)
+    CACHE_ELEMENTS = False
+    # Evaluate expected_conditions inside the page instead of polling (disable via --polling-waits)
+    IN_PAGE_WAITS = True
+    # Set field values with one script instead of typing them (e.g. via --fast-input)
+    FAST_INPUT = False
+
+    def __init__(self, driver, static_waits=None, cache_elements=None, in_page_waits=None, fast_input=None):
         self.driver = driver
-        self.wait = WebDriverWait(driver, 10)  # 10 seconds timeout
+        self.in_page_waits = self.IN_PAGE_WAITS if in_page_waits is None else in_page_waits
+        self.fast_input = self.FAST_INPUT if fast_input is None else fast_input
+        self.wait = self.wait_for_condition(timeout=10)
         self.actions = ActionChains(self.driver)
+        self.static_waits = self.STATIC_WAITS if static_waits is None else static_waits
+        self.cache_elements = self.CACHE_ELEMENTS if cache_elements is None else cache_elements
+        
+        # locator -> (element, DOM generation it was found in)
+        self._element_cache = {}
+        # Last DOM generation reported by an in-page script
+        self._dom_generation = None
+        
+        # Step records are buffered per test and only written out on failure
+        self.logger = get_step_logger(type(self).__module__)
         
-        # Setup logging
-        self.logger = logging.getLogger(__name__)
-        logging.basicConfig(level=logging.INFO)
+        # Requests/responses from Chrome's performance log, shared by all page objects of the driver
+        self.network = NetworkCapture.for_driver(driver)
 
     def find_element(self, locator):
         """
@@ -22,13 +562,73 @@ class BasePage:
         :param locator: tuple of locator strategy and value (e.g., (By.ID, "example"))
         """
         try:
-            element = self.wait.until(EC.presence_of_element_located(locator))
-            self.logger.info(f"Found element: {locator}")
+            if self.cache_elements:
+                element = self._find_cached_element(locator)
+            else:
+                element = self.wait.until(EC.presence_of_element_located(locator))
+            self.logger.info("Found element: %s", locator)
             return element
         except TimeoutException:
-            self.logger.error(f"Failed to find element: {locator}")
+            self.logger.error("Failed to find element: %s", locator)
             raise
 
+    def _find_cached_element(self, locator, validate=True):
+        """
+        Return the cached handle if the DOM has not changed since it was found
+        :param validate: check the page's current DOM generation in the lookup script;
+            without it the handle is returned without a round trip, so only callers
+            wrapped in _retry_if_stale may pass False
+        """
+        entry = self._element_cache.get(locator)
+        if not validate and entry is not None and entry[1] == self._dom_generation:
+            return entry[0]
+        
+        def lookup(driver):
+            cached = self._element_cache.get(locator, (None, None))
+            try:
+                with locator_context(locator):
+                    element, self._dom_generation = driver.execute_script(CACHED_FIND_SCRIPT, *locator, *cached)
+            except StaleElementReferenceException:
+                # The cached node was removed; look the locator up on the next poll
+                self._element_cache.pop(locator, None)
+                return False
+            if element is None:
+                return False
+            self._element_cache[locator] = (element, self._dom_generation)
+            return element
+        
+        return self.wait.until(lookup)
+    
+    def _find_retryable(self, locator):
+        """find_element for callers wrapped in _retry_if_stale; cached handles are reused without a round trip"""
+        if not self.cache_elements:
+            return self.find_element(locator)
+        try:
+            element = self._find_cached_element(locator, validate=False)
+            self.logger.info("Found element: %s", locator)
+            return element
+        except TimeoutException:
+            self.logger.error("Failed to find element: %s", locator)
+            raise
+
+    def invalidate_element_cache(self, locator=None):
+        """Forget one cached element, or all of them"""
+        if locator is None:
+            self._element_cache.clear()
+        else:
+            self._element_cache.pop(locator, None)
+
+    def _retry_if_stale(self, locator, action):
+        """Run action; with the element cache, look the element up again once if it went stale"""
+        try:
+            return action()
+        except StaleElementReferenceException:
+            if not self.cache_elements:
+                raise
+            self.logger.info("Cached element went stale, looking it up again: %s", locator)
+            self.invalidate_element_cache(locator)
+            return action()
+
     def find_elements(self, locator):
         """
         Find all elements matching the locator
@@ -36,37 +636,75 @@ class BasePage:
         """
         try:
             elements = self.wait.until(EC.presence_of_all_elements_located(locator))
-            self.logger.info(f"Found elements: {locator}")
+            self.logger.info("Found elements: %s", locator)
             return elements
         except TimeoutException:
-            self.logger.error(f"Failed to find elements: {locator}")
+            self.logger.error("Failed to find elements: %s", locator)
             raise
 
     def click_element(self, locator):
-        """Find element, scroll to it, wait for it to be clickable, and click it"""
-        try:
+        """Wait until the element can be clicked (visible, enabled, in view, not moving or covered) and click it"""
+        def click():
+            if not self.static_waits:
+                # All actionability checks run in the page in one call
+                self.wait_until_actionable(locator).click()
+                return
+            
             # Find element first
-            element = self.find_element(locator)
+            element = self._find_retryable(locator)
             
             # Scroll element into view
             self.scroll_to_element(element)
             
-            # Wait for element to be clickable after scrolling
+            # Wait for element to be clickable after scrolling; the cached
+            # handle can be checked directly instead of looking it up again
             clickable_element = self.wait.until(
-                EC.element_to_be_clickable(locator)
+                EC.element_to_be_clickable(element if self.cache_elements else locator)
             )
             
-            time.sleep(1)
+            self.pause(1, clickable_element)
             clickable_element.click()
-            self.logger.info(f"Clicked element: {locator}")
+        
+        try:
+            self._retry_if_stale(locator, click)
+            self.logger.info("Clicked element: %s", locator)
             
         except TimeoutException:
-            self.logger.error(f"Element not clickable: {locator}")
+            self.logger.error("Element not clickable: %s", locator)
             raise
         except Exception as e:
-            self.logger.error(f"Failed to click element {locator}: {str(e)}")
+            self.logger.error("Failed to click element %s: %s", locator, e)
             raise
 
+    def wait_until_actionable(self, locator, timeout=10):
+        """
+        Wait in the page until the element is attached, visible, enabled, scrolled
+        into view, no longer moving and not covered by another element at its center
+        :param locator: tuple of locator strategy and value
+        :param timeout: time to wait in seconds
+        :return: the element, ready for a WebDriver click
+        """
+        # The script only reuses the cached element if the page's DOM generation still matches
+        cached, generation = self._element_cache.get(locator, (None, None)) if self.cache_elements else (None, None)
+        with locator_context(locator):
+            try:
+                result = self.driver.execute_async_script(
+                    ACTIONABILITY_SCRIPT, list(locator), self.SETTLE_QUIET_FRAMES, int(timeout * 1000),
+                    cached, generation
+                )
+            except StaleElementReferenceException:
+                self._element_cache.pop(locator, None)
+                result = self.driver.execute_async_script(
+                    ACTIONABILITY_SCRIPT, list(locator), self.SETTLE_QUIET_FRAMES, int(timeout * 1000),
+                    None, None
+                )
+        if not result["ok"]:
+            raise TimeoutException(f"Element {result['reason']}: {locator}")
+        self._dom_generation = result["generation"]
+        if self.cache_elements:
+            self._element_cache[locator] = (result["element"], self._dom_generation)
+        return result["element"]
+
     def enhanced_clear(self, element):
         """Enhanced clear method that uses multiple clearing techniques"""
         try:
@@ -90,42 +728,79 @@ class BasePage:
                 
             self.logger.info("Input field cleared")
         except Exception as e:
-            self.logger.error(f"Failed to clear element: {str(e)}")
+            self.logger.error("Failed to clear element: %s", e)
             raise
             
-    def input_text(self, locator, text):
-        """Wait for element to be clickable, scroll to it, and input text"""
-        try:
-            element = self.wait.until(
-                EC.element_to_be_clickable(locator)
-            )
+    def input_text(self, locator, text, fast=None):
+        """
+        Wait for element to be clickable, scroll to it, and input text
+        :param fast: set the value with one script (True) or type it key by key (False);
+            defaults to the page's fast_input setting
+        """
+        if self.fast_input if fast is None else fast:
+            if self.set_field_value(locator, text):
+                return
+            self.logger.warning("Field did not keep the value set by script, typing it instead: %s", locator)
+        
+        def type_text():
+            if self.cache_elements:
+                element = self.wait.until(EC.element_to_be_clickable(self._find_retryable(locator)))
+            else:
+                element = self.wait.until(
+                    EC.element_to_be_clickable(locator)
+                )
             # Scroll element into view before interacting
             self.scroll_to_element(element)
-            time.sleep(1)
+            if self.static_waits:
+                time.sleep(1)
             # Use enhanced clear instead of simple clear
             self.enhanced_clear(element)
-            time.sleep(1)
+            if self.static_waits:
+                time.sleep(1)
             element.send_keys(text)
-            self.logger.info(f"Input text '{text}' into element: {locator}")
+        
+        try:
+            self._retry_if_stale(locator, type_text)
+            self.logger.info("Input text '%s' into element: %s", text, locator)
         except TimeoutException:
-            self.logger.error(f"Element not clickable for text input: {locator}")
+            self.logger.error("Element not clickable for text input: %s", locator)
             raise
         except Exception as e:
-            self.logger.error(f"Failed to input text into element {locator}: {str(e)}")
+            self.logger.error("Failed to input text into element %s: %s", locator, e)
             raise
 
+    def set_field_value(self, locator, text, timeout=10):
+        """
+        Set an input's value in one round trip, firing the events a user's typing would
+        :param locator: tuple of locator strategy and value
+        :param timeout: time to wait for the field to become editable
+        :return: True if the field kept the value, False if the page changed it (e.g. an input mask)
+        """
+        with locator_context(locator):
+            result = self.driver.execute_async_script(FAST_INPUT_SCRIPT, *locator, str(text), int(timeout * 1000))
+        if not result["ok"]:
+            self.logger.error("Element %s for text input: %s", result["reason"], locator)
+            raise TimeoutException(f"Element {result['reason']}: {locator}")
+        if result["value"] != str(text):
+            return False
+        self.logger.info("Set value '%s' of element: %s", text, locator)
+        return True
+
     def get_text(self, locator):
         """
         Get text from element
         :param locator: tuple of locator strategy and value
         """
         try:
-            element = self.wait.until(EC.presence_of_element_located(locator))
-            text = element.text
-            self.logger.info(f"Got text '{text}' from element: {locator}")
+            if self.cache_elements:
+                text = self._retry_if_stale(locator, lambda: self._find_retryable(locator).text)
+            else:
+                element = self.wait.until(EC.presence_of_element_located(locator))
+                text = element.text
+            self.logger.info("Got text '%s' from element: %s", text, locator)
             return text
         except TimeoutException:
-            self.logger.error(f"Failed to get text from element: {locator}")
+            self.logger.error("Failed to get text from element: %s", locator)
             raise
 
     def is_element_visible(self, locator, timeout=10):
@@ -136,10 +811,10 @@ class BasePage:
         """
         try:
             self.wait.until(EC.visibility_of_element_located(locator))
-            self.logger.info(f"Element is visible: {locator}")
+            self.logger.info("Element is visible: %s", locator)
             return True
         except TimeoutException:
-            self.logger.error(f"Element is not visible: {locator}")
+            self.logger.error("Element is not visible: %s", locator)
             return False
 
     def is_element_present(self, locator, timeout=10):
@@ -150,10 +825,10 @@ class BasePage:
         """
         try:
             self.wait.until(EC.presence_of_element_located(locator))
-            self.logger.info(f"Element is present: {locator}")
+            self.logger.info("Element is present: %s", locator)
             return True
         except TimeoutException:
-            self.logger.error(f"Element is not present: {locator}")
+            self.logger.error("Element is not present: %s", locator)
             return False
 
     def wait_for_element_to_disappear(self, locator, timeout=10):
@@ -164,10 +839,10 @@ class BasePage:
         """
         try:
             self.wait.until(EC.invisibility_of_element_located(locator))
-            self.logger.info(f"Element disappeared: {locator}")
+            self.logger.info("Element disappeared: %s", locator)
             return True
         except TimeoutException:
-            self.logger.error(f"Element did not disappear: {locator}")
+            self.logger.error("Element did not disappear: %s", locator)
             return False
 
     def get_attribute(self, locator, attribute):
@@ -177,14 +852,64 @@ class BasePage:
         :param attribute: attribute name
         """
         try:
-            element = self.find_element(locator)
-            value = element.get_attribute(attribute)
-            self.logger.info(f"Got attribute '{attribute}' with value '{value}' from element: {locator}")
+            value = self._retry_if_stale(locator, lambda: self._find_retryable(locator).get_attribute(attribute))
+            self.logger.info("Got attribute '%s' with value '%s' from element: %s", attribute, value, locator)
             return value
         except Exception as e:
-            self.logger.error(f"Failed to get attribute '{attribute}' from element: {locator}")
+            self.logger.error("Failed to get attribute '%s' from element: %s", attribute, locator)
             raise
 
+    def locators(self, *names):
+        """
+        Registered locators of this page, for bulk operations such as read_elements
+        :param names: locator names (e.g. "FIRST_NAME_INPUT"); all locators if omitted
+        :return: dict of name -> locator tuple
+        """
+        registered = LOCATORS.for_page(type(self))
+        if not names:
+            return registered
+        return {name: registered[name] for name in names}
+
+    def read_elements(self, locators, properties=("value", "text", "visible", "enabled"), attributes=()):
+        """
+        Read several elements in a single round trip
+        :param locators: dict of name -> locator tuple
+        :param properties: any of "value", "text", "visible", "enabled"
+        :param attributes: attribute names to read from every element
+        :return: dict of name -> {"found": bool, <property>: ..., "attributes": {...}}
+        """
+        try:
+            result = self.driver.execute_script(
+                READ_ELEMENTS_SCRIPT,
+                {name: list(locator) for name, locator in locators.items()},
+                list(properties),
+                list(attributes)
+            )
+            self.logger.info("Read %s elements: %s", len(locators), list(locators))
+            return result
+        except Exception as e:
+            self.logger.error("Failed to read elements %s: %s", list(locators), e)
+            raise
+
+    def are_elements_visible(self, locators, timeout=10):
+        """
+        Wait until all elements are visible, checking them together on every poll
+        :param locators: dict of name -> locator tuple
+        :param timeout: time to wait for elements
+        """
+        try:
+            self.wait_for_condition(timeout=timeout).until(
+                lambda driver: all(
+                    entry.get("visible")
+                    for entry in self.read_elements(locators, properties=("visible",)).values()
+                )
+            )
+            self.logger.info("Elements are visible: %s", list(locators))
+            return True
+        except TimeoutException:
+            self.logger.error("Elements are not visible: %s", list(locators))
+            return False
+
     def hover_over_element(self, locator):
         """
         Hover over element
@@ -193,14 +918,20 @@ class BasePage:
         try:
             element = self.find_element(locator)
             self.actions.move_to_element(element).perform()
-            self.logger.info(f"Hovered over element: {locator}")
+            self.logger.info("Hovered over element: %s", locator)
         except Exception as e:
-            self.logger.error(f"Failed to hover over element: {locator}")
+            self.logger.error("Failed to hover over element: %s", locator)
             raise
 
     def scroll_to_element(self, element):
         """Scroll element into middle of the viewport"""
         try:
+            if not self.static_waits:
+                # Scroll and wait for the page to settle in a single call
+                self.wait_for_page_to_settle(element, scroll=True)
+                self.logger.info("Scrolled element to middle of viewport")
+                return
+
             # Get the height of the viewport
             viewport_height = self.driver.execute_script("return window.innerHeight")
             # Calculate the scroll position to center the element
@@ -215,7 +946,7 @@ class BasePage:
             time.sleep(1)
             self.logger.info("Scrolled element to middle of viewport")
         except Exception as e:
-            self.logger.error(f"Failed to scroll to element: {str(e)}")
+            self.logger.error("Failed to scroll to element: %s", e)
             raise
 
     def switch_to_frame(self, locator):
@@ -225,10 +956,10 @@ class BasePage:
         """
         try:
             frame = self.wait.until(EC.frame_to_be_available_and_switch_to_it(locator))
-            self.logger.info(f"Switched to frame: {locator}")
+            self.logger.info("Switched to frame: %s", locator)
             return frame
         except TimeoutException:
-            self.logger.error(f"Failed to switch to frame: {locator}")
+            self.logger.error("Failed to switch to frame: %s", locator)
             raise
 
     def switch_to_default_content(self):
@@ -265,30 +996,85 @@ class BasePage:
         try:
             # Refresh the page
             self.driver.refresh()
+            self.invalidate_element_cache()
             
-            # Static wait for page load
-            time.sleep(wait_time)
+            if self.static_waits:
+                # Static wait for page load
+                time.sleep(wait_time)
+            else:
+                self.wait.until(
+                    lambda driver: driver.execute_script("return document.readyState") == "complete"
+                )
             
             # Wait for element to be present
             element = self.wait.until(
                 EC.presence_of_element_located(locator)
             )
             
-            self.logger.info(f"Page refreshed and element found: {locator}")
+            self.logger.info("Page refreshed and element found: %s", locator)
             return element
             
         except TimeoutException:
-            self.logger.error(f"Element not found after refresh: {locator}")
+            self.logger.error("Element not found after refresh: %s", locator)
             raise
         except Exception as e:
-            self.logger.error(f"Error refreshing page and finding element: {str(e)}")
+            self.logger.error("Error refreshing page and finding element: %s", e)
             raise
 
+    def wait_for_page_to_settle(self, element=None, scroll=False, timeout=None):
+        """
+        Wait until scrolling, CSS transitions/animations and layout have finished
+        :param element: optional element whose bounding box must also be stable
+        :param scroll: scroll the element into the middle of the viewport first
+        :param timeout: maximum time to wait in seconds
+        :return: True if the page settled, False if the timeout was reached
+        """
+        timeout = self.SETTLE_TIMEOUT if timeout is None else timeout
+        settled, self._dom_generation = self.driver.execute_async_script(
+            SETTLE_SCRIPT, element, self.SETTLE_QUIET_FRAMES, int(timeout * 1000), scroll
+        )
+        if not settled:
+            self.logger.warning("Page did not settle within %ss", timeout)
+        return settled
+
+    def pause(self, seconds, element=None):
+        """
+        Give the page time to finish reacting to the last interaction
+        :param seconds: fixed sleep used when static waits are enabled
+        :param element: optional element that must stop moving before continuing
+        """
+        if self.static_waits:
+            time.sleep(seconds)
+        else:
+            self.wait_for_page_to_settle(element)
+
     def wait_for_condition(self, timeout=10, poll_frequency=0.5):
         """
         Create a new WebDriverWait instance with custom timeout
         :param timeout: time to wait in seconds
-        :param poll_frequency: how often to poll in seconds
-        :return: WebDriverWait instance
+        :param poll_frequency: how often to poll in seconds (for conditions that are not evaluated in the page)
+        :return: BrowserWait, or WebDriverWait when in-page waits are disabled
+        """
+        wait_class = BrowserWait if self.in_page_waits else WebDriverWait
+        return wait_class(self.driver, timeout, poll_frequency=poll_frequency)
+
+    def wait_for_any(self, conditions, timeout=10, poll_frequency=0.5):
         """
-        return WebDriverWait(self.driver, timeout, poll_frequency=poll_frequency)
+        Wait for whichever of several outcomes happens first
+        :param conditions: dict of name -> expected condition (e.g. {"success": EC.visibility_of_element_located(...)})
+        :param timeout: time to wait in seconds
+        :param poll_frequency: how often to poll in seconds (for conditions that are not evaluated in the page)
+        :return: (name, value) of the first condition that held, or (None, None) on timeout
+        """
+        names = list(conditions)
+        methods = [conditions[name] for name in names]
+        try:
+            if self.in_page_waits:
+                index, value = BrowserWait(self.driver, timeout, poll_frequency=poll_frequency).until_any(methods)
+            else:
+                index, value = poll_any(self.driver, methods, timeout, poll_frequency)
+        except TimeoutException:
+            self.logger.warning("None of %s happened within %ss", names, timeout)
+            return None, None
+        self.logger.info("Wait ended with: %s", names[index])
+        return names[index], value
@@ -1,7 +1,65 @@
-from pages.BasePage import BasePage  # Direct import since files are in same directory
+from pages.BasePage import BasePage, FIND_ELEMENT_JS  # Direct import since files are in same directory
+from pages.locators import register_locators
 from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException
 import time
 
+# Empties the inputs through the native value setter (so React state follows)
+RESET_FORM_SCRIPT = FIND_ELEMENT_JS + """
+    var inputs = [findElement(arguments[0], arguments[1]), findElement(arguments[2], arguments[3])];
+    var setValue = Object.getOwnPropertyDescriptor(HTMLInputElement.prototype, 'value').set;
+    inputs.forEach(function (input) {
+        if (!input) {
+            return;
+        }
+        setValue.call(input, '');
+        input.dispatchEvent(new Event('input', {bubbles: true}));
+        input.dispatchEvent(new Event('change', {bubbles: true}));
+    });
+"""
+
+# Marks the current error message as stale and counts mutations of the error
+# element from now on, so an error the app re-renders into the same node is
+# told apart from the message of the previous submit
+WATCH_ERROR_SCRIPT = FIND_ELEMENT_JS + """
+    var by = arguments[0];
+    var value = arguments[1];
+    var error = findElement(by, value);
+    if (error) {
+        error.__pomStale = true;
+    }
+    if (window.__pomErrorObserver) {
+        window.__pomErrorObserver.disconnect();
+    }
+    window.__pomErrorMutations = 0;
+    window.__pomErrorObserver = new MutationObserver(function (records) {
+        var current = findElement(by, value);
+        if (!current) {
+            return;
+        }
+        var touched = records.some(function (record) {
+            return current.contains(record.target) || Array.prototype.some.call(record.addedNodes, function (node) {
+                return node.contains(current);
+            });
+        });
+        if (touched) {
+            window.__pomErrorMutations++;
+        }
+    });
+    window.__pomErrorObserver.observe(document, {childList: true, subtree: true, characterData: true, attributes: true});
+"""
+
+# Text of a visible error message rendered since WATCH_ERROR_SCRIPT ran, or null
+READ_ERROR_SCRIPT = FIND_ELEMENT_JS + """
+    var error = findElement(arguments[0], arguments[1]);
+    if (!error || !isVisible(error) || (error.__pomStale && !window.__pomErrorMutations)) {
+        return null;
+    }
+    return error.innerText.trim() || null;
+"""
+
+@register_locators
 class LoginPage(BasePage):
     # Locators
     USERNAME_INPUT = (By.XPATH, "//input[@placeholder='email']")
@@ -28,12 +86,42 @@ class LoginPage(BasePage):
         """Get error message text if present"""
         try:
             error_text = self.get_text(self.ERROR_MESSAGE)
-            self.logger.warning(f"Login error detected: {error_text}")
+            self.logger.warning("Login error detected: %s", error_text)
             return error_text
         except Exception as e:
             self.logger.info("No error message found")
             return ""
     
+    def reset_form(self):
+        """Clear the inputs in place, instead of reloading the page"""
+        self.driver.execute_script(RESET_FORM_SCRIPT, *self.USERNAME_INPUT, *self.PASSWORD_INPUT)
+        self.logger.info("Login form reset")
+        return self
+
+    def submit(self, username, password, timeout=5):
+        """
+        Fill in and submit the form, then read the error it produced. For
+        batches of validation cases on one page load, with reset_form() in
+        between; use login() for a real login.
+        :param timeout: time to wait for a new error message
+        :return: the error message rendered after this submit
+        :raises TimeoutException: if no new error message appeared; the message
+            of a previous submit is never returned
+        """
+        self.enter_username(username)
+        self.enter_password(password)
+        self.driver.execute_script(WATCH_ERROR_SCRIPT, *self.ERROR_MESSAGE)
+        self.click_login_button()
+        try:
+            error_text = self.wait_for_condition(timeout=timeout, poll_frequency=0.1).until(
+                lambda driver: driver.execute_script(READ_ERROR_SCRIPT, *self.ERROR_MESSAGE)
+            )
+        except TimeoutException:
+            self.logger.error("No new error message within %ss", timeout)
+            raise TimeoutException(f"No new login error message within {timeout}s")
+        self.logger.warning("Login error detected: %s", error_text)
+        return error_text
+
     def login(self, username, password, max_attempts=2, wait_between_attempts=1):
         """
         Perform login action with verification and retry mechanism
@@ -42,7 +130,7 @@ class LoginPage(BasePage):
         :param max_attempts: Maximum number of attempts to verify login page is displayed
         :param wait_between_attempts: Wait time between attempts in seconds
         """
-        self.logger.info(f"Attempting to login with username: {username}")
+        self.logger.info("Attempting to login with username: %s", username)
         
         # Verify login page is fully loaded before proceeding
         login_page_loaded = False
@@ -50,14 +138,14 @@ class LoginPage(BasePage):
         
         while attempt < max_attempts and not login_page_loaded:
             attempt += 1
-            self.logger.info(f"Verifying login page is displayed (attempt {attempt}/{max_attempts})")
+            self.logger.info("Verifying login page is displayed (attempt %s/%s)", attempt, max_attempts)
             login_page_loaded = self.is_login_page_displayed()
             
             if login_page_loaded:
                 self.logger.info("Login page verified, proceeding with login")
                 break
             elif attempt < max_attempts:
-                self.logger.warning(f"Login page not fully loaded, waiting {wait_between_attempts}s before retry")
+                self.logger.warning("Login page not fully loaded, waiting %ss before retry", wait_between_attempts)
                 time.sleep(wait_between_attempts)
                 # Try refreshing the page if it's not loaded correctly
                 if attempt > 1:
@@ -65,46 +153,51 @@ class LoginPage(BasePage):
                     self.driver.refresh()
         
         if not login_page_loaded:
-            self.logger.error(f"Failed to verify login page after {max_attempts} attempts")
+            self.logger.error("Failed to verify login page after %s attempts", max_attempts)
             # Take screenshot for debugging
             try:
                 timestamp = time.strftime("%Y%m%d-%H%M%S")
                 screenshot_path = f"reports/screenshots/login_page_error_{timestamp}.png"
                 self.driver.save_screenshot(screenshot_path)
-                self.logger.info(f"Error screenshot saved to {screenshot_path}")
+                self.logger.info("Error screenshot saved to %s", screenshot_path)
             except Exception as e:
-                self.logger.error(f"Failed to save error screenshot: {str(e)}")
+                self.logger.error("Failed to save error screenshot: %s", e)
             
             return self
         
         # Proceed with login
+        login_url = self.driver.current_url
         self.enter_username(username)
         self.enter_password(password)
         self.click_login_button()
         
-        # Check if we got redirected (success) or if we have an error message
+        # Wait for a redirect (success) or an error message, whichever comes first
+        outcome, _ = self.wait_for_any({
+            "redirected": EC.url_changes(login_url),
+            "error": EC.visibility_of_element_located(self.ERROR_MESSAGE)
+        }, timeout=10)
         current_url = self.driver.current_url
-        self.logger.info(f"After login attempt, current URL: {current_url}")
+        self.logger.info("After login attempt, current URL: %s", current_url)
         
-        if "login" not in current_url.lower():
+        if outcome == "redirected" and "login" not in current_url.lower():
             self.logger.info("Login successful - redirected away from login page")
+        elif outcome == "error":
+            self.logger.warning("Login failed with error: %s", self.get_error_message())
         else:
-            error = self.get_error_message()
-            if error:
-                self.logger.warning(f"Login failed with error: {error}")
-            else:
-                self.logger.warning("Login failed without specific error message")
+            self.logger.warning("Login failed without specific error message")
         
         return self
 
     def is_login_page_displayed(self):
         """Check if login page is displayed"""
-        username_visible = self.is_element_visible(self.USERNAME_INPUT)
-        password_visible = self.is_element_visible(self.PASSWORD_INPUT)
+        displayed = self.are_elements_visible({
+            "username": self.USERNAME_INPUT,
+            "password": self.PASSWORD_INPUT
+        })
         
-        if username_visible and password_visible:
+        if displayed:
             self.logger.info("Login page is displayed")
         else:
             self.logger.warning("Login page elements not fully visible")
             
-        return username_visible and password_visible
\ No newline at end of file
+        return displayed
\ No newline at end of file
@@ -1,11 +1,10 @@
 from .BasePage import BasePage
+from .locators import register_locators
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 import os
-import requests
-import io
-import time
 
+@register_locators
 class ProfilePage(BasePage):
     # Locators
     FIRST_NAME_INPUT = (By.XPATH, "//input[@placeholder='Add your first name']")
@@ -26,33 +25,91 @@ class ProfilePage(BasePage):
     SAVE_PROFILE_BTN = (By.XPATH, "//button[@type='button' and @class='chakra-button css-1rpa6kk' and contains(., 'Save')]")
     CONFIRM_YES_BTN = (By.XPATH, "//button[@type='button' and contains(@class, 'css-134g1j9') and normalize-space()='Continue']")
     
-    def change_username(self, first_name, last_name):
-        """Change user's first and last name"""
+    SAVE_PROFILE_METHODS = ("PUT", "POST", "PATCH")
+    # Saves answer within a second; a pattern that never matches should not cost more than this
+    SAVE_RESPONSE_TIMEOUT = 3
+    
+    def __init__(self, driver, save_api=None, **kwargs):
+        """
+        :param save_api: regular expression matching the URL of the request that saves
+            name and URL changes (SiteUrls.profile_save_api); without it saves are verified by reloading
+        """
+        super().__init__(driver, **kwargs)
+        self.save_api = save_api
+    
+    def wait_for_profile_save(self, expected):
+        """
+        Wait for the profile save request to finish and check its status and payload
+        :param expected: field -> value that the saved profile must contain
+        :return: True/False, or None if no save response was captured (fall back to a reload)
+        """
+        if not self.save_api or not self.network.available:
+            return None
+        response = self.network.wait_for_response(
+            self.save_api, methods=self.SAVE_PROFILE_METHODS, timeout=self.SAVE_RESPONSE_TIMEOUT
+        )
+        if response is None:
+            self.logger.warning("No profile save response captured")
+            return None
+        if not response.ok:
+            self.logger.error("Profile save failed with status %s", response.status)
+            return False
+        try:
+            saved = self.network.response_body(response)
+        except Exception as e:
+            self.logger.debug("Could not read profile save response body: %s", e)
+            return True
+        if isinstance(saved, dict):
+            mismatched = {field: saved[field] for field, value in expected.items()
+                          if field in saved and saved[field] != value}
+            if mismatched:
+                self.logger.error("Profile save returned %s, expected %s", mismatched, expected)
+                return False
+        return True
+    
+    def change_username(self, first_name, last_name, deep_verify=False):
+        """
+        Change user's first and last name
+        :param deep_verify: also reload the page and read the inputs back
+        """
         try:
             # Input new names
             self.input_text(self.FIRST_NAME_INPUT, first_name)
             self.input_text(self.LAST_NAME_INPUT, last_name)
             
             # Click only if button is enabled
+            self.network.clear()
             self.click_element(self. SAVE_ACCOUNT_BTN)
             
+            # Trust the save response unless asked to reload
+            saved = self.wait_for_profile_save({"first_name": first_name, "last_name": last_name})
+            if saved is False:
+                return False
+            if saved and not deep_verify:
+                self.logger.info("Successfully changed username to: %s %s", first_name, last_name)
+                return True
+            
             # Use refresh_and_wait_element
             self.refresh_and_wait_element(self.FIRST_NAME_INPUT)
             
             # Get current values after refresh
-            current_first_name = self.find_element(self.FIRST_NAME_INPUT).get_attribute("value")
-            current_last_name = self.find_element(self.LAST_NAME_INPUT).get_attribute("value")
+            fields = self.read_elements({
+                "first_name": self.FIRST_NAME_INPUT,
+                "last_name": self.LAST_NAME_INPUT
+            }, properties=("value",))
+            current_first_name = fields["first_name"].get("value")
+            current_last_name = fields["last_name"].get("value")
             
             # Verify values match what was input
             if current_first_name == first_name and current_last_name == last_name:
-                self.logger.info(f"Successfully changed username to: {first_name} {last_name}")
+                self.logger.info("Successfully changed username to: %s %s", first_name, last_name)
                 return True
             else:
-                self.logger.error(f"Username change failed. Expected: {first_name} {last_name}, Got: {current_first_name} {current_last_name}")
+                self.logger.error("Username change failed. Expected: %s %s, Got: %s %s", first_name, last_name, current_first_name, current_last_name)
                 return False
                 
         except Exception as e:
-            self.logger.error(f"Failed to change username: {str(e)}")
+            self.logger.error("Failed to change username: %s", e)
             raise
 
     def handle_edit_image_popup(self):
@@ -65,7 +122,7 @@ class ProfilePage(BasePage):
             self.logger.info("Successfully confirmed image edit")
             return True
         except Exception as e:
-            self.logger.error(f"Failed to handle Edit Image popup: {str(e)}")
+            self.logger.error("Failed to handle Edit Image popup: %s", e)
             raise
 
     def upload_profile_image(self, image_path):
@@ -80,34 +137,31 @@ class ProfilePage(BasePage):
             if not self.handle_edit_image_popup():
                 return False
                 
-            # Toast detection with appropriate timeout
-            try:
-                # Use longer wait time for toast to appear
-                wait_long = self.wait_for_condition(timeout=10)
-                
-                # Wait for success toast - this is the only reliable verification
-                wait_long.until(EC.visibility_of_element_located(self.SUCCESS_TOAST))
+            # Whichever toast shows up first decides the outcome
+            outcome, _ = self.wait_for_any({
+                "success": EC.visibility_of_element_located(self.SUCCESS_TOAST),
+                "error": EC.visibility_of_element_located(self.ERROR_TOAST)
+            }, timeout=10)
+            
+            if outcome == "success":
                 success_message = self.find_element(self.SUCCESS_TOAST_MESSAGE).text
-                self.logger.info(f"Success toast displayed: {success_message}")
+                self.logger.info("Success toast displayed: %s", success_message)
                 return True
-            except Exception:
-                # Check for error toast to provide better diagnostics
-                try:
-                    wait_long = self.wait_for_condition(timeout=5)
-                    wait_long.until(EC.visibility_of_element_located(self.ERROR_TOAST))
-                    error_message = self.find_element(self.ERROR_TOAST_MESSAGE).text
-                    self.logger.error(f"Error toast displayed: {error_message}")
-                    
-                    # Handle specific error cases with more detailed logging
-                    if "limit exceeded" in error_message.lower():
-                        self.logger.error("Upload failed due to limit exceeded")
-                except Exception:
-                    self.logger.error("No success or error toast detected - image upload likely failed")
+            
+            if outcome == "error":
+                error_message = self.find_element(self.ERROR_TOAST_MESSAGE).text
+                self.logger.error("Error toast displayed: %s", error_message)
                 
-                return False
+                # Handle specific error cases with more detailed logging
+                if "limit exceeded" in error_message.lower():
+                    self.logger.error("Upload failed due to limit exceeded")
+            else:
+                self.logger.error("No success or error toast detected - image upload likely failed")
+            
+            return False
                 
         except Exception as e:
-            self.logger.error(f"Failed to upload profile image: {str(e)}")
+            self.logger.error("Failed to upload profile image: %s", e)
             raise
 
     def handle_confirmation_dialog(self):
@@ -120,33 +174,45 @@ class ProfilePage(BasePage):
             self.logger.info("Successfully confirmed dialog")
             return True
         except Exception as e:
-            self.logger.error(f"Failed to handle confirmation dialog: {str(e)}")
+            self.logger.error("Failed to handle confirmation dialog: %s", e)
             raise
 
-    def change_profile_url(self, new_url):
-        """Change public profile URL"""
+    def change_profile_url(self, new_url, deep_verify=False):
+        """
+        Change public profile URL
+        :param deep_verify: also reload the page and read the input back
+        """
         try:
             self.input_text(self.URL_INPUT, new_url)
+            self.network.clear()
             self.click_element(self.SAVE_PROFILE_BTN)
             
             # Handle confirmation dialog
             if not self.handle_confirmation_dialog():
                 return False
             
+            # Trust the save response unless asked to reload
+            saved = self.wait_for_profile_save({"url": new_url})
+            if saved is False:
+                return False
+            if saved and not deep_verify:
+                self.logger.info("Successfully changed profile URL to: %s", new_url)
+                return True
+            
             # Refresh and wait for profile URL to load
             self.refresh_and_wait_element(self.URL_INPUT)
             
             # Verify URL value after refresh
             current_url = self.find_element(self.URL_INPUT).get_attribute("value")
             if current_url == new_url:
-                self.logger.info(f"Successfully changed and verified profile URL to: {new_url}")
+                self.logger.info("Successfully changed and verified profile URL to: %s", new_url)
                 return True
             else:
                 self.logger.error("Profile URL change did not persist after refresh")
                 return False
                 
         except Exception as e:
-            self.logger.error(f"Failed to change profile URL: {str(e)}")
+            self.logger.error("Failed to change profile URL: %s", e)
             raise
 
     def is_profile_page_loaded(self):
@@ -0,0 +1,222 @@
+"""
+Locator registry
+----------------
+Page classes declare their locators as usual class-level (By, value) tuples
+and are decorated with ``@register_locators``. At import time every locator
+is syntax-checked, and simple attribute-only XPath expressions are compiled
+to equivalent CSS selectors, which Chrome evaluates faster. XPath is kept
+for anything CSS cannot express (text matching, normalize-space(), axes...).
+"""
+
+import re
+from selenium.webdriver.common.by import By
+
+try:
+    from lxml import etree
+except ImportError:  # lxml is optional; a basic bracket/quote check is used instead
+    etree = None
+
+STRATEGIES = {value for name, value in vars(By).items() if name.isupper()}
+
+# Conditions inside an XPath predicate that have a CSS equivalent
+ATTRIBUTE_EQUALS = re.compile(r"@([\w-]+)\s*=\s*(['\"])(.*?)\2")
+ATTRIBUTE_CONTAINS = re.compile(r"contains\(\s*@([\w-]+)\s*,\s*(['\"])(.*?)\2\s*\)")
+ATTRIBUTE_STARTS_WITH = re.compile(r"starts-with\(\s*@([\w-]+)\s*,\s*(['\"])(.*?)\2\s*\)")
+TAG = re.compile(r"[a-zA-Z][\w-]*|\*")
+IDENTIFIER = re.compile(r"[a-zA-Z_][\w-]*")
+
+class LocatorError(ValueError):
+    """A locator that is malformed or uses an unknown strategy"""
+
+def _scan(expression, separators):
+    """
+    Split an expression on top-level separators, ignoring anything inside
+    quotes, brackets or parentheses
+    :return: list of (separator before the part, part), or None if unbalanced
+    """
+    parts = []
+    depth = 0
+    quote = None
+    start = 0
+    separator = ""
+    i = 0
+    while i < len(expression):
+        char = expression[i]
+        if quote:
+            if char == quote:
+                quote = None
+        elif char in "'\"":
+            quote = char
+        elif char in "[(":
+            depth += 1
+        elif char in "])":
+            depth -= 1
+            if depth < 0:
+                return None
+        elif depth == 0:
+            matched = next((s for s in separators if expression.startswith(s, i)), None)
+            if matched:
+                parts.append((separator, expression[start:i]))
+                separator = matched
+                i += len(matched)
+                start = i
+                continue
+        i += 1
+    if quote or depth:
+        return None
+    parts.append((separator, expression[start:]))
+    return parts
+
+def _closing_bracket(expression, start):
+    """Index of the "]" closing the "[" at ``start``, or -1"""
+    depth = 0
+    quote = None
+    for i in range(start, len(expression)):
+        char = expression[i]
+        if quote:
+            if char == quote:
+                quote = None
+        elif char in "'\"":
+            quote = char
+        elif char == "[":
+            depth += 1
+        elif char == "]":
+            depth -= 1
+            if depth == 0:
+                return i
+    return -1
+
+def _css_string(value):
+    return "'" + value.replace("\\", "\\\\").replace("'", "\\'") + "'"
+
+def _condition_to_css(condition):
+    condition = condition.strip()
+    match = ATTRIBUTE_EQUALS.fullmatch(condition)
+    if match:
+        name, value = match.group(1), match.group(3)
+        if name == "id" and IDENTIFIER.fullmatch(value):
+            return f"#{value}"
+        return f"[{name}={_css_string(value)}]"
+    match = ATTRIBUTE_CONTAINS.fullmatch(condition)
+    if match:
+        return f"[{match.group(1)}*={_css_string(match.group(3))}]"
+    match = ATTRIBUTE_STARTS_WITH.fullmatch(condition)
+    if match:
+        return f"[{match.group(1)}^={_css_string(match.group(3))}]"
+    return None
+
+def _step_to_css(step):
+    bracket = step.find("[")
+    tag = step if bracket == -1 else step[:bracket]
+    if not TAG.fullmatch(tag):
+        return None
+    css = "" if tag == "*" else tag
+    rest = "" if bracket == -1 else step[bracket:]
+    while rest:
+        end = _closing_bracket(rest, 0) if rest.startswith("[") else -1
+        if end == -1:
+            return None
+        body = rest[1:end]
+        rest = rest[end + 1:]
+        conditions = _scan(body, [" and "])
+        if conditions is None or any(" or " in c for _, c in conditions):
+            return None
+        for _, condition in conditions:
+            selector = _condition_to_css(condition)
+            if selector is None:
+                return None
+            css += selector
+    return css or "*"
+
+def xpath_to_css(xpath):
+    """
+    Compile an XPath expression to an equivalent CSS selector
+    :return: the CSS selector, or None if the expression has no CSS equivalent
+    """
+    steps = _scan(xpath.strip(), ["//", "/"])
+    if not steps or steps[0] != ("", "") or steps[1][0] != "//":
+        return None
+    selectors = []
+    for separator, step in steps[1:]:
+        css = _step_to_css(step.strip())
+        if css is None:
+            return None
+        selectors.append(css if separator == "//" or not selectors else f"> {css}")
+    return " ".join(selectors)
+
+def validate_locator(locator):
+    """
+    Check a (By, value) locator for obvious syntax errors
+    :raises LocatorError: if the locator cannot be used
+    """
+    if not (isinstance(locator, tuple) and len(locator) == 2):
+        raise LocatorError(f"Locator must be a (By, value) tuple: {locator!r}")
+    strategy, value = locator
+    if strategy not in STRATEGIES:
+        raise LocatorError(f"Unknown locator strategy {strategy!r} in {locator!r}")
+    if not isinstance(value, str) or not value.strip():
+        raise LocatorError(f"Empty locator value in {locator!r}")
+    if strategy in (By.XPATH, By.CSS_SELECTOR) and _scan(value, []) is None:
+        raise LocatorError(f"Unbalanced quotes or brackets in {locator!r}")
+    if strategy == By.XPATH and etree is not None:
+        try:
+            etree.XPath(value)
+        except etree.XPathSyntaxError as e:
+            raise LocatorError(f"Invalid XPath in {locator!r}: {e}") from None
+
+def compile_locator(locator):
+    """Return an equivalent CSS locator where possible, otherwise the locator unchanged"""
+    strategy, value = locator
+    if strategy == By.XPATH:
+        css = xpath_to_css(value)
+        if css is not None:
+            return (By.CSS_SELECTOR, css)
+    return locator
+
+def _is_locator(name, value):
+    return (name.isupper() and isinstance(value, tuple) and len(value) == 2
+            and isinstance(value[0], str) and value[0] in STRATEGIES)
+
+class LocatorRegistry:
+    """All locators declared by registered page classes, by page and name"""
+
+    def __init__(self):
+        self._pages = {}
+
+    def register(self, page_class, compile=True):
+        """Validate, compile and record the locators declared on a page class"""
+        entries = {}
+        for name, value in list(vars(page_class).items()):
+            if not _is_locator(name, value):
+                continue
+            validate_locator(value)
+            compiled = compile_locator(value) if compile else value
+            if compiled is not value:
+                setattr(page_class, name, compiled)
+            entries[name] = {"source": value, "locator": compiled}
+        self._pages[page_class] = entries
+        return page_class
+
+    def for_page(self, page_class):
+        """dict of name -> locator for a page class, including inherited locators"""
+        locators = {}
+        for cls in reversed(page_class.__mro__):
+            for name, entry in self._pages.get(cls, {}).items():
+                locators[name] = entry["locator"]
+        return locators
+
+    def source(self, page_class, name):
+        """The locator as originally declared, before CSS compilation"""
+        for cls in page_class.__mro__:
+            if name in self._pages.get(cls, {}):
+                return self._pages[cls][name]["source"]
+        raise KeyError(name)
+
+    def pages(self):
+        return list(self._pages)
+
+LOCATORS = LocatorRegistry()
+
+def register_locators(page_class):
+    """Class decorator that registers a page's locators in ``LOCATORS``"""
+    return LOCATORS.register(page_class)
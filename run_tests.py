@@ -11,6 +11,22 @@ Options:
     --all        Run all tests (default)
     --rerun      Enable rerun of failed tests
     --report     Generate HTML report
+    --static-waits  Use fixed sleeps instead of waiting for the page to settle
+    --polling-waits Poll wait conditions over WebDriver instead of evaluating them in the page
+    --fast-input    Set input values with one script call instead of typing them
+    --command-metrics  Record timing for every WebDriver command
+    --base-url URL  Run against another host (e.g. the local stand-in site)
+    --local-site    Start the local stand-in site and run against it
+    --workers N     Run tests on N parallel workers, longest tests first
+    --verbose-steps Stream page-object step logs live
+    --stream-report With --report, write the report incrementally with external screenshots
+    --lean          Use the lean browser profile (headless, fixed viewport, ads/analytics/fonts blocked)
+    --block-images  Block images, except in tests that check them
+    --browser-contexts Give each test its own browser context in one Chrome per worker
+    --daemon        Attach to warm browsers kept by the browser daemon (started if needed)
+    --daemon-idle-timeout N  Seconds without runs before the daemon exits (default 900)
+    --daemon-memory-mb N     Recycle idle daemon browsers above this memory use
+    --stop-daemon   Stop the browser daemon and exit
 """
 
 import os
@@ -18,6 +34,7 @@ import sys
 import subprocess
 import argparse
 import importlib.util
+import time
 from datetime import datetime
 
 def is_package_installed(package_name):
@@ -31,11 +48,65 @@ def parse_args():
     parser.add_argument('--all', action='store_true', help='Run all tests (default)')
     parser.add_argument('--rerun', action='store_true', help='Enable rerun of failed tests')
     parser.add_argument('--report', action='store_true', help='Generate HTML report')
+    parser.add_argument('--static-waits', action='store_true', help='Use fixed sleeps instead of waiting for the page to settle')
+    parser.add_argument('--polling-waits', action='store_true', help='Poll wait conditions over WebDriver instead of evaluating them in the page')
+    parser.add_argument('--fast-input', action='store_true', help='Set input values with one script call instead of typing them')
+    parser.add_argument('--command-metrics', action='store_true', help='Record timing for every WebDriver command')
+    parser.add_argument('--base-url', help='Run against another host, e.g. http://127.0.0.1:8000')
+    parser.add_argument('--local-site', action='store_true', help='Start the local stand-in site and run against it')
+    parser.add_argument('--verbose-steps', action='store_true', help='Stream page-object step logs live')
+    parser.add_argument('--stream-report', action='store_true', help='With --report, write the report incrementally with external screenshots')
+    parser.add_argument('--lean', action='store_true', help='Use the lean browser profile (headless, fixed viewport, ads/analytics/fonts blocked)')
+    parser.add_argument('--block-images', action='store_true', help='Block images, except in tests that check them')
+    parser.add_argument('--browser-contexts', action='store_true', help='Give each test its own browser context in one Chrome per worker')
+    parser.add_argument('--daemon', action='store_true', help='Attach to warm browsers kept by the browser daemon (started if needed)')
+    parser.add_argument('--daemon-idle-timeout', type=int, default=900, help='Seconds without runs before the daemon exits')
+    parser.add_argument('--daemon-memory-mb', type=int, default=None, help='Recycle idle daemon browsers above this memory use')
+    parser.add_argument('--stop-daemon', action='store_true', help='Stop the browser daemon and exit')
+    parser.add_argument('--workers', type=int, default=1, help='Run tests on N parallel workers, longest tests first')
     return parser.parse_args()
 
+def ensure_daemon(args):
+    """Return the running browser daemon's address, starting the daemon if needed"""
+    # Imported only when needed, it pulls in selenium
+    from utils.browser_daemon import DaemonClient
+    
+    client = DaemonClient.from_state_file()
+    if client is not None:
+        return client.address
+    
+    cmd = [sys.executable, "-m", "utils.browser_daemon",
+           "--profile", "lean" if args.lean else "full",
+           "--browsers", str(max(1, args.workers)),
+           "--idle-timeout", str(args.daemon_idle_timeout)]
+    if args.daemon_memory_mb:
+        cmd.extend(["--memory-limit-mb", str(args.daemon_memory_mb)])
+    print("Starting browser daemon: " + " ".join(cmd))
+    # Detached, so it keeps running after this script exits
+    subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, start_new_session=True)
+    
+    deadline = time.time() + 60
+    while time.time() < deadline:
+        client = DaemonClient.from_state_file()
+        if client is not None:
+            return client.address
+        time.sleep(0.5)
+    print("Warning: browser daemon did not start, launching browsers per run instead.")
+    return None
+
 def main():
     args = parse_args()
     
+    if args.stop_daemon:
+        from utils.browser_daemon import DaemonClient
+        client = DaemonClient.from_state_file()
+        if client is None:
+            print("Browser daemon is not running.")
+        else:
+            client.shutdown()
+            print("Browser daemon stopped.")
+        return 0
+    
     # Check for required packages
     missing_packages = []
     
@@ -44,11 +115,16 @@ def main():
         print("Install with: pip install pytest-rerunfailures")
         args.rerun = False
     
-    if args.report and not is_package_installed('pytest_html'):
+    if args.report and not args.stream_report and not is_package_installed('pytest_html'):
         print("Warning: pytest-html is not installed. HTML reports will be disabled.")
         print("Install with: pip install pytest-html")
         args.report = False
     
+    if args.workers > 1 and not is_package_installed('xdist'):
+        print("Warning: pytest-xdist is not installed. Tests will run serially.")
+        print("Install with: pip install pytest-xdist")
+        args.workers = 1
+    
     # Create reports and screenshots directories if they don't exist
     os.makedirs("reports", exist_ok=True)
     os.makedirs("reports/screenshots", exist_ok=True)
@@ -86,10 +162,56 @@ def main():
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             report_path = f"reports/report_{timestamp}.html"
             
-        cmd.append(f"--html={report_path}")
-        cmd.append("--self-contained-html")
+        if args.stream_report:
+            cmd.append(f"--stream-report={report_path}")
+        else:
+            cmd.append(f"--html={report_path}")
+            cmd.append("--self-contained-html")
         print(f"Report will be generated at: {report_path}")
     
+    # Fall back to fixed sleeps in page objects
+    if args.static_waits:
+        cmd.append("--static-waits")
+    
+    # Poll wait conditions with WebDriverWait
+    if args.polling_waits:
+        cmd.append("--polling-waits")
+    
+    # Set input values by script
+    if args.fast_input:
+        cmd.append("--fast-input")
+    
+    # Stream step logs live instead of only on failure
+    if args.verbose_steps:
+        cmd.append("--verbose-steps")
+    
+    # Record WebDriver command timings
+    if args.command_metrics:
+        cmd.append("--command-metrics")
+    
+    # Select the browser profile
+    if args.lean:
+        cmd.append("--browser-profile=lean")
+    if args.block_images:
+        cmd.append("--block-images")
+    if args.browser_contexts:
+        cmd.append("--browser-contexts")
+    
+    # Attach to warm browsers instead of launching new ones
+    daemon_address = ensure_daemon(args) if args.daemon else None
+    if daemon_address:
+        cmd.append(f"--browser-daemon={daemon_address}")
+    
+    # Distribute tests over workers using recorded durations
+    if args.workers > 1:
+        cmd.extend(["-n", str(args.workers), "--dist", "loadgroup", "--lpt-schedule"])
+    
+    # Select the site under test
+    if args.local_site:
+        cmd.append("--local-site")
+    elif args.base_url:
+        cmd.append(f"--base-url={args.base_url}")
+    
     # Add verbose output
     cmd.append("-v")
     
@@ -100,6 +222,15 @@ def main():
     print(f"- Test Type: {'Login Tests' if args.login else 'Profile Tests' if args.profile else 'All Tests'}")
     print(f"- Retry Failed Tests: {'Enabled' if args.rerun else 'Disabled'}")
     print(f"- HTML Report: {'Enabled' if args.report else 'Disabled'}")
+    print(f"- Page Waits: {'Static sleeps' if args.static_waits else 'Settle detection'}")
+    print(f"- Condition Waits: {'WebDriverWait polling' if args.polling_waits else 'In-page'}")
+    print(f"- Text Input: {'Set by script' if args.fast_input else 'Typed'}")
+    print(f"- Command Metrics: {'Enabled' if args.command_metrics else 'Disabled'}")
+    print(f"- Browser Profile: {'Lean (headless)' if args.lean else 'Full'}{', images blocked' if args.block_images else ''}")
+    print(f"- Browsers: {'Warm daemon at ' + daemon_address if daemon_address else 'Started per run'}")
+    print(f"- Test Isolation: {'Browser contexts' if args.browser_contexts else 'Browser reset'}")
+    print(f"- Workers: {args.workers}")
+    print(f"- Site: {'Local stand-in' if args.local_site else args.base_url or 'profile.w3schools.com'}")
     print(f"- Screenshots: Automatically captured for failed tests")
     print(f"- Screenshots Location: {os.path.abspath('reports/screenshots')}")
     if args.report:
@@ -0,0 +1,189 @@
+import contextlib
+import hashlib
+import json
+import os
+import socket
+import threading
+import time
+
+if os.name == "nt":
+    import msvcrt
+else:
+    import fcntl
+
+from test_data.login_data import LoginData
+
+def _pid_alive(pid):
+    """Check whether a process on this machine is still running"""
+    if os.name == "nt":
+        import ctypes
+        PROCESS_QUERY_LIMITED_INFORMATION = 0x1000
+        STILL_ACTIVE = 259
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.OpenProcess(PROCESS_QUERY_LIMITED_INFORMATION, False, pid)
+        if not handle:
+            return False
+        try:
+            exit_code = ctypes.c_ulong()
+            kernel32.GetExitCodeProcess(handle, ctypes.byref(exit_code))
+            return exit_code.value == STILL_ACTIVE
+        finally:
+            kernel32.CloseHandle(handle)
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+@contextlib.contextmanager
+def _locked(path):
+    """Hold an exclusive OS advisory lock on ``path`` (released by the OS if the process dies)"""
+    with open(path, "a+b") as f:
+        if os.name == "nt":
+            while True:
+                try:
+                    msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    # LK_LOCK gives up after ten seconds; keep waiting
+                    continue
+            try:
+                yield
+            finally:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+class AccountLease:
+    """Exclusive use of one account until ``release`` is called"""
+
+    def __init__(self, manager, credentials, path):
+        self.manager = manager
+        self.credentials = credentials
+        self.path = path
+        self._stop = threading.Event()
+        self._heartbeat = threading.Thread(target=self._beat, name="account-lease", daemon=True)
+        self._heartbeat.start()
+
+    def _beat(self):
+        # Touch the lease file so other processes can tell it is still held
+        while not self._stop.wait(self.manager.lease_ttl / 3):
+            try:
+                os.utime(self.path)
+            except OSError:
+                # Briefly moved aside by a reclaim check in another process
+                continue
+
+    def release(self):
+        self._stop.set()
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+    def __enter__(self):
+        return self.credentials
+
+    def __exit__(self, exc_type, exc, tb):
+        self.release()
+
+class AccountLeaseManager:
+    """
+    Cross-process account pool based on lock files. Each account has one
+    lease file created with O_EXCL, so only one test process can hold it.
+    Leases of crashed processes are reclaimed when the owning process is
+    gone or its heartbeat is older than ``lease_ttl``. Creating and
+    reclaiming leases happens under an advisory lock on the directory's
+    ``pool.lock``, so two processes never reclaim the same lease.
+    """
+
+    def __init__(self, accounts=None, directory=".account_leases", lease_ttl=120, poll_interval=0.5):
+        """
+        :param accounts: list of credential dicts (defaults to LoginData.ACCOUNT_POOL)
+        :param directory: where lease files are kept; must be shared by all workers
+        :param lease_ttl: seconds without a heartbeat before a lease is treated as abandoned
+        :param poll_interval: seconds between attempts while the pool is exhausted
+        """
+        self.accounts = list(LoginData.ACCOUNT_POOL if accounts is None else accounts)
+        self.directory = directory
+        self.lease_ttl = lease_ttl
+        self.poll_interval = poll_interval
+        os.makedirs(directory, exist_ok=True)
+        self._pool_lock_path = os.path.join(directory, "pool.lock")
+
+    def _lease_path(self, credentials):
+        key = hashlib.sha256(credentials["email"].encode("utf-8")).hexdigest()[:16]
+        return os.path.join(self.directory, f"{key}.lease")
+
+    def acquire(self, timeout=600):
+        """
+        Lease a free account, waiting while all accounts are in use
+        :param timeout: seconds to wait before giving up
+        :return: AccountLease
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            with _locked(self._pool_lock_path):
+                for credentials in self.accounts:
+                    path = self._lease_path(credentials)
+                    if self._try_lock(path) or (self._reclaim_if_stale(path) and self._try_lock(path)):
+                        return AccountLease(self, credentials, path)
+            if time.monotonic() > deadline:
+                raise TimeoutError(f"No test account became free within {timeout}s")
+            time.sleep(self.poll_interval)
+
+    def _try_lock(self, path):
+        try:
+            fd = os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except FileExistsError:
+            return False
+        with os.fdopen(fd, "w") as f:
+            json.dump({"pid": os.getpid(), "host": socket.gethostname(), "acquired_at": time.time()}, f)
+        return True
+
+    def _reclaim_if_stale(self, path):
+        """
+        Remove a lease left behind by a crashed worker; True if it was removed.
+        Called with the pool lock held.
+        """
+        judged = self._read_lease(path)
+        if judged is None:
+            # Lease is being written or was just released
+            return False
+        owner, mtime = judged
+
+        abandoned = time.time() - mtime > self.lease_ttl
+        if owner.get("host") == socket.gethostname() and not _pid_alive(owner.get("pid", -1)):
+            abandoned = True
+        if not abandoned:
+            return False
+
+        # The owner may have released (and nobody re-locked, we hold the pool
+        # lock) or sent a heartbeat since the lease was read; move the file
+        # aside and only delete it if it is still the lease judged stale
+        stale_path = f"{path}.{os.getpid()}.stale"
+        try:
+            os.replace(path, stale_path)
+        except OSError:
+            return False
+        if self._read_lease(stale_path) != judged:
+            os.replace(stale_path, path)
+            return False
+        os.remove(stale_path)
+        return True
+
+    def _read_lease(self, path):
+        """(owner, mtime) of a lease file, or None if it is missing or half-written"""
+        try:
+            with open(path) as f:
+                owner = json.load(f)
+            return owner, os.path.getmtime(path)
+        except (OSError, ValueError):
+            return None
@@ -12,6 +12,12 @@ class LoginData:
         "password": "A1234567890_a"
     }
 
+    # Accounts that mutating tests lease exclusively (see test_data/account_pool.py).
+    # Add more accounts here to run more profile tests in parallel.
+    ACCOUNT_POOL = [
+        VALID_CREDENTIALS,
+    ]
+
     EMPTY_CREDENTIALS = {
         "email": "",
         "password": "",
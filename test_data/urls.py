@@ -0,0 +1,46 @@
+from urllib.parse import urlsplit
+
+class SiteUrls:
+    """URLs of the pages under test, either the live site or a local stand-in"""
+
+    LIVE_LOGIN = "https://profile.w3schools.com/login"
+    LIVE_PROFILE = "https://profile.w3schools.com/profile"
+    LIVE_PATHFINDER = "https://pathfinder.w3schools.com/"
+    # Any write request the profile page sends to a W3Schools API after Save is clicked
+    LIVE_PROFILE_SAVE_API = r"^https://[^/]+\.w3schools\.com/(?:[^?]*/)?api/"
+    # Request that saves name and URL changes on the local stand-in (not the image upload)
+    LOCAL_PROFILE_SAVE_API = r"/api/profile/?(?:\?|$)"
+
+    def __init__(self, base_url=None, profile_save_api=None):
+        """
+        :param base_url: e.g. "http://127.0.0.1:8000" for the local stand-in; None for the live site
+        :param profile_save_api: regular expression for the profile save request URL,
+            overrides the site's default (see ProfilePage.wait_for_profile_save)
+        """
+        self.base_url = base_url.rstrip("/") if base_url else None
+        if self.base_url:
+            self.login = f"{self.base_url}/login"
+            self.profile = f"{self.base_url}/profile"
+            self.pathfinder = f"{self.base_url}/pathfinder/"
+            self.profile_api = f"{self.base_url}/api/profile"
+            self.profile_save_api = profile_save_api or self.LOCAL_PROFILE_SAVE_API
+        else:
+            self.login = self.LIVE_LOGIN
+            self.profile = self.LIVE_PROFILE
+            self.pathfinder = self.LIVE_PATHFINDER
+            # The live site has no known profile API; profile state is not snapshotted there
+            self.profile_api = None
+            self.profile_save_api = profile_save_api or self.LIVE_PROFILE_SAVE_API
+
+    @property
+    def origins(self):
+        """Origins whose cookies and storage belong to the site under test"""
+        origins = []
+        for url in (self.login, self.profile, self.pathfinder):
+            parts = urlsplit(url)
+            origin = f"{parts.scheme}://{parts.netloc}"
+            if origin not in origins:
+                origins.append(origin)
+        if not self.base_url:
+            origins.append("https://www.w3schools.com")
+        return origins
@@ -0,0 +1,42 @@
+import asyncio
+import pytest
+from pages.AsyncLoginPage import AsyncLoginPage
+from test_data.login_data import LoginData
+from utils import step_logger
+from utils.async_webdriver import AsyncChrome
+
+SESSIONS = 2
+
+async def _url_is(session, url):
+    return await session.current_url() == url
+
+class TestAsyncPages:
+    @pytest.mark.login
+    def test_concurrent_sessions_log_in(self, request, site_urls):
+        """Several sessions on one event loop log in at the same time and keep their own step logs"""
+        profile = request.config.getoption("--browser-profile")
+
+        async def login(chrome, index):
+            # Each task gets its own step buffer
+            step_logger.clear()
+            session = await chrome.new_session(profile=profile)
+            await session.get(site_urls.login)
+            page = AsyncLoginPage(session)
+            page.logger.info("Session %s logging in", index)
+            await page.login(LoginData.VALID_CREDENTIALS["email"], LoginData.VALID_CREDENTIALS["password"])
+            await page.wait_until(
+                lambda: _url_is(session, site_urls.pathfinder),
+                message=f"Session {index} did not reach {site_urls.pathfinder}"
+            )
+            return session.session_id, step_logger.dump()
+
+        async def run():
+            async with AsyncChrome() as chrome:
+                return await asyncio.gather(*(login(chrome, index) for index in range(SESSIONS)))
+
+        results = asyncio.run(run())
+        assert len({session_id for session_id, _ in results}) == SESSIONS
+        for index, (_, steps) in enumerate(results):
+            assert f"Session {index} logging in" in steps
+            others = [f"Session {other} logging in" for other in range(SESSIONS) if other != index]
+            assert not any(other in steps for other in others), f"Session {index} logged other sessions' steps"
@@ -0,0 +1,152 @@
+from types import SimpleNamespace
+import pytest
+from utils import browser_daemon
+from utils.browser_daemon import BrowserDaemon, DaemonClient
+
+DRIVER_URL = "http://chromedriver"
+DAEMON_URL = "http://daemon"
+
+class FakeChromedriver:
+    """Stands in for _http_json: answers chromedriver and daemon requests and records them"""
+
+    def __init__(self):
+        self.created = 0
+        self.deleted = []
+        self.requests = []
+        self.windows = {}
+        self.lost = []
+        self.fail_reset = False
+
+    def __call__(self, method, url, payload=None, timeout=60):
+        self.requests.append((method, url, payload))
+        if url == f"{DAEMON_URL}/heartbeat":
+            return {"lost": [s for s in payload["session_ids"] if s in self.lost]}
+        path = url[len(DRIVER_URL):]
+        if path == "/session":
+            self.created += 1
+            session_id = f"session-{self.created}"
+            self.windows[session_id] = ["tab-0", "tab-1"]
+            return {"value": {"sessionId": session_id}}
+        _, _, session_id, *rest = path.split("/")
+        command = "/" + "/".join(rest)
+        if method == "DELETE" and command == "/":
+            self.deleted.append(session_id)
+            return {"value": None}
+        if command == "/alert/dismiss":
+            return {"value": {"error": "no such alert", "message": ""}}
+        if command == "/window/handles":
+            return {"value": list(self.windows[session_id])}
+        if command == "/window/new":
+            if self.fail_reset:
+                return {"value": {"error": "unknown error", "message": "tab crashed"}}
+            self.windows[session_id].append("fresh")
+            return {"value": {"handle": "fresh", "type": "tab"}}
+        if command == "/window" and method == "GET":
+            return {"value": self.windows[session_id][0]}
+        if command == "/window" and method == "POST":
+            self.current = payload["handle"]
+        if command == "/window" and method == "DELETE":
+            self.windows[session_id].remove(self.current)
+        return {"value": None}
+
+@pytest.fixture
+def chromedriver(monkeypatch):
+    fake = FakeChromedriver()
+    monkeypatch.setattr(browser_daemon, "_http_json", fake)
+    return fake
+
+@pytest.fixture
+def daemon(chromedriver):
+    daemon = BrowserDaemon(browsers=1, lease_ttl=60)
+    daemon.service = SimpleNamespace(service_url=DRIVER_URL, process=None)
+    return daemon
+
+class TestLeases:
+    def test_lease_starts_a_browser_when_none_is_idle(self, daemon, chromedriver):
+        lease = daemon.lease(pid=123)
+        assert lease["session_id"] == "session-1"
+        assert lease["lease_ttl"] == 60
+        assert daemon._leased["session-1"]["pid"] == 123
+
+    def test_lease_reuses_an_idle_browser(self, daemon, chromedriver):
+        session_id = daemon.lease()["session_id"]
+        daemon.release(session_id)
+        assert daemon.lease()["session_id"] == session_id
+        assert chromedriver.created == 1
+
+    def test_heartbeat_extends_leases_and_reports_lost_ones(self, daemon, monkeypatch):
+        clock = SimpleNamespace(now=1000.0)
+        monkeypatch.setattr(browser_daemon.time, "monotonic", lambda: clock.now)
+        session_id = daemon.lease()["session_id"]
+        clock.now += 50
+        assert daemon.heartbeat([session_id, "session-gone"]) == ["session-gone"]
+        clock.now += 50
+        assert daemon._expired_leases() == []
+        clock.now += 61
+        assert daemon._expired_leases() == [session_id]
+
+    def test_leases_of_exited_clients_expire(self, daemon, monkeypatch):
+        monkeypatch.setattr(browser_daemon, "psutil", SimpleNamespace(pid_exists=lambda pid: pid != 456))
+        alive = daemon.lease(pid=123)["session_id"]
+        dead = daemon.lease(pid=456)["session_id"]
+        assert daemon._expired_leases() == [dead]
+        assert alive in daemon._leased
+
+class TestRelease:
+    def test_released_session_is_reset_before_it_is_idle(self, daemon, chromedriver):
+        session_id = daemon.lease()["session_id"]
+        daemon.release(session_id)
+        assert daemon._idle == [session_id]
+        assert chromedriver.windows[session_id] == ["fresh"]
+        assert any(payload == {"cmd": "Network.clearBrowserCookies", "params": {}}
+                   for _, _, payload in chromedriver.requests)
+
+    def test_session_that_fails_to_reset_is_quit(self, daemon, chromedriver):
+        session_id = daemon.lease()["session_id"]
+        chromedriver.fail_reset = True
+        daemon.release(session_id)
+        assert daemon._idle == []
+        assert chromedriver.deleted == [session_id]
+
+    def test_release_of_reclaimed_session_is_ignored(self, daemon, chromedriver):
+        session_id = daemon.lease()["session_id"]
+        daemon._reclaim(session_id)
+        daemon.release(session_id)
+        assert session_id not in daemon._idle
+        assert chromedriver.deleted == [session_id]
+
+class TestReclaim:
+    def test_reclaimed_browser_is_replaced(self, daemon, chromedriver):
+        session_id = daemon.lease()["session_id"]
+        daemon._reclaim(session_id)
+        assert chromedriver.deleted == [session_id]
+        assert daemon._idle == ["session-2"]
+        assert daemon._leased == {}
+
+    def test_no_replacement_while_enough_browsers_are_warm(self, daemon, chromedriver):
+        daemon.browsers = 1
+        first = daemon.lease()["session_id"]
+        daemon.lease()
+        daemon._reclaim(first)
+        assert chromedriver.created == 2
+        assert daemon._idle == []
+
+    def test_reclaiming_twice_is_harmless(self, daemon, chromedriver):
+        session_id = daemon.lease()["session_id"]
+        daemon._reclaim(session_id)
+        daemon._reclaim(session_id)
+        assert chromedriver.deleted == [session_id]
+
+class TestDaemonClient:
+    def test_heartbeat_drops_reclaimed_sessions(self, chromedriver):
+        client = DaemonClient(DAEMON_URL)
+        client._sessions.update({"session-1", "session-2"})
+        chromedriver.lost = ["session-2"]
+        assert client.send_heartbeat() == ["session-2"]
+        assert client._sessions == {"session-1"}
+        client.send_heartbeat()
+        assert chromedriver.requests[-1][2] == {"session_ids": ["session-1"]}
+
+    def test_no_heartbeat_without_sessions(self, chromedriver):
+        assert DaemonClient(DAEMON_URL).send_heartbeat() == []
+        assert chromedriver.requests == []
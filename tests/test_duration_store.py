@@ -0,0 +1,50 @@
+import pytest
+from utils.duration_store import DEFAULT_DURATION, HISTORY, DurationStore, lpt_schedule, strip_xdist_group
+
+class TestDurationStore:
+    @pytest.fixture
+    def store(self, tmp_path):
+        return DurationStore(str(tmp_path / "durations.sqlite"))
+
+    def test_unknown_tests_get_default_before_any_run(self, store):
+        assert store.estimates(["a", "b"]) == {"a": DEFAULT_DURATION, "b": DEFAULT_DURATION}
+
+    def test_estimate_is_mean_of_recent_runs(self, store):
+        store.record([("a", 10.0, "passed")])
+        store.record([("a", 20.0, "passed")])
+        assert store.estimates(["a"]) == {"a": 15.0}
+
+    def test_only_recent_history_is_averaged(self, store, monkeypatch):
+        clock = iter(range(1000, 2000))
+        monkeypatch.setattr("utils.duration_store.time.time", lambda: next(clock))
+        store.record([("a", 100.0, "passed")])
+        for _ in range(HISTORY):
+            store.record([("a", 1.0, "passed")])
+        assert store.estimates(["a"]) == {"a": 1.0}
+
+    def test_unknown_tests_get_median_of_known(self, store):
+        store.record([("a", 1.0, "passed"), ("b", 2.0, "passed"), ("c", 9.0, "failed")])
+        assert store.estimates(["new"]) == {"new": 2.0}
+
+class TestLptSchedule:
+    def test_longest_first_balances_bins(self):
+        durations = {"a": 7, "b": 5, "c": 4, "d": 3, "e": 1}
+        bins = lpt_schedule(durations, 2)
+        assert sorted(sum(durations[n] for n in b) for b in bins) == [10, 10]
+        assert bins[0][0] == "a"
+
+    def test_every_test_is_scheduled_once(self):
+        durations = {f"t{i}": float(i % 4) for i in range(13)}
+        bins = lpt_schedule(durations, 3)
+        assert sorted(n for b in bins for n in b) == sorted(durations)
+
+    def test_more_workers_than_tests_leaves_empty_bins(self):
+        assert sorted(map(len, lpt_schedule({"a": 1.0}, 3))) == [0, 0, 1]
+
+@pytest.mark.parametrize("nodeid, expected", [
+    ("tests/test_login.py::TestLogin::test_successful_login@lpt3", "tests/test_login.py::TestLogin::test_successful_login"),
+    ("tests/test_login.py::TestLogin::test_successful_login", "tests/test_login.py::TestLogin::test_successful_login"),
+    ("tests/test_x.py::test_y[user@lpt.com]", "tests/test_x.py::test_y[user@lpt.com]"),
+])
+def test_strip_xdist_group(nodeid, expected):
+    assert strip_xdist_group(nodeid) == expected
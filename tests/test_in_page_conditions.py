@@ -0,0 +1,70 @@
+import pytest
+from selenium.common.exceptions import JavascriptException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.webelement import WebElement
+from selenium.webdriver.support import expected_conditions as EC
+from pages.BasePage import BrowserWait, translate_condition
+
+LOCATOR = (By.NAME, "email")
+
+class TestTranslateCondition:
+    @pytest.mark.parametrize("condition, expected", [
+        (EC.presence_of_element_located(LOCATOR), ("present", ["name", "email"], None)),
+        (EC.visibility_of_element_located(LOCATOR), ("visible", ["name", "email"], None)),
+        (EC.invisibility_of_element_located(LOCATOR), ("invisible", ["name", "email"], None)),
+        (EC.element_to_be_clickable(LOCATOR), ("clickable", ["name", "email"], None)),
+        (EC.text_to_be_present_in_element(LOCATOR, "Saved"), ("text", ["name", "email"], "Saved")),
+        (EC.presence_of_all_elements_located(LOCATOR), ("all_present", ["name", "email"], None)),
+        (EC.url_to_be("https://example.com/"), ("url_is", None, "https://example.com/")),
+        (EC.url_contains("/profile"), ("url_contains", None, "/profile")),
+        (EC.url_changes("https://example.com/login"), ("url_changes", None, "https://example.com/login")),
+    ])
+    def test_supported_conditions_run_in_page(self, condition, expected):
+        """The locator or value is read from the condition's closure"""
+        assert translate_condition(condition) == expected
+
+    def test_element_targets_are_passed_as_elements(self):
+        element = WebElement(None, "element-id")
+        assert translate_condition(EC.visibility_of(element)) == ("visible", element, None)
+        assert translate_condition(EC.invisibility_of_element(element)) == ("invisible", element, None)
+
+    @pytest.mark.parametrize("condition", [
+        lambda driver: True,
+        EC.alert_is_present(),
+        EC.title_is("Profile"),
+        EC.frame_to_be_available_and_switch_to_it(LOCATOR),
+        EC.element_to_be_clickable("not a locator"),
+    ])
+    def test_other_conditions_are_polled(self, condition):
+        assert translate_condition(condition) is None
+
+class FakeDriver:
+    """Answers the in-page wait script with queued outcomes and tracks the document stamp"""
+
+    def __init__(self, *outcomes):
+        self.outcomes = list(outcomes)
+        self.token = None
+
+    def execute_async_script(self, script, conditions, timeout_ms, token):
+        outcome = self.outcomes.pop(0)
+        if outcome == "navigated":
+            self.token = None
+            raise JavascriptException("document unloaded while waiting for result")
+        self.token = token
+        if outcome == "error":
+            raise JavascriptException("SyntaxError: not a valid selector")
+        return outcome
+
+    def execute_script(self, script):
+        return self.token
+
+class TestBrowserWait:
+    def test_navigation_is_retried_in_the_new_document(self):
+        driver = FakeDriver("navigated", {"index": 0, "value": True})
+        wait = BrowserWait(driver, 5)
+        assert wait.until_any([EC.url_contains("/profile")]) == (0, True)
+
+    def test_script_errors_in_the_same_document_are_raised(self):
+        driver = FakeDriver("error", {"index": 0, "value": True})
+        with pytest.raises(JavascriptException, match="not a valid selector"):
+            BrowserWait(driver, 5).until_any([EC.presence_of_element_located(LOCATOR)])
@@ -0,0 +1,60 @@
+import pytest
+from selenium.webdriver.common.by import By
+from pages.locators import LocatorError, compile_locator, validate_locator, xpath_to_css
+
+class TestXpathToCss:
+    @pytest.mark.parametrize("xpath, css", [
+        ("//input[@id='username']", "input#username"),
+        ("//*[@id='profileImageInput']", "#profileImageInput"),
+        ("//input[@id='1st']", "input[id='1st']"),
+        ("//input[@placeholder='email']", "input[placeholder='email']"),
+        ("//div[contains(@class, 'chakra-alert')]", "div[class*='chakra-alert']"),
+        ("//a[starts-with(@href, '/profile')]", "a[href^='/profile']"),
+        ("//div[contains(@class, 'chakra-alert') and @data-status='success']",
+         "div[class*='chakra-alert'][data-status='success']"),
+        ("//form[@name='login']//button[@type='submit']", "form[name='login'] button[type='submit']"),
+        ("//ul/li[@class='item']", "ul > li[class='item']"),
+    ])
+    def test_compiles_attribute_only_xpath(self, xpath, css):
+        """Attribute-only XPath has an equivalent CSS selector"""
+        assert xpath_to_css(xpath) == css
+
+    @pytest.mark.parametrize("xpath", [
+        "//button[normalize-space()='Save']",
+        "//span[text()='Profile']",
+        "//div[contains(text(), 'Saved')]",
+        "//li[2]",
+        "//li[position()=1]",
+        "//input[@type='text' or @type='email']",
+        "//div[@id='a']/..",
+        "//div/following-sibling::span",
+        "input[@id='relative']",
+    ])
+    def test_keeps_xpath_without_css_equivalent(self, xpath):
+        """Text matching, positions, unions and axes stay XPath"""
+        assert xpath_to_css(xpath) is None
+        assert compile_locator((By.XPATH, xpath)) == (By.XPATH, xpath)
+
+    def test_quotes_in_values_are_escaped(self):
+        assert xpath_to_css("//input[@title=\"it's\"]") == "input[title='it\\'s']"
+
+class TestValidateLocator:
+    @pytest.mark.parametrize("locator", [
+        (By.ID, "username"),
+        (By.CSS_SELECTOR, "div[class*='chakra-alert']"),
+        (By.XPATH, "//button[normalize-space()='Save']"),
+    ])
+    def test_accepts_valid_locators(self, locator):
+        validate_locator(locator)
+
+    @pytest.mark.parametrize("locator", [
+        ("id", ""),
+        ("identifier", "username"),
+        (By.XPATH, "//div[@id='a'"),
+        (By.CSS_SELECTOR, "input[name='email]"),
+        [By.ID, "username"],
+        (By.ID,),
+    ])
+    def test_rejects_malformed_locators(self, locator):
+        with pytest.raises(LocatorError):
+            validate_locator(locator)
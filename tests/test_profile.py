@@ -1,57 +1,100 @@
 import pytest
-from selenium import webdriver
 from pages.LoginPage import LoginPage
 from pages.ProfilePage import ProfilePage
-from test_data.login_data import LoginData
 from test_data.profile_data import ProfileData
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
+from selenium.common.exceptions import TimeoutException
 import time
 import os
-from selenium.webdriver.chrome.options import Options
+import warnings
 
 class TestProfile:
     @pytest.fixture(scope="function")
-    def setup(self):
-        # Configure Chrome options to reduce unwanted logs
-        chrome_options = Options()
-        chrome_options.add_experimental_option('excludeSwitches', ['enable-logging'])
-        chrome_options.add_argument('--log-level=3')  # Only show fatal errors
+    def setup(self, driver, auth_cache, site_urls, account):
+        # Browsers come from the pool in conftest.py and are reset between tests
+        self.driver = driver
+        self.urls = site_urls
+        # Leased exclusively to this worker, see test_data/account_pool.py
+        self.account = account
+        # Cached sessions are kept per account and per site
+        session_key = f"{account['email']}@{site_urls.login}"
         
-        # Initialize the driver with options
-        self.driver = webdriver.Chrome(options=chrome_options)
-        self.driver.maximize_window()
+        # Reuse a cached session if there is one, otherwise log in through the UI
+        if not (auth_cache and self.restore_session(auth_cache, session_key)):
+            self.login()
+            self.driver.get(self.urls.profile)
+            if auth_cache:
+                auth_cache.save(self.driver, session_key)
         
-        # Login first
+        # Initialize profile page and verify
+        profile_page = ProfilePage(self.driver)
+        if profile_page.static_waits:
+            # Add static wait for page load
+            time.sleep(3)  # Wait for 3 seconds
+        
+        assert profile_page.is_profile_page_loaded(), "Profile page failed to load"
+        
+        yield self.driver
+
+    @pytest.fixture(scope="function")
+    def profile_state(self, setup, profile_api):
+        """Snapshot the profile over HTTP and put it back after the test (only where the API is known)"""
+        if profile_api is None:
+            yield None
+            return
+        try:
+            profile_api.use_driver_session(self.driver)
+            snapshot = profile_api.snapshot()
+        except Exception as e:
+            warnings.warn(f"Could not snapshot profile state, it will not be restored: {e}")
+            yield profile_api
+            return
+        yield profile_api
+        try:
+            profile_api.use_driver_session(self.driver)
+            profile_api.restore(snapshot)
+        except Exception as e:
+            warnings.warn(f"Could not restore profile state: {e}")
+
+    def login(self):
+        """Log in through the login page and wait for the redirect"""
         login_page = LoginPage(self.driver)
-        self.driver.get("https://profile.w3schools.com/login")
+        self.driver.get(self.urls.login)
         login_page.login(
-            LoginData.VALID_CREDENTIALS["email"],
-            LoginData.VALID_CREDENTIALS["password"]
+            self.account["email"],
+            self.account["password"]
         )
         
         # Wait for login redirect
         WebDriverWait(self.driver, 10).until(
-            EC.url_to_be("https://pathfinder.w3schools.com/")
+            EC.url_to_be(self.urls.pathfinder)
         )
+
+    def restore_session(self, auth_cache, session_key):
+        """Load the cached session and probe the profile page with it"""
+        if not auth_cache.load(self.driver, session_key):
+            return False
         
-        # Navigate to profile page
-        self.driver.get("https://profile.w3schools.com/profile")
-        
-        # Add static wait for page load
-        time.sleep(3)  # Wait for 3 seconds
-        
-        # Initialize profile page and verify
-        profile_page = ProfilePage(self.driver)
-        assert profile_page.is_profile_page_loaded(), "Profile page failed to load"
-        
-        yield self.driver
-        self.driver.quit()
+        self.driver.get(self.urls.profile)
+        try:
+            WebDriverWait(self.driver, 10).until(
+                lambda driver: auth_cache.is_session_expired(driver)
+                or EC.visibility_of_element_located(ProfilePage.FIRST_NAME_INPUT)(driver)
+            )
+        except TimeoutException:
+            auth_cache.invalidate(session_key)
+            return False
+        if auth_cache.is_session_expired(self.driver):
+            # The server no longer accepts the cached session
+            auth_cache.invalidate(session_key)
+            return False
+        return True
 
     @pytest.mark.profile
-    def test_change_username(self, setup):
+    def test_change_username(self, setup, profile_state):
         """Test changing user's first and last name with random data"""
-        profile_page = ProfilePage(self.driver)
+        profile_page = ProfilePage(self.driver, save_api=self.urls.profile_save_api)
         
         # Get random username
         random_username = ProfileData.get_random_username()
@@ -62,6 +105,7 @@ class TestProfile:
         ), f"Failed to change username to: {random_username['first_name']} {random_username['last_name']}"
 
     @pytest.mark.profile
+    @pytest.mark.needs_images
     @pytest.mark.flaky(reruns=1, reruns_delay=2)
     def test_upload_profile_image(self, setup):
         """Test uploading profile image"""
@@ -73,9 +117,9 @@ class TestProfile:
         assert profile_page.upload_profile_image(image_path), "Failed to upload profile image"
 
     @pytest.mark.profile
-    def test_change_profile_url(self, setup):
+    def test_change_profile_url(self, setup, profile_state):
         """Test changing profile URL"""
-        profile_page = ProfilePage(self.driver)
+        profile_page = ProfilePage(self.driver, save_api=self.urls.profile_save_api)
         
         assert profile_page.change_profile_url(
             ProfileData.NEW_URL
@@ -0,0 +1,228 @@
+import asyncio
+import logging
+
+import aiohttp
+from selenium.common.exceptions import (
+    ElementClickInterceptedException, ElementNotInteractableException, InvalidSelectorException,
+    JavascriptException, NoSuchElementException, StaleElementReferenceException, TimeoutException,
+    WebDriverException
+)
+from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.common.by import By
+
+from utils import driver_factory
+
+logger = logging.getLogger(__name__)
+
+# W3C key of element references in requests and responses
+ELEMENT_KEY = "element-6066-11e4-a52f-4f4f4f4f4f4f"
+
+# W3C error codes -> the exceptions selenium raises for them
+ERRORS = {
+    "no such element": NoSuchElementException,
+    "stale element reference": StaleElementReferenceException,
+    "element click intercepted": ElementClickInterceptedException,
+    "element not interactable": ElementNotInteractableException,
+    "invalid selector": InvalidSelectorException,
+    "javascript error": JavascriptException,
+    "script timeout": TimeoutException,
+    "timeout": TimeoutException,
+}
+
+def w3c_locator(by, value):
+    """Translate a (By, value) locator to a strategy the W3C protocol accepts, as selenium does"""
+    if by == By.ID:
+        return By.CSS_SELECTOR, f'[id="{value}"]'
+    if by == By.CLASS_NAME:
+        return By.CSS_SELECTOR, f".{value}"
+    if by == By.NAME:
+        return By.CSS_SELECTOR, f'[name="{value}"]'
+    return by, value
+
+class AsyncWebDriverClient:
+    """
+    Pooled async HTTP client for one chromedriver. Every command awaits its
+    HTTP response, so many sessions can be driven from one event loop.
+    """
+
+    def __init__(self, service_url, pool_size=32, command_timeout=60):
+        """
+        :param service_url: chromedriver URL, e.g. "http://127.0.0.1:9515"
+        :param pool_size: kept-alive connections to chromedriver
+        :param command_timeout: seconds before a command is abandoned
+        """
+        self.service_url = service_url.rstrip("/")
+        self.pool_size = pool_size
+        self.command_timeout = command_timeout
+        self._http = None
+
+    async def __aenter__(self):
+        await self.open()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def open(self):
+        if self._http is None:
+            self._http = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.pool_size),
+                timeout=aiohttp.ClientTimeout(total=self.command_timeout)
+            )
+
+    async def close(self):
+        if self._http is not None:
+            await self._http.close()
+            self._http = None
+
+    async def request(self, method, path, payload=None):
+        """Send one WebDriver command, returns its value or raises the matching selenium exception"""
+        async with self._http.request(method, f"{self.service_url}{path}", json=payload) as response:
+            body = await response.json(content_type=None)
+        value = body.get("value") if isinstance(body, dict) else None
+        if response.status >= 400:
+            error = value.get("error", "") if isinstance(value, dict) else ""
+            message = value.get("message", "") if isinstance(value, dict) else str(body)
+            raise ERRORS.get(error, WebDriverException)(message)
+        return value
+
+    async def new_session(self, options=None, profile="lean", block_images=False):
+        """
+        Start a browser
+        :param options: selenium ChromeOptions, defaults to driver_factory.chrome_options(profile)
+        :param profile: browser profile for the default options and URL blocking
+        :param block_images: also block image requests
+        """
+        options = options or driver_factory.chrome_options(profile)
+        value = await self.request("POST", "/session", {"capabilities": {"alwaysMatch": options.to_capabilities()}})
+        session = AsyncSession(self, value["sessionId"])
+        patterns = driver_factory.default_blocked_urls(profile)
+        if block_images:
+            patterns += driver_factory.IMAGE_URL_PATTERNS
+        if patterns:
+            await session.execute_cdp_cmd("Network.enable", {})
+            await session.execute_cdp_cmd("Network.setBlockedURLs", {"urls": patterns})
+        return session
+
+class AsyncSession:
+    """A WebDriver session with coroutine counterparts of the WebDriver methods the page objects use"""
+
+    def __init__(self, client, session_id):
+        self.client = client
+        self.session_id = session_id
+
+    async def command(self, method, path="", payload=None):
+        return await self.client.request(method, f"/session/{self.session_id}{path}", payload)
+
+    async def get(self, url):
+        await self.command("POST", "/url", {"url": url})
+
+    async def refresh(self):
+        await self.command("POST", "/refresh", {})
+
+    async def current_url(self):
+        return await self.command("GET", "/url")
+
+    async def find_element(self, by, value):
+        by, value = w3c_locator(by, value)
+        return AsyncElement(self, (await self.command("POST", "/element", {"using": by, "value": value}))[ELEMENT_KEY])
+
+    async def find_elements(self, by, value):
+        by, value = w3c_locator(by, value)
+        found = await self.command("POST", "/elements", {"using": by, "value": value})
+        return [AsyncElement(self, reference[ELEMENT_KEY]) for reference in found]
+
+    async def execute_script(self, script, *args):
+        return self._wrap(await self.command("POST", "/execute/sync", {"script": script, "args": self._unwrap(args)}))
+
+    async def execute_async_script(self, script, *args):
+        return self._wrap(await self.command("POST", "/execute/async", {"script": script, "args": self._unwrap(args)}))
+
+    async def get_screenshot_as_base64(self):
+        return await self.command("GET", "/screenshot")
+
+    async def execute_cdp_cmd(self, cmd, params):
+        return await self.command("POST", "/goog/cdp/execute", {"cmd": cmd, "params": params})
+
+    async def quit(self):
+        try:
+            await self.command("DELETE")
+        except WebDriverException as e:
+            logger.debug("Error quitting session %s: %s", self.session_id, e)
+
+    def _unwrap(self, args):
+        return [{ELEMENT_KEY: arg.id} if isinstance(arg, AsyncElement) else arg for arg in args]
+
+    def _wrap(self, value):
+        """Turn element references in script results back into AsyncElements"""
+        if isinstance(value, dict) and ELEMENT_KEY in value:
+            return AsyncElement(self, value[ELEMENT_KEY])
+        if isinstance(value, list):
+            return [self._wrap(item) for item in value]
+        return value
+
+class AsyncElement:
+    """An element reference of an AsyncSession"""
+
+    def __init__(self, session, element_id):
+        self.session = session
+        self.id = element_id
+
+    async def _command(self, method, path, payload=None):
+        return await self.session.command(method, f"/element/{self.id}{path}", payload)
+
+    async def click(self):
+        await self._command("POST", "/click", {})
+
+    async def clear(self):
+        await self._command("POST", "/clear", {})
+
+    async def send_keys(self, text):
+        await self._command("POST", "/value", {"text": str(text)})
+
+    async def text(self):
+        return await self._command("GET", "/text")
+
+    async def get_attribute(self, name):
+        return await self._command("GET", f"/attribute/{name}")
+
+    async def get_property(self, name):
+        return await self._command("GET", f"/property/{name}")
+
+    async def is_displayed(self):
+        return await self._command("GET", "/displayed")
+
+    async def is_enabled(self):
+        return await self._command("GET", "/enabled")
+
+class AsyncChrome:
+    """
+    One chromedriver process plus an AsyncWebDriverClient for it.
+
+        async with AsyncChrome() as chrome:
+            sessions = await asyncio.gather(*(chrome.new_session() for _ in range(8)))
+    """
+
+    def __init__(self, pool_size=32):
+        self.service = Service()
+        self.client = None
+        self.pool_size = pool_size
+        self.sessions = []
+
+    async def __aenter__(self):
+        # Starting chromedriver blocks briefly, keep it off the event loop
+        await asyncio.get_running_loop().run_in_executor(None, self.service.start)
+        self.client = AsyncWebDriverClient(self.service.service_url, pool_size=self.pool_size)
+        await self.client.open()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await asyncio.gather(*(session.quit() for session in self.sessions))
+        await self.client.close()
+        self.service.stop()
+
+    async def new_session(self, **kwargs):
+        """Start a browser, see AsyncWebDriverClient.new_session"""
+        session = await self.client.new_session(**kwargs)
+        self.sessions.append(session)
+        return session
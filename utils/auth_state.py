@@ -0,0 +1,111 @@
+import hashlib
+import json
+import logging
+import os
+import time
+
+logger = logging.getLogger(__name__)
+
+# Fields accepted by Network.setCookies
+COOKIE_FIELDS = ("name", "value", "domain", "path", "secure", "httpOnly", "sameSite", "expires", "priority")
+
+# Seeds localStorage for the saved origins before any page script runs
+LOCAL_STORAGE_SEED_SCRIPT = """
+(function () {
+    var state = %s;
+    var items = state[window.location.origin];
+    if (!items) {
+        return;
+    }
+    for (var key in items) {
+        if (window.localStorage.getItem(key) === null) {
+            window.localStorage.setItem(key, items[key]);
+        }
+    }
+})();
+"""
+
+class AuthStateCache:
+    """
+    On-disk cache of an authenticated browser state (cookies and localStorage)
+    so tests can skip the login UI flow. Entries expire after ``ttl`` seconds
+    and are dropped as soon as a probe shows the session is no longer valid.
+    """
+
+    def __init__(self, directory=".auth_state", ttl=1800):
+        """
+        :param directory: where state files are stored
+        :param ttl: seconds a saved state is trusted before logging in again
+        """
+        self.directory = directory
+        self.ttl = ttl
+
+    def path_for(self, account):
+        """State file for an account (the email is hashed so it is not written to disk)"""
+        key = hashlib.sha256(account.encode("utf-8")).hexdigest()[:16]
+        return os.path.join(self.directory, f"{key}.json")
+
+    def save(self, driver, account):
+        """
+        Capture cookies for all domains and localStorage of the current origin
+        :param driver: a logged-in WebDriver
+        :param account: account identifier (e.g. the login email)
+        """
+        cookies = driver.execute_cdp_cmd("Network.getAllCookies", {})["cookies"]
+        origin = driver.execute_script("return window.location.origin")
+        local_storage = driver.execute_script("return Object.assign({}, window.localStorage)")
+        state = {
+            "saved_at": time.time(),
+            "cookies": [{k: c[k] for k in COOKIE_FIELDS if k in c} for c in cookies],
+            "local_storage": {origin: local_storage} if local_storage else {},
+        }
+        os.makedirs(self.directory, exist_ok=True)
+        path = self.path_for(account)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(state, f)
+        os.replace(tmp_path, path)
+        logger.info("Saved authenticated state with %d cookies", len(state["cookies"]))
+
+    def load(self, driver, account):
+        """
+        Apply a saved state to the driver
+        :return: True if a fresh state was applied, False if there is none or it expired
+        """
+        path = self.path_for(account)
+        try:
+            with open(path, encoding="utf-8") as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return False
+
+        age = time.time() - state.get("saved_at", 0)
+        if age > self.ttl:
+            logger.info("Authenticated state expired after %ds", int(age))
+            self.invalidate(account)
+            return False
+
+        cookies = [c for c in state["cookies"] if c.get("expires", -1) < 0 or c["expires"] > time.time()]
+        for cookie in cookies:
+            if cookie.get("expires", -1) < 0:
+                # Session cookies have no expiry
+                cookie.pop("expires", None)
+        driver.execute_cdp_cmd("Network.setCookies", {"cookies": cookies})
+        if state["local_storage"]:
+            source = LOCAL_STORAGE_SEED_SCRIPT % json.dumps(state["local_storage"])
+            driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": source})
+        logger.info("Loaded authenticated state with %d cookies", len(cookies))
+        return True
+
+    def invalidate(self, account):
+        """Remove the saved state, e.g. after the server reported the session expired"""
+        try:
+            os.remove(self.path_for(account))
+            logger.info("Invalidated authenticated state")
+        except FileNotFoundError:
+            pass
+
+    @staticmethod
+    def is_session_expired(driver):
+        """A request that lands on the login page means the session is no longer valid"""
+        return "/login" in driver.current_url.lower()
@@ -0,0 +1,46 @@
+import logging
+
+logger = logging.getLogger(__name__)
+
+class BrowserContext:
+    """
+    An isolated browser context (like an incognito profile) in an existing
+    Chrome, created through the DevTools Protocol. Cookies, storage and cache
+    are separate from every other context, and creating or disposing one takes
+    milliseconds instead of starting a browser.
+
+    chromedriver uses DevTools target ids as window handles, so the driver can
+    switch straight to the context's first page.
+    """
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.context_id = None
+        self.target_id = None
+        self.home_handle = None
+
+    def __enter__(self):
+        return self.open()
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def open(self, url="about:blank"):
+        """Create the context with one page and switch the driver to it"""
+        self.home_handle = self.driver.current_window_handle
+        self.context_id = self.driver.execute_cdp_cmd("Target.createBrowserContext", {})["browserContextId"]
+        self.target_id = self.driver.execute_cdp_cmd(
+            "Target.createTarget", {"url": url, "browserContextId": self.context_id}
+        )["targetId"]
+        self.driver.switch_to.window(self.target_id)
+        logger.debug("Opened browser context %s", self.context_id)
+        return self
+
+    def close(self):
+        """Dispose the context with all its pages and switch back to the page that opened it"""
+        if self.context_id is None:
+            return
+        self.driver.switch_to.window(self.home_handle)
+        self.driver.execute_cdp_cmd("Target.disposeBrowserContext", {"browserContextId": self.context_id})
+        logger.debug("Disposed browser context %s", self.context_id)
+        self.context_id = self.target_id = None
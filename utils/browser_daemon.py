@@ -0,0 +1,528 @@
+"""
+Warm browser daemon
+-------------------
+Keeps chromedriver and a few Chrome sessions running between test runs, so a
+run attaches to an already started browser instead of launching one.
+
+Usage:
+    python -m utils.browser_daemon [--browsers 2] [--profile lean] [--idle-timeout 900] [--memory-limit-mb 2048] [--lease-ttl 60]
+
+Tests attach with ``pytest --browser-daemon=http://127.0.0.1:PORT`` (or
+``python run_tests.py --daemon``, which also starts the daemon when needed).
+"""
+
+import argparse
+import json
+import logging
+import os
+import threading
+import time
+import urllib.error
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.chromium.remote_connection import ChromiumRemoteConnection
+
+from utils import driver_factory
+
+logger = logging.getLogger(__name__)
+
+try:
+    import psutil
+except ImportError:  # psutil is optional; the memory cap is then not enforced
+    psutil = None
+
+STATE_FILE = ".browser_daemon.json"
+
+def _http_json(method, url, payload=None, timeout=60):
+    """Send a JSON request and return the decoded response body"""
+    data = json.dumps(payload).encode("utf-8") if payload is not None else None
+    request = urllib.request.Request(url, data=data, method=method, headers={"Content-Type": "application/json"})
+    try:
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            return json.loads(response.read() or b"{}")
+    except urllib.error.HTTPError as e:
+        body = e.read()
+        try:
+            return json.loads(body)
+        except ValueError:
+            raise RuntimeError(f"{method} {url} failed with HTTP {e.code}") from e
+
+class BrowserDaemon:
+    """
+    Owns one chromedriver and a set of warm sessions that test runs lease over
+    a small local JSON API. Shuts itself down after ``idle_timeout`` seconds
+    without leases, and recycles idle browsers while their memory use is
+    above ``memory_limit_mb`` (needs psutil). Leases expire unless the client
+    sends a heartbeat within ``lease_ttl`` seconds, or as soon as the client
+    process is gone (needs psutil), so a killed run does not keep its browsers.
+    """
+
+    def __init__(self, host="127.0.0.1", port=0, browsers=1, profile="lean", idle_timeout=900,
+                 memory_limit_mb=None, state_file=STATE_FILE, lease_ttl=60):
+        """
+        :param host: interface for the control API
+        :param port: port for the control API, 0 picks a free one
+        :param browsers: sessions started up front
+        :param profile: browser profile, see utils.driver_factory
+        :param idle_timeout: seconds without activity before the daemon exits
+        :param memory_limit_mb: memory cap for chromedriver and all browsers
+        :param state_file: where the control address is published for run_tests.py
+        :param lease_ttl: seconds a lease is kept without a heartbeat from its client
+        """
+        self.host = host
+        self.port = port
+        self.browsers = browsers
+        self.profile = profile
+        self.idle_timeout = idle_timeout
+        self.memory_limit_mb = memory_limit_mb
+        self.state_file = state_file
+        self.lease_ttl = lease_ttl
+        self.service = None
+        self.httpd = None
+        self._idle = []
+        # session id -> {"pid": client process, "expires": monotonic deadline}
+        self._leased = {}
+        self._lock = threading.Lock()
+        self._last_activity = time.monotonic()
+        self._stopped = threading.Event()
+
+    @property
+    def address(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        self.service = Service()
+        self.service.start()
+        for _ in range(self.browsers):
+            self._idle.append(self._create_session())
+
+        self.httpd = ThreadingHTTPServer((self.host, self.port), BrowserDaemonHandler)
+        self.httpd.browser_daemon = self
+        with open(self.state_file, "w", encoding="utf-8") as f:
+            json.dump({"pid": os.getpid(), "address": self.address}, f)
+        threading.Thread(target=self._watchdog, name="browser-daemon-watchdog", daemon=True).start()
+        logger.info("Browser daemon listening on %s with %d warm browser(s)", self.address, self.browsers)
+        return self
+
+    def serve_forever(self):
+        try:
+            self.httpd.serve_forever()
+        finally:
+            self._shutdown_browsers()
+
+    def stop(self):
+        """Stop serving; serve_forever() then quits the browsers"""
+        if not self._stopped.is_set():
+            self._stopped.set()
+            threading.Thread(target=self.httpd.shutdown, daemon=True).start()
+
+    # Sessions
+
+    def _create_session(self):
+        options = driver_factory.chrome_options(self.profile)
+        value = _http_json("POST", f"{self.service.service_url}/session",
+                           {"capabilities": {"alwaysMatch": options.to_capabilities()}})["value"]
+        session_id = value["sessionId"]
+        if not any(argument.startswith("--window-size=") for argument in options.arguments):
+            _http_json("POST", f"{self.service.service_url}/session/{session_id}/window/maximize", {})
+        logger.info("Started browser session %s", session_id)
+        return session_id
+
+    def _delete_session(self, session_id):
+        try:
+            _http_json("DELETE", f"{self.service.service_url}/session/{session_id}", timeout=10)
+        except Exception as e:
+            logger.warning("Failed to quit session %s: %s", session_id, e)
+
+    def _command(self, session_id, method, path, payload=None):
+        """Send a WebDriver command to a session and return its value; errors raise RuntimeError"""
+        value = _http_json(method, f"{self.service.service_url}/session/{session_id}{path}", payload,
+                           timeout=5).get("value")
+        if isinstance(value, dict) and "error" in value:
+            raise RuntimeError(f"{method} {path}: {value['error']}: {value.get('message', '')}")
+        return value
+
+    def _reset_session(self, session_id):
+        """
+        Leave a released session as a fresh browser would be: no dialog, one
+        blank tab, no cookies and no storage of the pages it had open
+        """
+        try:
+            self._command(session_id, "POST", "/alert/dismiss", {})
+        except RuntimeError:
+            pass  # no dialog open
+        old_handles = self._command(session_id, "GET", "/window/handles")
+        fresh_handle = self._command(session_id, "POST", "/window/new", {"type": "tab"})["handle"]
+        for handle in old_handles:
+            self._command(session_id, "POST", "/window", {"handle": handle})
+            # Storage of the tab's origin; the fresh tab already has no sessionStorage
+            self._command(session_id, "POST", "/execute/sync",
+                          {"script": "try { localStorage.clear(); } catch (e) {}", "args": []})
+            self._command(session_id, "DELETE", "/window")
+        self._command(session_id, "POST", "/window", {"handle": fresh_handle})
+        self._command(session_id, "POST", "/goog/cdp/execute", {"cmd": "Network.clearBrowserCookies", "params": {}})
+
+    def _is_alive(self, session_id):
+        try:
+            response = _http_json("GET", f"{self.service.service_url}/session/{session_id}/window", timeout=5)
+            return isinstance(response.get("value"), str)
+        except Exception:
+            return False
+
+    def lease(self, pid=None):
+        """
+        Hand out a warm session, starting one if none is idle
+        :param pid: process id of the client, so the lease ends when it exits
+        """
+        while True:
+            with self._lock:
+                self._last_activity = time.monotonic()
+                session_id = self._idle.pop() if self._idle else None
+            if session_id is None:
+                session_id = self._create_session()
+            elif not self._is_alive(session_id):
+                logger.warning("Dropping dead session %s", session_id)
+                self._delete_session(session_id)
+                continue
+            with self._lock:
+                self._leased[session_id] = {"pid": pid, "expires": time.monotonic() + self.lease_ttl}
+            return {"executor": self.service.service_url, "session_id": session_id, "profile": self.profile,
+                    "lease_ttl": self.lease_ttl}
+
+    def heartbeat(self, session_ids):
+        """
+        Extend the leases of a client's sessions
+        :return: the sessions that are no longer leased (reclaimed after expiring)
+        """
+        with self._lock:
+            self._last_activity = time.monotonic()
+            expires = time.monotonic() + self.lease_ttl
+            lost = []
+            for session_id in session_ids:
+                if session_id in self._leased:
+                    self._leased[session_id]["expires"] = expires
+                else:
+                    lost.append(session_id)
+        return lost
+
+    def release(self, session_id, broken=False):
+        """
+        Take a session back and reset it for the next run; broken sessions,
+        sessions that fail to reset and sessions over the memory cap are quit
+        """
+        with self._lock:
+            self._last_activity = time.monotonic()
+            if self._leased.pop(session_id, None) is None:
+                # Already reclaimed after its lease expired
+                logger.info("Ignoring release of session %s, it is no longer leased", session_id)
+                return
+        if broken or self._over_memory_limit():
+            self._delete_session(session_id)
+            return
+        try:
+            self._reset_session(session_id)
+        except Exception as e:
+            logger.warning("Failed to reset session %s, quitting it: %s", session_id, e)
+            self._delete_session(session_id)
+            return
+        with self._lock:
+            self._idle.append(session_id)
+
+    def status(self):
+        with self._lock:
+            return {
+                "pid": os.getpid(),
+                "profile": self.profile,
+                "idle": len(self._idle),
+                "leased": len(self._leased),
+                "memory_mb": self.memory_usage_mb(),
+                "memory_limit_mb": self.memory_limit_mb,
+                "idle_timeout": self.idle_timeout,
+            }
+
+    # Limits
+
+    def memory_usage_mb(self):
+        """Resident memory of chromedriver and every browser it started, or None without psutil"""
+        if psutil is None or self.service is None or self.service.process is None:
+            return None
+        try:
+            root = psutil.Process(self.service.process.pid)
+            processes = [root] + root.children(recursive=True)
+        except psutil.Error:
+            return None
+        total = 0
+        for process in processes:
+            try:
+                total += process.memory_info().rss
+            except psutil.Error:
+                pass
+        return total / (1024 * 1024)
+
+    def _expired_leases(self):
+        """Leases past their deadline or whose client process has exited"""
+        now = time.monotonic()
+        with self._lock:
+            leases = list(self._leased.items())
+        expired = []
+        for session_id, lease in leases:
+            if lease["expires"] < now:
+                expired.append(session_id)
+            elif psutil is not None and lease["pid"] and not psutil.pid_exists(lease["pid"]):
+                expired.append(session_id)
+        return expired
+
+    def _reclaim(self, session_id):
+        """
+        Take back a session whose client went away. Its state (open pages,
+        cookies, dialogs) is unknown, so it is replaced by a fresh browser
+        instead of being handed out again.
+        """
+        with self._lock:
+            if self._leased.pop(session_id, None) is None:
+                return
+        logger.warning("Lease of session %s expired, replacing the browser", session_id)
+        self._delete_session(session_id)
+        with self._lock:
+            warm = len(self._idle) + len(self._leased)
+        if warm < self.browsers and not self._over_memory_limit():
+            try:
+                new_session = self._create_session()
+            except Exception as e:
+                logger.warning("Failed to start a replacement browser: %s", e)
+                return
+            with self._lock:
+                self._idle.append(new_session)
+
+    def _over_memory_limit(self):
+        if not self.memory_limit_mb:
+            return False
+        usage = self.memory_usage_mb()
+        return usage is not None and usage > self.memory_limit_mb
+
+    def _watchdog(self):
+        if self.memory_limit_mb and psutil is None:
+            logger.warning("psutil is not installed, the memory limit is not enforced")
+        while not self._stopped.wait(5):
+            for session_id in self._expired_leases():
+                self._reclaim(session_id)
+            with self._lock:
+                idle_for = time.monotonic() - self._last_activity
+                busy = bool(self._leased)
+            if not busy and self.idle_timeout and idle_for > self.idle_timeout:
+                logger.info("Idle for %ds, shutting down", idle_for)
+                self.stop()
+                return
+            # Recycle idle browsers (oldest first) until memory is back under the cap
+            while self._over_memory_limit():
+                with self._lock:
+                    session_id = self._idle.pop(0) if self._idle else None
+                if session_id is None:
+                    break
+                logger.info("Over the memory limit, quitting idle session %s", session_id)
+                self._delete_session(session_id)
+
+    def _shutdown_browsers(self):
+        with self._lock:
+            sessions, self._idle = self._idle + list(self._leased), []
+            self._leased.clear()
+        for session_id in sessions:
+            self._delete_session(session_id)
+        if self.service is not None:
+            self.service.stop()
+        self.httpd.server_close()
+        try:
+            os.remove(self.state_file)
+        except OSError:
+            pass
+        logger.info("Browser daemon stopped")
+
+class BrowserDaemonHandler(BaseHTTPRequestHandler):
+    """JSON control API: POST /lease, POST /heartbeat, POST /release, GET /status, POST /shutdown"""
+
+    @property
+    def daemon(self):
+        return self.server.browser_daemon
+
+    def log_message(self, format, *args):
+        logger.debug("%s - %s", self.address_string(), format % args)
+
+    def send_json(self, status, payload):
+        data = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def read_json(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        return json.loads(self.rfile.read(length)) if length else {}
+
+    def do_GET(self):
+        if self.path == "/status":
+            return self.send_json(200, self.daemon.status())
+        self.send_json(404, {"error": "Not found"})
+
+    def do_POST(self):
+        try:
+            if self.path == "/lease":
+                return self.send_json(200, self.daemon.lease(pid=self.read_json().get("pid")))
+            if self.path == "/heartbeat":
+                lost = self.daemon.heartbeat(self.read_json().get("session_ids", []))
+                return self.send_json(200, {"lost": lost})
+            if self.path == "/release":
+                data = self.read_json()
+                self.daemon.release(data["session_id"], broken=data.get("broken", False))
+                return self.send_json(200, {})
+            if self.path == "/shutdown":
+                self.send_json(200, {})
+                return self.daemon.stop()
+            self.send_json(404, {"error": "Not found"})
+        except Exception as e:
+            logger.exception("Request %s failed", self.path)
+            self.send_json(500, {"error": str(e)})
+
+class DaemonClient:
+    """Test-side client: leases sessions from a BrowserDaemon and wraps them as WebDrivers"""
+
+    def __init__(self, address):
+        self.address = address.rstrip("/")
+        # Sessions leased by this client, kept alive by the heartbeat thread
+        self._sessions = set()
+        self._lock = threading.Lock()
+        self._heartbeat = None
+
+    @classmethod
+    def from_state_file(cls, state_file=STATE_FILE):
+        """Client for the daemon published in the state file, or None if it is not running"""
+        try:
+            with open(state_file, encoding="utf-8") as f:
+                client = cls(json.load(f)["address"])
+        except (OSError, ValueError, KeyError):
+            return None
+        return client if client.is_alive() else None
+
+    def is_alive(self):
+        try:
+            self.status()
+            return True
+        except Exception:
+            return False
+
+    def status(self):
+        return _http_json("GET", f"{self.address}/status", timeout=2)
+
+    def lease(self):
+        lease = _http_json("POST", f"{self.address}/lease", {"pid": os.getpid()})
+        with self._lock:
+            self._sessions.add(lease["session_id"])
+            if self._heartbeat is None:
+                self._heartbeat = threading.Thread(
+                    target=self._beat, args=(lease.get("lease_ttl", 60),), name="browser-daemon-heartbeat", daemon=True
+                )
+                self._heartbeat.start()
+        return lease
+
+    def release(self, session_id, broken=False):
+        with self._lock:
+            self._sessions.discard(session_id)
+        _http_json("POST", f"{self.address}/release", {"session_id": session_id, "broken": broken})
+
+    def _beat(self, lease_ttl):
+        # Stops with the test process, after which the daemon reclaims the sessions
+        while True:
+            time.sleep(lease_ttl / 3)
+            self.send_heartbeat()
+
+    def send_heartbeat(self):
+        """
+        Extend the leases of this client's sessions
+        :return: the sessions the daemon has reclaimed, which are no longer sent
+        """
+        with self._lock:
+            session_ids = list(self._sessions)
+        if not session_ids:
+            return []
+        try:
+            lost = _http_json("POST", f"{self.address}/heartbeat", {"session_ids": session_ids}, timeout=10)["lost"]
+        except Exception as e:
+            logger.warning("Browser daemon heartbeat failed: %s", e)
+            return []
+        with self._lock:
+            self._sessions.difference_update(lost)
+        for session_id in lost:
+            logger.warning("Browser daemon reclaimed session %s", session_id)
+        return lost
+
+    def shutdown(self):
+        _http_json("POST", f"{self.address}/shutdown", {})
+
+    def attach(self, block_images=False):
+        """
+        Lease a warm session and return a WebDriver for it; quit() hands it back
+        :param block_images: also block image requests
+        """
+        lease = self.lease()
+        driver = AttachedChrome(self, lease["executor"], lease["session_id"])
+        driver.blocked_urls = driver_factory.default_blocked_urls(lease["profile"])
+        driver.images_blocked = block_images
+        driver_factory.apply_network_profile(driver)
+        return driver
+
+class AttachedChrome(webdriver.Remote):
+    """Remote WebDriver bound to an existing daemon session instead of starting one"""
+
+    def __init__(self, daemon, executor, session_id):
+        self._daemon = daemon
+        self._attach_session_id = session_id
+        super().__init__(command_executor=ChromiumRemoteConnection(executor, "goog", "chrome"), options=Options())
+
+    def start_session(self, capabilities, *args, **kwargs):
+        self.session_id = self._attach_session_id
+        self.caps = {"browserName": "chrome"}
+
+    def execute_cdp_cmd(self, cmd, cmd_args):
+        return self.execute("executeCdpCommand", {"cmd": cmd, "params": cmd_args})["value"]
+
+    def quit(self):
+        """Hand the session back to the daemon instead of closing the browser"""
+        self._daemon.release(self.session_id)
+
+    def discard(self):
+        """Tell the daemon the session is broken"""
+        try:
+            self._daemon.release(self.session_id, broken=True)
+        except Exception as e:
+            logger.warning("Failed to release broken session: %s", e)
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='Keep warm browsers for test runs')
+    parser.add_argument('--host', default='127.0.0.1', help='Interface for the control API')
+    parser.add_argument('--port', type=int, default=0, help='Port for the control API (default: any free port)')
+    parser.add_argument('--browsers', type=int, default=1, help='Browsers to start up front')
+    parser.add_argument('--profile', default='lean', help='Browser profile (full or lean)')
+    parser.add_argument('--idle-timeout', type=int, default=900, help='Seconds without test runs before exiting')
+    parser.add_argument('--memory-limit-mb', type=int, default=None, help='Recycle idle browsers above this memory use')
+    parser.add_argument('--lease-ttl', type=int, default=60, help='Seconds a leased browser is kept without a heartbeat from its run')
+    return parser.parse_args()
+
+def main():
+    args = parse_args()
+    logging.basicConfig(level=logging.INFO)
+    daemon = BrowserDaemon(args.host, args.port, args.browsers, args.profile, args.idle_timeout, args.memory_limit_mb,
+                           lease_ttl=args.lease_ttl)
+    daemon.start()
+    print(f"Browser daemon running at {daemon.address} (Ctrl+C to stop)")
+    try:
+        daemon.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == "__main__":
+    main()
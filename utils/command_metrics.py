@@ -0,0 +1,215 @@
+import bisect
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+from selenium.webdriver.support.wait import WebDriverWait
+
+# Upper bounds (seconds) of the latency histogram buckets
+HISTOGRAM_BUCKETS = [0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, float("inf")]
+
+# Wire commands that locate elements and carry a locator in their params
+FIND_COMMANDS = {"findElement", "findElements", "findChildElement", "findChildElements"}
+
+# Wire commands that run page scripts; in-page waits locate elements through these
+SCRIPT_COMMANDS = {"w3cExecuteScript", "w3cExecuteScriptAsync", "executeScript", "executeAsyncScript"}
+
+_wait_state = threading.local()
+_locator_state = threading.local()
+_wait_tracking_installed = False
+
+def _bucket_label(bound):
+    return "+Inf" if bound == float("inf") else str(bound)
+
+@contextmanager
+def _inside_wait():
+    _wait_state.depth = getattr(_wait_state, "depth", 0) + 1
+    try:
+        yield
+    finally:
+        _wait_state.depth -= 1
+
+@contextmanager
+def locator_context(*locators):
+    """
+    Attribute script commands sent inside this block to the given locators,
+    so lookups done by in-page scripts show up under their locator
+    :param locators: (by, value) locators the script works on
+    """
+    previous = getattr(_locator_state, "locator", None)
+    _locator_state.locator = " | ".join(f"{by}={value}" for by, value in locators) or None
+    try:
+        yield
+    finally:
+        _locator_state.locator = previous
+
+def install_wait_tracking():
+    """Mark commands sent from WebDriverWait polling so they can be told apart"""
+    global _wait_tracking_installed
+    if _wait_tracking_installed:
+        return
+    original_until = WebDriverWait.until
+    original_until_not = WebDriverWait.until_not
+
+    def until(self, method, message=""):
+        with _inside_wait():
+            return original_until(self, method, message)
+
+    def until_not(self, method, message=""):
+        with _inside_wait():
+            return original_until_not(self, method, message)
+
+    WebDriverWait.until = until
+    WebDriverWait.until_not = until_not
+    _wait_tracking_installed = True
+
+class CommandStats:
+    """Running count, total time and latency histogram for one group of commands"""
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.wait_polls = 0
+        self.buckets = [0] * len(HISTOGRAM_BUCKETS)
+
+    def add(self, duration, from_wait):
+        self.count += 1
+        self.total += duration
+        if from_wait:
+            self.wait_polls += 1
+        self.buckets[bisect.bisect_left(HISTOGRAM_BUCKETS, duration)] += 1
+
+    def to_dict(self):
+        return {
+            "count": self.count,
+            "total_seconds": round(self.total, 6),
+            "wait_polls": self.wait_polls,
+            "histogram": {_bucket_label(b): n for b, n in zip(HISTOGRAM_BUCKETS, self.buckets)},
+        }
+
+class CommandRecorder:
+    """
+    Times every WebDriver wire command sent through an attached driver.
+    Commands are grouped per test; call ``start_test`` before a test and
+    ``summary`` to get its counts and latency histograms.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.start_test(None)
+
+    def attach(self, driver):
+        """Wrap driver.execute; attaching the same driver twice is a no-op"""
+        if getattr(driver, "_command_recorder", None) is self:
+            return driver
+        install_wait_tracking()
+        original_execute = driver.execute
+        recorder = self
+
+        def execute(driver_command, params=None):
+            start = time.perf_counter()
+            try:
+                return original_execute(driver_command, params)
+            finally:
+                recorder.record(driver_command, params, time.perf_counter() - start)
+
+        driver.execute = execute
+        driver._command_recorder = self
+        return driver
+
+    def start_test(self, nodeid):
+        """Start collecting commands for a new test"""
+        with self._lock:
+            self.nodeid = nodeid
+            self.total = CommandStats()
+            self.by_command = {}
+            self.by_locator = {}
+
+    def record(self, command, params, duration):
+        from_wait = getattr(_wait_state, "depth", 0) > 0
+        locator = None
+        if command in FIND_COMMANDS and params:
+            locator = f"{params.get('using')}={params.get('value')}"
+        elif command in SCRIPT_COMMANDS:
+            locator = getattr(_locator_state, "locator", None)
+        with self._lock:
+            self.total.add(duration, from_wait)
+            self.by_command.setdefault(command, CommandStats()).add(duration, from_wait)
+            if locator:
+                self.by_locator.setdefault(locator, CommandStats()).add(duration, from_wait)
+
+    def summary(self):
+        """JSON-serializable summary of the current test"""
+        with self._lock:
+            return {
+                "nodeid": self.nodeid,
+                "total": self.total.to_dict(),
+                "commands": {name: stats.to_dict() for name, stats in self.by_command.items()},
+                "locators": {name: stats.to_dict() for name, stats in self.by_locator.items()},
+            }
+
+def summary_table_html(summary):
+    """Render one test's command summary as an HTML table"""
+    rows = sorted(summary["commands"].items(), key=lambda item: item[1]["total_seconds"], reverse=True)
+    body = "".join(
+        f"<tr><td>{name}</td><td>{stats['count']}</td><td>{stats['wait_polls']}</td>"
+        f"<td>{stats['total_seconds'] * 1000:.1f}</td></tr>"
+        for name, stats in rows
+    )
+    total = summary["total"]
+    return (
+        "<table><tr><th>Command</th><th>Count</th><th>Wait polls</th><th>Total (ms)</th></tr>"
+        f"{body}<tr><td><b>Total</b></td><td>{total['count']}</td><td>{total['wait_polls']}</td>"
+        f"<td>{total['total_seconds'] * 1000:.1f}</td></tr></table>"
+    )
+
+def merge_totals(summaries, key):
+    """Combine per-test stats (key is "commands" or "locators") across tests"""
+    merged = {}
+    for summary in summaries:
+        for name, stats in summary[key].items():
+            target = merged.setdefault(name, {"count": 0, "total_seconds": 0.0, "wait_polls": 0,
+                                              "histogram": {_bucket_label(b): 0 for b in HISTOGRAM_BUCKETS}})
+            target["count"] += stats["count"]
+            target["total_seconds"] += stats["total_seconds"]
+            target["wait_polls"] += stats["wait_polls"]
+            for label, n in stats["histogram"].items():
+                target["histogram"][label] += n
+    return merged
+
+def write_json(summaries, path):
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({
+            "tests": summaries,
+            "commands": merge_totals(summaries, "commands"),
+            "locators": merge_totals(summaries, "locators"),
+        }, f, indent=2)
+
+def write_openmetrics(summaries, path):
+    """Write per-test, per-command latency histograms in OpenMetrics text format"""
+    lines = [
+        "# TYPE webdriver_command_duration_seconds histogram",
+        "# UNIT webdriver_command_duration_seconds seconds",
+        "# HELP webdriver_command_duration_seconds Duration of WebDriver wire commands",
+    ]
+    for summary in summaries:
+        test = summary["nodeid"].replace("\\", "\\\\").replace('"', '\\"')
+        for command, stats in summary["commands"].items():
+            labels = f'test="{test}",command="{command}"'
+            cumulative = 0
+            for label, n in stats["histogram"].items():
+                cumulative += n
+                lines.append(f'webdriver_command_duration_seconds_bucket{{{labels},le="{label}"}} {cumulative}')
+            lines.append(f"webdriver_command_duration_seconds_count{{{labels}}} {stats['count']}")
+            lines.append(f"webdriver_command_duration_seconds_sum{{{labels}}} {stats['total_seconds']}")
+    lines.append("# TYPE webdriver_wait_poll_commands counter")
+    for summary in summaries:
+        test = summary["nodeid"].replace("\\", "\\\\").replace('"', '\\"')
+        lines.append(f'webdriver_wait_poll_commands_total{{test="{test}"}} {summary["total"]["wait_polls"]}')
+    lines.append("# EOF")
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("\n".join(lines) + "\n")
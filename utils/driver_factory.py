@@ -0,0 +1,130 @@
+import logging
+
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+
+logger = logging.getLogger(__name__)
+
+PROFILES = ("full", "lean")
+
+# Third-party traffic the tests never interact with
+DEFAULT_BLOCKED_URLS = [
+    "*googletagmanager.com*",
+    "*google-analytics.com*",
+    "*googlesyndication.com*",
+    "*doubleclick.net*",
+    "*adservice.google.*",
+    "*googleadservices.com*",
+    "*amazon-adsystem.com*",
+    "*adnxs.com*",
+    "*snigelweb.com*",
+    "*hotjar.com*",
+    "*facebook.net*",
+    "*fonts.googleapis.com*",
+    "*fonts.gstatic.com*",
+    "*use.typekit.net*",
+]
+
+IMAGE_URL_PATTERNS = ["*.png*", "*.jpg*", "*.jpeg*", "*.gif*", "*.webp*", "*.svg*", "*.ico*"]
+
+LEAN_WINDOW_SIZE = (1366, 900)
+
+def chrome_options(profile="full", headless=None, window_size=None, capture_network=False):
+    """
+    Chrome options for a browser profile, shared by the sync and async drivers
+    :param profile: "full" (headed, maximized, like a real user) or "lean"
+        (headless, fixed viewport, third-party ad/analytics/font traffic blocked)
+    :param headless: override the profile's headless setting
+    :param window_size: (width, height); defaults to maximized for "full"
+    :param capture_network: enable the performance log used by utils.network_capture;
+        only worth its cost when a page object waits for captured responses
+    """
+    if profile not in PROFILES:
+        raise ValueError(f"Unknown browser profile {profile!r}, expected one of {PROFILES}")
+    lean = profile == "lean"
+    headless = lean if headless is None else headless
+    window_size = window_size or (LEAN_WINDOW_SIZE if lean else None)
+
+    # Configure Chrome options to reduce unwanted logs
+    options = Options()
+    options.add_experimental_option('excludeSwitches', ['enable-logging'])
+    options.add_argument('--log-level=3')  # Only show fatal errors
+    if headless:
+        options.add_argument('--headless=new')
+    if window_size:
+        options.add_argument(f'--window-size={window_size[0]},{window_size[1]}')
+    if capture_network:
+        options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
+        options.add_experimental_option('perfLoggingPrefs', {'enableNetwork': True, 'enablePage': False})
+    if lean:
+        for argument in ('--disable-extensions', '--disable-background-networking', '--disable-default-apps',
+                         '--disable-sync', '--no-first-run', '--mute-audio'):
+            options.add_argument(argument)
+    return options
+
+def default_blocked_urls(profile, blocked_urls=None):
+    """URL patterns to block for a profile unless given explicitly"""
+    if blocked_urls is not None:
+        return list(blocked_urls)
+    return list(DEFAULT_BLOCKED_URLS) if profile == "lean" else []
+
+def create_driver(profile="full", headless=None, window_size=None, blocked_urls=None, block_images=False,
+                  capture_network=False):
+    """
+    Create a Chrome driver
+    :param profile: see chrome_options()
+    :param headless: override the profile's headless setting
+    :param window_size: (width, height); defaults to maximized for "full"
+    :param blocked_urls: URL patterns to block (defaults to DEFAULT_BLOCKED_URLS for "lean")
+    :param block_images: also block image requests
+    :param capture_network: enable the performance log used by utils.network_capture
+    """
+    options = chrome_options(profile, headless, window_size, capture_network)
+    driver = webdriver.Chrome(options=options)
+    if not any(argument.startswith('--window-size=') for argument in options.arguments):
+        driver.maximize_window()
+
+    driver.blocked_urls = default_blocked_urls(profile, blocked_urls)
+    driver.images_blocked = block_images
+    driver.capture_network = capture_network
+    apply_network_profile(driver)
+    return driver
+
+def attach_driver(driver):
+    """
+    Start another WebDriver session on the Chrome that ``driver`` runs,
+    through its DevTools debugger address. The new session starts a
+    chromedriver but no browser, and quitting it leaves the browser running.
+    Use it with browser contexts (utils.browser_contexts) only: both sessions
+    see every tab of the browser.
+    """
+    options = Options()
+    options.debugger_address = driver.capabilities["goog:chromeOptions"]["debuggerAddress"]
+    if getattr(driver, "capture_network", False):
+        options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
+    attached = webdriver.Chrome(options=options)
+    attached.blocked_urls = list(getattr(driver, "blocked_urls", []))
+    attached.images_blocked = getattr(driver, "images_blocked", False)
+    attached.capture_network = getattr(driver, "capture_network", False)
+    return attached
+
+def apply_network_profile(driver):
+    """
+    (Re)apply URL blocking to the current tab. Blocking is per tab in the
+    DevTools Protocol, so this must run again after switching to a new tab.
+    """
+    patterns = list(getattr(driver, "blocked_urls", []))
+    if getattr(driver, "images_blocked", False):
+        patterns += IMAGE_URL_PATTERNS
+    if not patterns and not getattr(driver, "_network_blocking_enabled", False):
+        return
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": patterns})
+    driver._network_blocking_enabled = True
+
+def set_images_blocked(driver, blocked):
+    """Toggle image blocking for a driver, e.g. for tests that check the avatar"""
+    if getattr(driver, "images_blocked", False) == blocked:
+        return
+    driver.images_blocked = blocked
+    apply_network_profile(driver)
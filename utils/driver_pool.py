@@ -0,0 +1,202 @@
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+import threading
+import logging
+
+from utils.browser_contexts import BrowserContext
+
+logger = logging.getLogger(__name__)
+
+class DriverPool:
+    """
+    Hands out warm WebDriver instances and resets them between tests
+    instead of relaunching the browser. One pool lives per pytest session,
+    which under pytest-xdist means one pool per worker.
+    """
+
+    def __init__(self, create_driver, origins=(), reuse=True, health_check_timeout=5, on_reset=None,
+                 contexts=False, attach_driver=None):
+        """
+        :param create_driver: callable returning a new WebDriver
+        :param origins: origins whose storage is cleared on reset (e.g. "https://profile.w3schools.com")
+        :param reuse: set to False to quit drivers on release (old behavior)
+        :param health_check_timeout: seconds a driver has to answer before it is treated as hung
+        :param on_reset: callable run with the driver after it switched to a fresh tab
+        :param contexts: lease each driver inside a new browser context instead of resetting it
+        :param attach_driver: callable returning a new session on the browser of a running driver;
+            with contexts, concurrent leases then share one browser instead of starting another
+        """
+        self._create_driver = create_driver
+        self.on_reset = on_reset
+        self.origins = list(origins)
+        self.reuse = reuse
+        self.health_check_timeout = health_check_timeout
+        self.contexts = contexts
+        self._attach_driver = attach_driver
+        self._open_contexts = {}
+        self._idle = []
+        self._drivers = []
+        # Sessions attached to the browser of another driver: attached -> owner
+        self._attached = {}
+        # Default-context tab of every browser the pool started
+        self._home_handles = {}
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="driver-health")
+
+    def acquire(self):
+        """Return a healthy driver, replacing any that crashed or hung"""
+        while True:
+            with self._lock:
+                driver = self._idle.pop() if self._idle else None
+            if driver is None:
+                driver = self._attach() or self._create_driver()
+                with self._lock:
+                    self._drivers.append(driver)
+                logger.info("Started new driver (pool size: %d)", len(self._drivers))
+                return self._lease(driver)
+            if self.is_healthy(driver):
+                return self._lease(driver)
+            logger.warning("Discarding unhealthy driver")
+            self._discard(driver, kill=True)
+
+    def _attach(self):
+        """
+        With contexts, a new session on a browser the pool already runs, so
+        concurrent leases get their own context instead of their own Chrome
+        """
+        if not self.contexts or self._attach_driver is None:
+            return None
+        with self._lock:
+            owner = next((driver for driver in self._drivers if driver not in self._attached), None)
+        if owner is None:
+            return None
+        try:
+            driver = self._attach_driver(owner)
+            # Contexts are opened from and closed back to the browser's default tab
+            driver.switch_to.window(self._home_handles.setdefault(owner, owner.current_window_handle))
+        except Exception as e:
+            logger.warning("Could not attach to the running browser, starting another: %s", e)
+            return None
+        self._attached[driver] = owner
+        logger.info("Attached a new session to the running browser")
+        return driver
+
+    def _lease(self, driver):
+        """With contexts, move the driver into a fresh browser context before handing it out"""
+        if self.contexts:
+            if driver not in self._attached:
+                self._home_handles.setdefault(driver, driver.current_window_handle)
+            self._open_contexts[driver] = BrowserContext(driver).open()
+            if self.on_reset is not None:
+                self.on_reset(driver)
+        return driver
+
+    def release(self, driver):
+        """Reset driver state and return it to the pool"""
+        context = self._open_contexts.pop(driver, None)
+        if not self.reuse:
+            self._discard(driver)
+            return
+        # Disposing the context drops all its state, so no reset is needed
+        cleanup = context.close if context is not None else lambda: self.reset(driver)
+        try:
+            self._run_with_timeout(cleanup, self.health_check_timeout * 2)
+        except Exception as e:
+            logger.warning("Failed to reset driver, discarding it: %s", e)
+            self._discard(driver, kill=True)
+            return
+        with self._lock:
+            self._idle.append(driver)
+
+    def reset(self, driver):
+        """Clear cookies, local/session storage and extra windows"""
+        origins = set(self.origins)
+        current_origin = driver.execute_script("return window.location.origin")
+        if current_origin and current_origin.startswith("http"):
+            origins.add(current_origin)
+
+        # A fresh tab drops sessionStorage and history; close everything else
+        old_handles = driver.window_handles
+        driver.switch_to.new_window("tab")
+        fresh_handle = driver.current_window_handle
+        for handle in old_handles:
+            driver.switch_to.window(handle)
+            driver.close()
+        driver.switch_to.window(fresh_handle)
+
+        driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+        for origin in origins:
+            driver.execute_cdp_cmd("Storage.clearDataForOrigin", {"origin": origin, "storageTypes": "all"})
+        if self.on_reset is not None:
+            self.on_reset(driver)
+
+    def is_healthy(self, driver):
+        """Check that the browser answers a trivial command in time"""
+        try:
+            self._run_with_timeout(lambda: driver.window_handles, self.health_check_timeout)
+            return True
+        except Exception:
+            return False
+
+    def close(self):
+        """Quit every driver started by the pool"""
+        with self._lock:
+            drivers, self._drivers, self._idle = self._drivers, [], []
+        # Attached sessions first; quitting them leaves their owner's browser running
+        for driver in sorted(drivers, key=lambda driver: driver not in self._attached):
+            self._quit(driver)
+        self._attached.clear()
+        self._home_handles.clear()
+        self._executor.shutdown(wait=False)
+
+    def _run_with_timeout(self, func, timeout):
+        future = self._executor.submit(func)
+        try:
+            return future.result(timeout=timeout)
+        except FutureTimeoutError:
+            # The worker thread is stuck on the hung driver; use a new one
+            self._executor.shutdown(wait=False)
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="driver-health")
+            raise
+
+    def _discard(self, driver, kill=False):
+        with self._lock:
+            if driver in self._drivers:
+                self._drivers.remove(driver)
+            # Sessions attached to a discarded browser go with it
+            attached = [session for session, owner in self._attached.items() if owner is driver]
+            for session in attached:
+                if session in self._drivers:
+                    self._drivers.remove(session)
+                if session in self._idle:
+                    self._idle.remove(session)
+        for session in attached:
+            self._attached.pop(session, None)
+            self._quit(session)
+        self._attached.pop(driver, None)
+        self._home_handles.pop(driver, None)
+        if kill:
+            self._kill(driver)
+        else:
+            self._quit(driver)
+
+    def _quit(self, driver):
+        try:
+            driver.quit()
+        except Exception as e:
+            logger.warning("Failed to quit driver cleanly: %s", e)
+            self._kill(driver)
+
+    def _kill(self, driver):
+        # Sessions leased from the browser daemon are handed back as broken
+        discard = getattr(driver, "discard", None)
+        if discard is not None:
+            discard()
+            return
+        # quit() may hang on a crashed browser, so stop chromedriver directly
+        service = getattr(driver, "service", None)
+        process = getattr(service, "process", None)
+        if process is not None:
+            try:
+                process.kill()
+            except Exception as e:
+                logger.warning("Failed to kill chromedriver: %s", e)
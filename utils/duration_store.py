@@ -0,0 +1,86 @@
+import heapq
+import re
+import sqlite3
+import statistics
+import time
+
+DEFAULT_DB_PATH = ".test_durations.sqlite"
+DEFAULT_DURATION = 30.0  # seconds, used before anything has been recorded
+HISTORY = 5  # recent runs averaged per test
+
+# Suffix --dist loadgroup appends to the nodeids of tests with an LPT xdist_group marker
+XDIST_GROUP_SUFFIX = re.compile(r"@lpt\d+$")
+
+def strip_xdist_group(nodeid):
+    """The nodeid without the "@lptN" suffix, so durations are stored under the collected nodeid"""
+    return XDIST_GROUP_SUFFIX.sub("", nodeid)
+
+class DurationStore:
+    """Small SQLite history of test durations and outcomes"""
+
+    def __init__(self, path=DEFAULT_DB_PATH):
+        self.path = path
+        with self._connect() as db:
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS test_runs ("
+                " nodeid TEXT NOT NULL,"
+                " duration REAL NOT NULL,"
+                " outcome TEXT NOT NULL,"
+                " finished_at REAL NOT NULL)"
+            )
+            db.execute("CREATE INDEX IF NOT EXISTS idx_test_runs_nodeid ON test_runs (nodeid, finished_at)")
+
+    def _connect(self):
+        return sqlite3.connect(self.path, timeout=30)
+
+    def record(self, results):
+        """
+        Store the results of a run
+        :param results: iterable of (nodeid, duration, outcome)
+        """
+        now = time.time()
+        with self._connect() as db:
+            db.executemany(
+                "INSERT INTO test_runs (nodeid, duration, outcome, finished_at) VALUES (?, ?, ?, ?)",
+                [(nodeid, duration, outcome, now) for nodeid, duration, outcome in results]
+            )
+            # Keep only the recent history of each test
+            db.execute(
+                "DELETE FROM test_runs WHERE rowid IN ("
+                " SELECT rowid FROM (SELECT rowid, ROW_NUMBER() OVER"
+                " (PARTITION BY nodeid ORDER BY finished_at DESC) AS n FROM test_runs)"
+                " WHERE n > ?)", (HISTORY * 4,)
+            )
+
+    def estimates(self, nodeids):
+        """
+        Expected duration of each test: the mean of its recent runs, or the
+        median of all known tests for tests that have never run
+        """
+        with self._connect() as db:
+            rows = db.execute(
+                "SELECT nodeid, duration FROM test_runs ORDER BY finished_at DESC"
+            ).fetchall()
+        history = {}
+        for nodeid, duration in rows:
+            recent = history.setdefault(nodeid, [])
+            if len(recent) < HISTORY:
+                recent.append(duration)
+        known = {nodeid: statistics.mean(values) for nodeid, values in history.items()}
+        default = statistics.median(known.values()) if known else DEFAULT_DURATION
+        return {nodeid: known.get(nodeid, default) for nodeid in nodeids}
+
+def lpt_schedule(durations, workers):
+    """
+    Longest-processing-time-first bin packing
+    :param durations: dict of nodeid (or any schedulable unit) -> expected seconds
+    :param workers: number of bins
+    :return: list of bins, each a list of nodeids ordered longest first
+    """
+    bins = [[] for _ in range(workers)]
+    heap = [(0.0, index) for index in range(workers)]
+    for nodeid in sorted(durations, key=lambda n: (-durations[n], n)):
+        load, index = heapq.heappop(heap)
+        bins[index].append(nodeid)
+        heapq.heappush(heap, (load + durations[nodeid], index))
+    return bins
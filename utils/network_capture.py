@@ -0,0 +1,122 @@
+import json
+import logging
+import re
+import time
+
+from selenium.common.exceptions import WebDriverException
+
+logger = logging.getLogger(__name__)
+
+class CapturedResponse:
+    """A network response seen in Chrome's performance log"""
+
+    def __init__(self, request_id, url, method, status, mime_type):
+        self.request_id = request_id
+        self.url = url
+        self.method = method
+        self.status = status
+        self.mime_type = mime_type
+        self.finished = False
+        self.failed = False
+
+    @property
+    def ok(self):
+        return 200 <= self.status < 300
+
+    def __repr__(self):
+        return f"<CapturedResponse {self.method} {self.url} {self.status}>"
+
+class NetworkCapture:
+    """
+    Reads request/response events from Chrome's performance log.
+
+    Needs the goog:loggingPrefs performance capability (see
+    utils.driver_factory). The log is drained by every read, so there is one
+    capture per driver; use NetworkCapture.for_driver(driver).
+    """
+
+    def __init__(self, driver):
+        self.driver = driver
+        self._methods = {}
+        self._responses = {}
+        self._available = None
+
+    @classmethod
+    def for_driver(cls, driver):
+        capture = getattr(driver, "_network_capture", None)
+        if capture is None:
+            capture = cls(driver)
+            driver._network_capture = capture
+        return capture
+
+    @property
+    def available(self):
+        """True if the driver was started with performance logging"""
+        if self._available is None:
+            try:
+                self.driver.get_log("performance")
+                self._available = True
+            except WebDriverException:
+                self._available = False
+        return self._available
+
+    def clear(self):
+        """Forget everything seen so far; call before the action whose requests you want to wait for"""
+        if self.available:
+            self.driver.get_log("performance")
+        self._methods.clear()
+        self._responses.clear()
+
+    def poll(self):
+        """Read new performance log entries, returns the responses seen so far"""
+        for entry in self.driver.get_log("performance"):
+            message = json.loads(entry["message"])["message"]
+            method = message.get("method")
+            params = message.get("params", {})
+            request_id = params.get("requestId")
+            if method == "Network.requestWillBeSent":
+                self._methods[request_id] = params["request"]["method"]
+            elif method == "Network.responseReceived":
+                response = params["response"]
+                self._responses[request_id] = CapturedResponse(
+                    request_id, response["url"], self._methods.get(request_id, "GET"),
+                    response["status"], response.get("mimeType", "")
+                )
+            elif method == "Network.loadingFinished" and request_id in self._responses:
+                self._responses[request_id].finished = True
+            elif method == "Network.loadingFailed" and request_id in self._responses:
+                self._responses[request_id].failed = True
+        return list(self._responses.values())
+
+    def wait_for_response(self, url_pattern, methods=None, timeout=10, poll_frequency=0.1):
+        """
+        Wait until a matching response has been fully received
+        :param url_pattern: regular expression searched in the request URL
+        :param methods: HTTP methods to match (e.g. ("PUT", "POST")), any by default
+        :param timeout: seconds to wait
+        :param poll_frequency: seconds between performance log reads
+        :return: the CapturedResponse, or None if none arrived in time
+        """
+        pattern = re.compile(url_pattern)
+        end_time = time.monotonic() + timeout
+        while True:
+            for response in self.poll():
+                if ((response.finished or response.failed)
+                        and pattern.search(response.url)
+                        and (methods is None or response.method in methods)):
+                    return response
+            if time.monotonic() > end_time:
+                logger.debug("No response matching %s within %ss", url_pattern, timeout)
+                return None
+            time.sleep(poll_frequency)
+
+    def response_body(self, response):
+        """Fetch the body of a captured response, parsed as JSON when it is JSON"""
+        result = self.driver.execute_cdp_cmd("Network.getResponseBody", {"requestId": response.request_id})
+        body = result.get("body", "")
+        if "json" in response.mime_type:
+            try:
+                return json.loads(body)
+            except ValueError:
+                pass
+        return body
@@ -0,0 +1,72 @@
+import logging
+
+import requests
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+# Profile fields that tests change and that are restored afterwards
+PROFILE_FIELDS = ("first_name", "last_name", "url")
+
+class ProfileApi:
+    """
+    Reads and writes the profile over HTTP with the browser's login session,
+    so tests can seed preconditions and undo their changes without the UI.
+    Connections are pooled in one requests.Session.
+    """
+
+    def __init__(self, url, timeout=10, pool_size=4):
+        """
+        :param url: the profile API endpoint (see SiteUrls.profile_api)
+        :param timeout: seconds per HTTP request
+        :param pool_size: kept-alive connections per host
+        """
+        self.url = url
+        self.timeout = timeout
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers["Accept"] = "application/json"
+
+    def use_driver_session(self, driver):
+        """Copy the cookies of all domains from a logged-in driver"""
+        cookies = driver.execute_cdp_cmd("Network.getAllCookies", {})["cookies"]
+        self.session.cookies.clear()
+        for cookie in cookies:
+            self.session.cookies.set(
+                cookie["name"], cookie["value"],
+                domain=cookie.get("domain", ""), path=cookie.get("path", "/"),
+                secure=cookie.get("secure", False)
+            )
+        self.session.headers["User-Agent"] = driver.execute_script("return navigator.userAgent")
+        logger.info("Copied %d cookies from the browser", len(cookies))
+        return self
+
+    def snapshot(self):
+        """Current values of the restorable profile fields"""
+        response = self.session.get(self.url, timeout=self.timeout)
+        response.raise_for_status()
+        profile = response.json()
+        return {field: profile[field] for field in PROFILE_FIELDS if field in profile}
+
+    def seed(self, **fields):
+        """
+        Set profile fields in one request
+        :return: the saved profile
+        """
+        unknown = set(fields) - set(PROFILE_FIELDS)
+        if unknown:
+            raise ValueError(f"Unknown profile fields: {', '.join(sorted(unknown))}")
+        response = self.session.put(self.url, json=fields, timeout=self.timeout)
+        response.raise_for_status()
+        return response.json()
+
+    def restore(self, snapshot):
+        """Put back the fields captured by snapshot()"""
+        if snapshot:
+            self.seed(**snapshot)
+            logger.info("Restored profile fields: %s", ", ".join(sorted(snapshot)))
+
+    def close(self):
+        self.session.close()
@@ -0,0 +1,93 @@
+import base64
+import io
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+logger = logging.getLogger(__name__)
+
+try:
+    from PIL import Image
+except ImportError:  # Pillow is optional; screenshots are then written as captured
+    Image = None
+
+class ScreenshotWriter:
+    """
+    Writes failure screenshots on a background thread pool so the test's
+    critical path only pays for the capture itself. At most ``max_pending``
+    screenshots are held in memory; further submissions wait for a slot.
+    """
+
+    def __init__(self, directory="reports/screenshots", max_pending=8, max_width=None, workers=2):
+        """
+        :param directory: where PNG files are written
+        :param max_pending: screenshots queued or being written at the same time
+        :param max_width: downscale wider screenshots with Pillow (None keeps the original size)
+        :param workers: background writer threads
+        """
+        self.directory = directory
+        self.max_width = max_width
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="screenshot-writer")
+        os.makedirs(directory, exist_ok=True)
+
+    def submit(self, screenshot, name, thumbnail_width=None):
+        """
+        Queue a screenshot to be written as ``<name>.png``
+        :param screenshot: base64 string as returned by the driver, or PNG bytes
+        :param thumbnail_width: also write ``<name>_thumb.png`` this wide (needs Pillow)
+        :return: path the screenshot will be written to
+        """
+        path = os.path.join(self.directory, f"{name}.png")
+        self._slots.acquire()
+        try:
+            future = self._executor.submit(self._write, screenshot, path, thumbnail_width)
+        except Exception:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+        return path
+
+    @staticmethod
+    def thumbnail_path(path):
+        """
+        Where submit() writes the thumbnail for ``path``; the full
+        screenshot itself without Pillow, for the report to scale down
+        """
+        if Image is None:
+            return path
+        return f"{os.path.splitext(path)[0]}_thumb.png"
+
+    def _write(self, screenshot, path, thumbnail_width=None):
+        try:
+            png = base64.b64decode(screenshot) if isinstance(screenshot, str) else screenshot
+            if thumbnail_width and Image is not None:
+                self._save(self._resize(png, thumbnail_width, optimize=False), self.thumbnail_path(path))
+            if self.max_width and Image is not None:
+                png = self._resize(png, self.max_width)
+            self._save(png, path)
+        except Exception as e:
+            logger.error("Failed to write screenshot %s: %s", path, e)
+
+    @staticmethod
+    def _save(png, path):
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(png)
+        os.replace(tmp_path, path)
+
+    @staticmethod
+    def _resize(png, width, optimize=True):
+        """Downscale a PNG to at most ``width`` pixels wide"""
+        image = Image.open(io.BytesIO(png))
+        if image.width > width:
+            height = round(image.height * width / image.width)
+            image = image.resize((width, height), Image.LANCZOS)
+        output = io.BytesIO()
+        image.save(output, format="PNG", optimize=optimize)
+        return output.getvalue()
+
+    def drain(self):
+        """Wait for all queued screenshots to be written"""
+        self._executor.shutdown(wait=True)
@@ -0,0 +1,80 @@
+import logging
+import time
+from collections import deque
+from contextvars import ContextVar
+
+DEFAULT_CAPACITY = 1000  # records kept per test
+
+# The buffer of the current context: the test in synchronous runs, or the
+# asyncio task driving one session after it has called clear()
+_capacity = DEFAULT_CAPACITY
+_records = ContextVar("step_records", default=None)
+_default_records = deque(maxlen=DEFAULT_CAPACITY)
+_passthrough = False
+
+def _buffer():
+    records = _records.get()
+    return _default_records if records is None else records
+
+class StepLogger:
+    """
+    Drop-in replacement for a logging.Logger used by the page objects.
+    Records are stored unformatted in a ring buffer and only rendered when
+    ``dump`` is called (on failure), so passing tests pay almost nothing.
+    With passthrough enabled records also go to the standard logger.
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self._logger = logging.getLogger(name)
+
+    def _log(self, level, msg, args):
+        _buffer().append((time.time(), level, self.name, msg, args))
+        if _passthrough:
+            self._logger.log(level, msg, *args, stacklevel=3)
+
+    def debug(self, msg, *args):
+        self._log(logging.DEBUG, msg, args)
+
+    def info(self, msg, *args):
+        self._log(logging.INFO, msg, args)
+
+    def warning(self, msg, *args):
+        self._log(logging.WARNING, msg, args)
+
+    def error(self, msg, *args):
+        self._log(logging.ERROR, msg, args)
+
+def get_step_logger(name):
+    return StepLogger(name)
+
+def set_passthrough(enabled):
+    """Also send every record to the standard logging module (verbose mode)"""
+    global _passthrough
+    _passthrough = enabled
+
+def set_capacity(capacity):
+    global _capacity, _default_records
+    _capacity = capacity
+    _default_records = deque(_default_records, maxlen=capacity)
+    _records.set(deque(_buffer(), maxlen=capacity))
+
+def clear():
+    """
+    Start a new buffer for the current context, e.g. at the beginning of a
+    test. An asyncio task gets a buffer of its own this way, so concurrent
+    sessions do not mix their steps.
+    """
+    _records.set(deque(maxlen=_capacity))
+
+def dump():
+    """Format the current context's buffered records, oldest first"""
+    lines = []
+    for created, level, name, msg, args in _buffer():
+        try:
+            message = msg % args if args else msg
+        except (TypeError, ValueError):
+            message = f"{msg} {args}"
+        timestamp = time.strftime("%H:%M:%S", time.localtime(created))
+        lines.append(f"{timestamp}.{int(created % 1 * 1000):03d} [{logging.getLevelName(level):>8}] {message} ({name})")
+    return "\n".join(lines)
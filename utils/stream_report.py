@@ -0,0 +1,176 @@
+import base64
+import hashlib
+import html
+import io
+import os
+import time
+from datetime import datetime
+
+try:
+    from PIL import Image
+except ImportError:  # Pillow is optional; full images are shown scaled down instead
+    Image = None
+
+THUMBNAIL_WIDTH = 320
+
+HEADER = """<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<title>{title}</title>
+<style>
+    body {{ font-family: Helvetica, Arial, sans-serif; font-size: 13px; margin: 20px; }}
+    table {{ border-collapse: collapse; width: 100%; }}
+    th, td {{ border: 1px solid #e6e6e6; padding: 6px; text-align: left; vertical-align: top; }}
+    th {{ background: #f5f5f5; }}
+    .passed {{ color: #2e7d32; }} .failed, .error {{ color: #c62828; }}
+    .skipped, .xfailed, .xpassed, .rerun {{ color: #ef6c00; }}
+    img.thumb {{ width: {thumb}px; border: 1px solid #ccc; }}
+    pre {{ white-space: pre-wrap; max-height: 400px; overflow: auto; background: #fafafa; padding: 6px; }}
+</style>
+</head>
+<body>
+<h1>{title}</h1>
+<p>Started: {started}</p>
+<table>
+<tr><th>Result</th><th>Time</th><th>Test</th><th>Description</th><th>Duration</th><th>Screenshot</th><th>Details</th></tr>
+"""
+
+FOOTER = """</table>
+<h2>Summary</h2>
+<p>{summary}</p>
+<p>Finished: {finished} ({elapsed:.1f}s)</p>
+</body>
+</html>
+"""
+
+class StreamingReport:
+    """
+    pytest plugin that writes an HTML report row by row as tests finish.
+    Screenshots are stored once under ``<report dir>/report_assets/<sha256>.png``
+    with lazily loaded thumbnails, so the report stays small and memory use
+    does not grow with the number of failures.
+    """
+
+    def __init__(self, path, title="Test Report"):
+        self.path = path
+        self.title = title
+        self.asset_dir = os.path.join(os.path.dirname(os.path.abspath(path)), "report_assets")
+        self.counts = {}
+        self._pending = {}
+        self._file = None
+        self._started = None
+
+    def pytest_sessionstart(self, session):
+        os.makedirs(self.asset_dir, exist_ok=True)
+        self._started = time.time()
+        self._file = open(self.path, "w", encoding="utf-8")
+        self._file.write(HEADER.format(
+            title=html.escape(self.title),
+            started=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            thumb=THUMBNAIL_WIDTH
+        ))
+        self._file.flush()
+
+    def pytest_runtest_logreport(self, report):
+        state = self._pending.setdefault(report.nodeid, {"outcome": "passed", "duration": 0.0, "reports": []})
+        state["duration"] += report.duration
+        state["reports"].append(report)
+
+        outcome = self._outcome(report)
+        if outcome == "rerun":
+            # The test runs again; report this attempt as its own row
+            state["outcome"] = "rerun"
+            self._write_row(report.nodeid, self._pending.pop(report.nodeid))
+            return
+        if outcome != "passed" and state["outcome"] == "passed":
+            state["outcome"] = outcome
+        if report.when == "teardown":
+            self._write_row(report.nodeid, self._pending.pop(report.nodeid))
+
+    def pytest_sessionfinish(self, session):
+        if self._file is None:
+            return
+        for nodeid, state in list(self._pending.items()):
+            self._write_row(nodeid, state)
+        summary = ", ".join(f"{count} {outcome}" for outcome, count in sorted(self.counts.items()))
+        self._file.write(FOOTER.format(
+            summary=html.escape(summary or "no tests ran"),
+            finished=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            elapsed=time.time() - self._started
+        ))
+        self._file.close()
+        self._file = None
+
+    def pytest_terminal_summary(self, terminalreporter):
+        terminalreporter.write_sep("-", f"streaming HTML report: {os.path.abspath(self.path)}")
+
+    @staticmethod
+    def _outcome(report):
+        if report.outcome == "rerun":
+            return "rerun"
+        if hasattr(report, "wasxfail"):
+            return "xpassed" if report.passed else "xfailed"
+        if report.failed:
+            return "failed" if report.when == "call" else "error"
+        return report.outcome
+
+    def _write_row(self, nodeid, state):
+        outcome = state["outcome"]
+        self.counts[outcome] = self.counts.get(outcome, 0) + 1
+        description = ""
+        screenshots = []
+        details = []
+        for report in state["reports"]:
+            description = getattr(report, "description", description) or description
+            for extra in getattr(report, "extras", []):
+                if extra.get("format_type") == "image":
+                    screenshots.append(self._store_image(extra.get("content", "")))
+                elif extra.get("format_type") == "text":
+                    details.append((extra.get("name", "Text"), extra.get("content", "")))
+            if report.failed and report.longrepr is not None:
+                details.insert(0, (f"Failure ({report.when})", str(report.longrepr)))
+            # The row is on disk now; drop large payloads held by other plugins
+            if getattr(report, "extras", None):
+                report.extras = [e for e in report.extras if e.get("format_type") != "image"]
+
+        screenshot_cell = "".join(
+            f'<a href="{full}"><img class="thumb" loading="lazy" src="{thumb}"></a>'
+            for full, thumb in screenshots if full
+        ) or "No screenshot"
+        details_cell = "".join(
+            f"<details><summary>{html.escape(name)}</summary><pre>{html.escape(content)}</pre></details>"
+            for name, content in details
+        )
+        self._file.write(
+            f'<tr><td class="{outcome}">{outcome.capitalize()}</td>'
+            f"<td>{datetime.now().strftime('%H:%M:%S')}</td>"
+            f"<td>{html.escape(nodeid)}</td><td>{html.escape(description)}</td>"
+            f"<td>{state['duration']:.2f}s</td><td>{screenshot_cell}</td><td>{details_cell}</td></tr>\n"
+        )
+        self._file.flush()
+
+    def _store_image(self, content):
+        """
+        Write a base64 PNG once under its content hash
+        :return: (relative path of the image, relative path of its thumbnail)
+        """
+        try:
+            png = base64.b64decode(content)
+        except (ValueError, TypeError):
+            return None, None
+        digest = hashlib.sha256(png).hexdigest()[:32]
+        name = f"{digest}.png"
+        path = os.path.join(self.asset_dir, name)
+        if not os.path.exists(path):
+            with open(path, "wb") as f:
+                f.write(png)
+        thumb_name = name
+        if Image is not None:
+            thumb_name = f"{digest}_thumb.png"
+            thumb_path = os.path.join(self.asset_dir, thumb_name)
+            if not os.path.exists(thumb_path):
+                image = Image.open(io.BytesIO(png))
+                image.thumbnail((THUMBNAIL_WIDTH, THUMBNAIL_WIDTH * 4))
+                image.save(thumb_path, format="PNG", optimize=True)
+        return f"report_assets/{name}", f"report_assets/{thumb_name}"
@@ -39,6 +39,7 @@ def main():
     
     # Utilities
     all_packages_installed &= check_package("requests", "Requests")
+    all_packages_installed &= check_package("aiohttp", "aiohttp")
     
     # Check directories exist
     print("\n=== Checking Project Structure ===\n")